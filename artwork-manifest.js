@@ -0,0 +1,96 @@
+import fs from 'fs';
+import path from 'path';
+import crypto from 'crypto';
+
+const MANIFEST_FILENAME = '.manifest.json';
+const MANIFEST_VERSION = 1;
+
+/**
+ * Load the artwork manifest for a PO download folder
+ * Returns an empty manifest if none exists yet or the file is unreadable
+ * @param {string} downloadDir - Folder holding the PO's artwork (downloads/<po>)
+ * @param {string} poNumber - Purchase Order number
+ */
+export function loadManifest(downloadDir, poNumber) {
+  const manifestPath = path.join(downloadDir, MANIFEST_FILENAME);
+
+  if (fs.existsSync(manifestPath)) {
+    try {
+      const manifest = JSON.parse(fs.readFileSync(manifestPath, 'utf-8'));
+      if (manifest.version === MANIFEST_VERSION && manifest.items) {
+        return manifest;
+      }
+    } catch (error) {
+      console.log(`⚠ Could not read artwork manifest, starting fresh: ${error.message}`);
+    }
+  }
+
+  return {
+    version: MANIFEST_VERSION,
+    poNumber: poNumber,
+    updatedAt: null,
+    items: {}
+  };
+}
+
+/**
+ * Write the artwork manifest back to the PO download folder
+ * @param {string} downloadDir - Folder holding the PO's artwork (downloads/<po>)
+ * @param {object} manifest - Manifest returned by loadManifest
+ */
+export function saveManifest(downloadDir, manifest) {
+  if (!fs.existsSync(downloadDir)) {
+    fs.mkdirSync(downloadDir, { recursive: true });
+  }
+
+  manifest.updatedAt = new Date().toISOString();
+
+  // Write to a temp file first so a crash never leaves a half-written manifest
+  const manifestPath = path.join(downloadDir, MANIFEST_FILENAME);
+  const tempPath = `${manifestPath}.tmp`;
+  fs.writeFileSync(tempPath, JSON.stringify(manifest, null, 2));
+  fs.renameSync(tempPath, manifestPath);
+}
+
+/**
+ * Check that the file recorded in a manifest entry is still on disk unchanged in size
+ * @param {string} downloadDir - Folder holding the PO's artwork
+ * @param {object} entry - Manifest entry for one item
+ */
+export function isLocalCopyIntact(downloadDir, entry) {
+  if (!entry || !entry.filename) {
+    return false;
+  }
+
+  try {
+    const stats = fs.statSync(path.join(downloadDir, entry.filename));
+    return stats.isFile() && stats.size === entry.size;
+  } catch (error) {
+    return false;
+  }
+}
+
+/**
+ * Build conditional request headers from the validators stored in a manifest entry
+ * @param {object} entry - Manifest entry for one item
+ */
+export function getConditionalHeaders(entry) {
+  const headers = {};
+
+  if (entry && entry.etag) {
+    headers['If-None-Match'] = entry.etag;
+  }
+  if (entry && entry.lastModified) {
+    headers['If-Modified-Since'] = entry.lastModified;
+  }
+
+  return headers;
+}
+
+/**
+ * SHA-256 hash of a downloaded file body
+ * @param {Buffer} buffer - File contents
+ */
+export function hashBuffer(buffer) {
+  return crypto.createHash('sha256').update(buffer).digest('hex');
+}
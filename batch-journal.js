@@ -0,0 +1,121 @@
+import fs from 'fs';
+import path from 'path';
+
+const JOURNAL_FILENAME = 'batch-journal.jsonl';
+
+/**
+ * Path of the batch journal inside the download folder
+ * @param {string} downloadDir - Root download folder (config.download_directory)
+ */
+export function getJournalPath(downloadDir) {
+  return path.join(downloadDir, JOURNAL_FILENAME);
+}
+
+/**
+ * Read the per-PO results recorded by an earlier batch run
+ * A line cut short by a crash is ignored; later entries for a PO replace earlier ones
+ * @param {string} journalPath - Journal file path
+ * @returns {Map<string, object>} Result per PO number, in the order they finished
+ */
+export function readJournal(journalPath) {
+  const results = new Map();
+
+  if (!fs.existsSync(journalPath)) {
+    return results;
+  }
+
+  const lines = fs.readFileSync(journalPath, 'utf-8').split('\n');
+  for (const line of lines) {
+    if (!line.trim()) continue;
+    try {
+      const entry = JSON.parse(line);
+      if (entry.poNumber && entry.result) {
+        results.delete(entry.poNumber);
+        results.set(entry.poNumber, entry.result);
+      }
+    } catch (error) {
+      console.log('⚠ Ignoring incomplete batch journal line');
+    }
+  }
+
+  return results;
+}
+
+/**
+ * Open the journal for appending
+ * @param {string} journalPath - Journal file path
+ * @param {boolean} resume - Keep the existing entries (otherwise the journal starts empty)
+ */
+export function openJournal(journalPath, resume) {
+  fs.mkdirSync(path.dirname(journalPath), { recursive: true });
+  if (!resume) {
+    fs.writeFileSync(journalPath, '');
+  } else if (fs.existsSync(journalPath)) {
+    // Terminate a line left incomplete by a crash so new entries start on their own line
+    const content = fs.readFileSync(journalPath, 'utf-8');
+    if (content.length > 0 && !content.endsWith('\n')) {
+      fs.appendFileSync(journalPath, '\n');
+    }
+  }
+
+  return {
+    path: journalPath,
+    /**
+     * Append one finished PO (written synchronously so a crash loses at most this line)
+     * @param {object} result - Result returned by downloadPOArtwork
+     */
+    append(result) {
+      const entry = { poNumber: result.poNumber, finishedAt: new Date().toISOString(), result };
+      fs.appendFileSync(journalPath, `${JSON.stringify(entry)}\n`);
+    }
+  };
+}
+
+/**
+ * A journaled PO is done unless it failed outright; failed POs are retried on resume
+ * @param {object} result - Result recorded in the journal
+ */
+export function isFinished(result) {
+  return result.status !== 'failed';
+}
+
+function formatDuration(ms) {
+  const totalSeconds = Math.round(ms / 1000);
+  const hours = Math.floor(totalSeconds / 3600);
+  const minutes = Math.floor((totalSeconds % 3600) / 60);
+  const seconds = totalSeconds % 60;
+  if (hours > 0) return `${hours}h ${minutes}m`;
+  if (minutes > 0) return `${minutes}m ${seconds}s`;
+  return `${seconds}s`;
+}
+
+/**
+ * Throughput and ETA for the POs processed in this run
+ * @param {number} total - POs to process in this run (excluding resumed ones)
+ */
+export function createProgress(total) {
+  const startedAt = Date.now();
+  let completed = 0;
+  let failed = 0;
+
+  return {
+    /**
+     * Record a finished PO and return the status line to print
+     * @param {object} result - Result returned by downloadPOArtwork
+     */
+    record(result) {
+      completed++;
+      if (result.status === 'failed') {
+        failed++;
+      }
+
+      const elapsed = Date.now() - startedAt;
+      const perMinute = elapsed > 0 ? completed / (elapsed / 60000) : 0;
+      const remaining = total - completed;
+      const eta = remaining > 0 ? formatDuration(remaining * (elapsed / completed)) : 'done';
+      const failedText = failed > 0 ? `, ${failed} failed` : '';
+
+      return `[${completed}/${total}] ${perMinute.toFixed(1)} PO/min, elapsed ${formatDuration(elapsed)}, ETA ${eta}${failedText}`;
+    }
+  };
+}
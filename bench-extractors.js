@@ -0,0 +1,198 @@
+import { chromium } from 'playwright';
+import fs from 'fs';
+import path from 'path';
+import { fileURLToPath } from 'url';
+import EBrandIDDownloader from './index.js';
+
+// Offline benchmark of the DOM extractors (see page-extractors.js)
+// Runs the downloader's extraction methods against the captured po-page.html and
+// item-detail-page.html and against synthetic 1000-row tables, without logging in.
+// Reports extractions per second and the evaluate round trips each PO costs.
+// Usage: node bench-extractors.js [iterations] [rows]
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+
+const ITERATIONS = parseInt(process.argv[2], 10) || 200;
+const SYNTHETIC_ROWS = parseInt(process.argv[3], 10) || 1000;
+const BENCH_PO = '1303061';
+
+/**
+ * Build a PO list grid with the same 9 columns as the Purchase Order list
+ * @param {number} count - Number of PO rows
+ */
+function buildPOListPage(count) {
+  const rows = [];
+  for (let i = 0; i < count; i++) {
+    const po = String(1300000 + i);
+    rows.push(`<tr><td><a href="#">${po}</a></td><td>Vendor ${i}</td><td>1/${(i % 28) + 1}/26</td>` +
+      `<td>2/${(i % 28) + 1}/26</td><td>Courier</td><td>Production</td><td>Open</td><td>HK</td><td>Rep ${i % 7}</td></tr>`);
+  }
+  return `<html><body><table><tr><td>PO #</td><td>Vendor</td><td>PO Date</td><td>Ship By</td><td>Ship Via</td>` +
+    `<td>Order Type</td><td>Status</td><td>Loc</td><td>Prod Rep</td></tr>${rows.join('')}</table></body></html>`;
+}
+
+/**
+ * Build a Messages grid (3 icon columns, then Ref#, Author, Received, Subject, Comment)
+ * @param {number} count - Number of message rows
+ */
+function buildMessagePage(count) {
+  const rows = [];
+  for (let i = 0; i < count; i++) {
+    const commentId = 500000 + i;
+    rows.push(`<tr><td></td><td></td><td></td><td>${commentId}</td><td>Author ${i % 5}</td><td>1/${(i % 28) + 1}/26 10:${String(i % 60).padStart(2, '0')}</td>` +
+      `<td><a href="#" onclick="openComment('CommentDetail.aspx?CommentId=${commentId}')">Subject ${i}</a></td><td>Comment text ${i}</td></tr>`);
+  }
+  return `<html><body><table><tr><td class="SubHeader">&nbsp;</td><td></td><td></td><td>Ref #</td><td>Author</td>` +
+    `<td>Received</td><td>Subject</td><td>Comment</td></tr>${rows.join('')}</table></body></html>`;
+}
+
+/**
+ * Replace the line items of the captured PO page with generated rows
+ * @param {string} html - Captured po-page.html
+ * @param {number} count - Number of line items
+ */
+function buildLargePOPage(html, count) {
+  const rows = [];
+  for (let i = 0; i < count; i++) {
+    rows.push(`<tr class="tableBodyTextEven"><td><a href="#" onclick="javascript:openItemDetail(${8000000 + i},${9000000 + i});">ITEM${i}</a></td>` +
+      `<td>Description ${i}</td><td>White</td><td>BID HK</td><td>11/5/2025</td><td>1,010</td><td>NA</td><td>0.04500</td><td>$45.45</td></tr>`);
+  }
+  return html.replace(/(<table id="tblItems"[^>]*>\s*<tbody><tr class="tableHeaderText">[\s\S]*?<\/tr>)[\s\S]*?(<\/tbody><\/table>)/,
+    `$1${rows.join('')}$2`);
+}
+
+/**
+ * Count evaluate-style calls (one IPC round trip each) made through a page's main frame
+ * Page.evaluate, $eval and $$eval all delegate to the main frame
+ * @param {object} page - Playwright page
+ */
+function countRoundTrips(page) {
+  const frame = page.mainFrame();
+  const counter = { calls: 0 };
+  for (const method of ['evaluate', 'evaluateHandle', '$eval', '$$eval']) {
+    const original = frame[method].bind(frame);
+    frame[method] = (...args) => {
+      counter.calls++;
+      return original(...args);
+    };
+  }
+  return counter;
+}
+
+/**
+ * Run fn repeatedly with the downloader's logging muted
+ * @param {Function} fn - Async extraction to time
+ * @param {number} iterations - Number of runs
+ */
+async function measure(fn, iterations) {
+  const log = console.log;
+  console.log = () => {};
+  try {
+    await fn(); // warm-up
+    const start = process.hrtime.bigint();
+    for (let i = 0; i < iterations; i++) {
+      await fn();
+    }
+    const seconds = Number(process.hrtime.bigint() - start) / 1e9;
+    return { perSecond: iterations / seconds, msEach: (seconds * 1000) / iterations };
+  } finally {
+    console.log = log;
+  }
+}
+
+/**
+ * Load HTML into a fresh page; nothing is fetched from the network
+ * @param {object} context - Browser context
+ * @param {string} html - Page content
+ */
+async function openPage(context, html) {
+  const page = await context.newPage();
+  await page.route('**/*', route => route.abort());
+  await page.setContent(html, { waitUntil: 'domcontentloaded' });
+  return page;
+}
+
+async function bench() {
+  const downloader = new EBrandIDDownloader();
+  // Same load state the extractors wait for with the default resource blocking profile
+  downloader.resourceProfile = { enabled: true, wait_until: 'domcontentloaded' };
+
+  const poPageHtml = fs.readFileSync(path.join(__dirname, 'po-page.html'), 'utf-8');
+  const itemDetailHtml = fs.readFileSync(path.join(__dirname, 'item-detail-page.html'), 'utf-8');
+
+  const browser = await chromium.launch({ headless: true });
+  const context = await browser.newContext();
+
+  try {
+    const poPage = await openPage(context, poPageHtml);
+    const largePOPage = await openPage(context, buildLargePOPage(poPageHtml, SYNTHETIC_ROWS));
+    const itemPage = await openPage(context, itemDetailHtml);
+    const listPage = await openPage(context, buildPOListPage(SYNTHETIC_ROWS));
+    const messagePage = await openPage(context, buildMessagePage(SYNTHETIC_ROWS));
+    const listFrame = listPage.mainFrame();
+    const lastPO = String(1300000 + SYNTHETIC_ROWS - 1);
+
+    // Sanity check before timing anything
+    const detail = await downloader.extractPODetail(BENCH_PO, null, poPage);
+    const largeDetail = await downloader.extractPODetail(BENCH_PO, null, largePOPage);
+    const listRows = await downloader.readPOListTable(listFrame);
+    const messages = await downloader.readMessageTable(messagePage.mainFrame());
+    console.log(`\nCaptured PO page: ${detail.items.length} items, ${detail.itemLinks.length} item links`);
+    console.log(`Synthetic pages: ${largeDetail.items.length} items, ${listRows.length} list rows, ${messages.messages.length} messages`);
+
+    const cases = [
+      ['PO detail, one pass (po-page.html)', () => downloader.extractPODetail(BENCH_PO, null, poPage)],
+      ['PO header (po-page.html)', () => downloader.extractPOHeader(BENCH_PO, null, poPage)],
+      ['PO items (po-page.html)', () => downloader.extractPOItems(BENCH_PO, poPage)],
+      ['Item links (po-page.html)', () => downloader.getItemLinks(poPage)],
+      ['Artwork URL (item-detail-page.html)', () => downloader.extractArtworkUrl(itemPage)],
+      [`PO detail, one pass (${SYNTHETIC_ROWS} items)`, () => downloader.extractPODetail(BENCH_PO, null, largePOPage)],
+      [`PO list rows (${SYNTHETIC_ROWS} rows)`, () => downloader.readPOListTable(listFrame)],
+      [`PO list lookup, last of ${SYNTHETIC_ROWS} rows`, () => downloader.readPOListRow(listFrame, lastPO)],
+      [`Message table (${SYNTHETIC_ROWS} rows)`, () => downloader.readMessageTable(messagePage.mainFrame())]
+    ];
+
+    console.log(`\nExtractions per second (${ITERATIONS} iterations each):`);
+    for (const [name, fn] of cases) {
+      const { perSecond, msEach } = await measure(fn, ITERATIONS);
+      console.log(`  ${name.padEnd(44)} ${perSecond.toFixed(0).padStart(7)}/s  ${msEach.toFixed(2).padStart(7)} ms`);
+    }
+
+    // Round trips for one PO: list lookup, detail page, then one artwork lookup per item
+    const listCalls = countRoundTrips(listPage);
+    const detailCalls = countRoundTrips(poPage);
+    const itemCalls = countRoundTrips(itemPage);
+    const log = console.log;
+    console.log = () => {};
+    try {
+      await downloader.readPOListRow(listFrame, lastPO);
+      const { itemLinks } = await downloader.extractPODetail(BENCH_PO, null, poPage);
+      const detailOnePass = detailCalls.calls;
+      await downloader.extractPOHeader(BENCH_PO, null, poPage);
+      await downloader.extractPOItems(BENCH_PO, poPage);
+      await downloader.getItemLinks(poPage);
+      const detailPerField = detailCalls.calls - detailOnePass;
+      for (let i = 0; i < itemLinks.length; i++) {
+        await downloader.extractArtworkUrl(itemPage);
+      }
+      console.log = log;
+
+      console.log(`\nIPC round trips per PO (${itemLinks.length} items):`);
+      console.log(`  List lookup:            ${listCalls.calls}`);
+      console.log(`  PO detail, one pass:    ${detailOnePass}  (header, items and links separately: ${detailPerField})`);
+      console.log(`  Artwork URL lookups:    ${itemCalls.calls}  (${itemCalls.calls / itemLinks.length} per item)`);
+      console.log(`  Total:                  ${listCalls.calls + detailOnePass + itemCalls.calls}`);
+    } finally {
+      console.log = log;
+    }
+  } finally {
+    await context.close();
+    await browser.close();
+  }
+}
+
+bench().catch(error => {
+  console.error(`✗ Benchmark failed: ${error.message}`);
+  process.exit(1);
+});
@@ -0,0 +1,217 @@
+"""
+Shared pytest fixtures for the E-BrandID web application tests
+
+Session fixtures start server.js once on a free port against a freshly seeded
+temporary database and launch one browser; each test only gets its own context
+and page. Tests that scrape the live e-brandid site are marked ``live`` and only
+run with ``--live`` (they use the credentials in config.json).
+
+    pytest                       # UI and API tests against the seeded database
+    pytest --live                # also run the live scraping workflow
+    pytest --show-browser        # watch the browser
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import sync_playwright
+
+ROOT = Path(__file__).resolve().parent
+SERVER_START_TIMEOUT = 60
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('ebrandid')
+    group.addoption('--live', action='store_true', default=False,
+                    help='run tests that scrape the live e-brandid site')
+    group.addoption('--show-browser', action='store_true', default=False,
+                    help='run the browser headed')
+    group.addoption('--screenshots', default=str(ROOT / 'test-screenshots'),
+                    help='folder for screenshots (one subfolder per test)')
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'live: scrapes the live e-brandid site (needs --live)')
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--live'):
+        return
+    skip_live = pytest.mark.skip(reason='scrapes the live e-brandid site; run with --live')
+    for item in items:
+        if 'live' in item.keywords:
+            item.add_marker(skip_live)
+
+
+def _node():
+    node = os.environ.get('NODE') or shutil.which('node')
+    if not node:
+        pytest.exit('node is required to run server.js', returncode=1)
+    return node
+
+
+def _wait_for_ready(base_url, process, timeout):
+    """Poll /api/health until the database has loaded"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'server.js exited with code {process.returncode}')
+        try:
+            with urllib.request.urlopen(f'{base_url}/api/health', timeout=2):
+                return
+        except urllib.error.HTTPError as error:
+            # 503 while the database loads
+            health = json.load(error)
+            if health.get('status') == 'failed':
+                raise RuntimeError(f"Database failed to load: {health.get('error')}")
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f'server.js was not ready within {timeout}s')
+
+
+@pytest.fixture(scope='session')
+def seeded_db(tmp_path_factory):
+    """Path of a temporary database filled by seed-test-db.js"""
+    db_path = tmp_path_factory.mktemp('db') / 'ebrandid-test.db'
+    env = {**os.environ, 'EBRANDID_DB_PATH': str(db_path)}
+    subprocess.run([_node(), 'seed-test-db.js'], cwd=ROOT, env=env, check=True,
+                   capture_output=True, text=True, timeout=SERVER_START_TIMEOUT)
+    return db_path
+
+
+@pytest.fixture(scope='session')
+def server_url(seeded_db, tmp_path_factory):
+    """Base URL of a server.js started once for the whole session"""
+    log_path = tmp_path_factory.mktemp('server') / 'server.log'
+    env = {**os.environ, 'PORT': '0', 'EBRANDID_DB_PATH': str(seeded_db)}
+    process = subprocess.Popen([_node(), 'server.js'], cwd=ROOT, env=env,
+                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+
+    # The port is only known once the server prints it
+    port_found = threading.Event()
+    port = {}
+
+    def read_output():
+        with open(log_path, 'w', encoding='utf-8') as log:
+            for line in process.stdout:
+                log.write(line)
+                log.flush()
+                match = re.search(r'Local access:\s+http://localhost:(\d+)', line)
+                if match and not port_found.is_set():
+                    port['value'] = int(match.group(1))
+                    port_found.set()
+
+    threading.Thread(target=read_output, daemon=True).start()
+
+    try:
+        if not port_found.wait(SERVER_START_TIMEOUT):
+            raise RuntimeError(f'server.js did not start; see {log_path}')
+        base_url = f"http://localhost:{port['value']}"
+        _wait_for_ready(base_url, process, SERVER_START_TIMEOUT)
+        yield base_url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+@pytest.fixture(scope='session')
+def browser(pytestconfig):
+    """One Chromium shared by every test in the session"""
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=not pytestconfig.getoption('--show-browser'))
+        yield browser
+        browser.close()
+
+
+@pytest.fixture
+def context(browser, server_url):
+    """Fresh browser context per test; requests leaving the test server are blocked"""
+    context = browser.new_context(base_url=server_url, viewport={'width': 1920, 'height': 1080})
+    context.route(re.compile(r'^https?://(?!localhost[:/]|127\.0\.0\.1[:/])'), lambda route: route.abort())
+    yield context
+    context.close()
+
+
+@pytest.fixture
+def console_errors():
+    """JavaScript errors logged by the page (blocked external resources are ignored)"""
+    return []
+
+
+@pytest.fixture
+def page(context, console_errors):
+    """Page with the app loaded"""
+    page = context.new_page()
+
+    def on_console(msg):
+        if msg.type == 'error' and 'Failed to load resource' not in msg.text:
+            console_errors.append(msg.text)
+
+    page.on('console', on_console)
+    page.on('pageerror', lambda error: console_errors.append(str(error)))
+    page.goto('/')
+    page.wait_for_load_state('networkidle')
+    return page
+
+
+@pytest.fixture
+def screenshot(page, request, pytestconfig):
+    """Save a full-page screenshot: screenshot('after_click') -> <folder>/<test>/01_after_click.png"""
+    folder = Path(pytestconfig.getoption('--screenshots')) / re.sub(r'[^\w.-]+', '_', request.node.name)
+    shutil.rmtree(folder, ignore_errors=True)
+    folder.mkdir(parents=True)
+    count = [0]
+
+    def take(name):
+        count[0] += 1
+        safe_name = re.sub(r'[^\w.-]+', '_', name)[:40]
+        path = folder / f'{count[0]:02d}_{safe_name}.png'
+        page.screenshot(path=str(path), full_page=True)
+        return path
+
+    return take
+
+
+@pytest.fixture
+def close_modal(page):
+    """Close the modal overlay if it is open"""
+    def close():
+        overlay = page.locator('#modal-overlay')
+        if not overlay.is_visible():
+            return False
+        buttons = page.locator('#modal-overlay .modal-btn')
+        if buttons.count() > 0:
+            # Cancel for confirmations, OK for alerts
+            buttons.first.click()
+        else:
+            overlay.click(position={'x': 10, 'y': 10})
+        overlay.wait_for(state='hidden', timeout=5000)
+        return True
+
+    return close
+
+
+@pytest.fixture
+def open_section(page):
+    """Switch the sidebar to a section by its button label"""
+    def open_(name):
+        page.locator('.sidebar .nav-button', has_text=name).click()
+        view = page.locator('.view.active')
+        view.wait_for(state='visible')
+        page.wait_for_load_state('networkidle')
+        return view
+
+    return open_
@@ -1,18 +1,50 @@
 import initSqlJs from 'sql.js';
 import fs from 'fs';
 import path from 'path';
+import zlib from 'zlib';
 import { fileURLToPath } from 'url';
+import { createCounter, createGauge, createHistogram } from './metrics.js';
+import { createReadCache } from './read-cache.js';
+
+export { getReadCacheStats } from './read-cache.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
-const DB_PATH = path.join(__dirname, 'ebrandid.db');
+// EBRANDID_DB_PATH points the app at another database file (e.g. a seeded test copy)
+const DB_PATH = process.env.EBRANDID_DB_PATH || path.join(__dirname, 'ebrandid.db');
 
 let SQL;
 let db;
 
+// Bumped on every write so HTTP caches can tell when the data changed.
+// The epoch keeps versions from different server runs apart.
+const DATA_EPOCH = Date.now().toString(36);
+let dataVersion = 0;
+
+const saveDurationHistogram = createHistogram(
+  'ebrandid_db_save_duration_seconds',
+  'Time spent exporting and writing the sql.js database to disk'
+);
+const saveBytesCounter = createCounter('ebrandid_db_save_bytes_total', 'Bytes written by saveDatabase');
+const databaseSizeGauge = createGauge('ebrandid_db_size_bytes', 'Size of the database file after the last save');
+
+// Hot reads served from memory; the write functions below invalidate exactly the
+// entries they change (rows returned from these caches are shared - don't mutate)
+const poHeaderCache = createReadCache('po_header', { maxEntries: 1000 });
+const poItemsCache = createReadCache('po_items', { maxEntries: 1000 });
+const poListCache = createReadCache('po_list', { maxEntries: 50 });
+const poDisplayCache = createReadCache('po_display', { maxEntries: 500 });
+const itemDetailsCache = createReadCache('item_details', { maxEntries: 1000 });
+
+function itemDetailsKey(item_1, suffix) {
+  return `${item_1}\u0000${suffix || ''}`;
+}
+
 /**
  * Initialize the database
+ * The file is read asynchronously so a server can keep answering requests
+ * (e.g. readiness checks) while a large database loads.
  */
 export async function initDatabase() {
   if (!SQL) {
@@ -21,19 +53,96 @@ export async function initDatabase() {
 
   // Load existing database or create new one
   if (fs.existsSync(DB_PATH)) {
-    const buffer = fs.readFileSync(DB_PATH);
+    const buffer = await fs.promises.readFile(DB_PATH);
     db = new SQL.Database(buffer);
-    // Run migrations for existing databases
-    migrateDatabase();
+    // Apply only the migrations this file has not seen yet
+    runMigrations();
   } else {
     db = new SQL.Database();
     createTables();
+    setSchemaVersion(SCHEMA_VERSION, 'create');
     saveDatabase();
   }
 
   return db;
 }
 
+/**
+ * Schema migrations, applied in order to databases below their version
+ * Version 1 brings any pre-versioning database up to the current layout
+ * using the original column probes; later steps must be plain DDL.
+ * New tables and columns also go into createTables().
+ */
+const MIGRATIONS = [
+  { version: 1, description: 'Baseline schema', up: upgradeLegacySchema },
+  { version: 2, description: 'Precomputed item_key on items', up: addItemKeyColumn },
+  { version: 3, description: 'Line identity for po_items', up: addPOItemLineKeys }
+];
+
+const SCHEMA_VERSION = MIGRATIONS[MIGRATIONS.length - 1].version;
+
+let vacuumAfterMigrations = false;
+
+/**
+ * Current schema version of the open database (0 when never versioned)
+ */
+export function getSchemaVersion() {
+  try {
+    const result = db.exec('SELECT MAX(version) AS version FROM schema_version');
+    return result.length > 0 ? (result[0].values[0][0] || 0) : 0;
+  } catch (error) {
+    // schema_version table doesn't exist yet
+    return 0;
+  }
+}
+
+function setSchemaVersion(version, description) {
+  db.run(`
+    CREATE TABLE IF NOT EXISTS schema_version (
+      version INTEGER PRIMARY KEY,
+      description TEXT,
+      applied_at TEXT
+    )
+  `);
+  db.run(
+    "INSERT OR REPLACE INTO schema_version (version, description, applied_at) VALUES (?, ?, datetime('now'))",
+    [version, description]
+  );
+}
+
+/**
+ * Apply pending migrations, each in its own transaction
+ * An up-to-date database costs a single query and is not rewritten to disk
+ */
+function runMigrations() {
+  const current = getSchemaVersion();
+  const pending = MIGRATIONS.filter(migration => migration.version > current);
+
+  if (pending.length === 0) {
+    return;
+  }
+
+  for (const migration of pending) {
+    console.log(`Applying database migration ${migration.version}: ${migration.description}`);
+    try {
+      db.run('BEGIN TRANSACTION');
+      migration.up();
+      setSchemaVersion(migration.version, migration.description);
+      db.run('COMMIT');
+    } catch (error) {
+      db.run('ROLLBACK');
+      throw new Error(`Failed to apply database migration ${migration.version}: ${error.message}`);
+    }
+  }
+
+  if (vacuumAfterMigrations) {
+    db.run('VACUUM');
+    vacuumAfterMigrations = false;
+  }
+
+  saveDatabase();
+}
+
 /**
  * Create database tables
  */
@@ -81,9 +190,11 @@ function createTables() {
       bundle_qty TEXT,
       unit_price REAL,
       extension REAL,
+      line_key TEXT,
       FOREIGN KEY (po_number) REFERENCES po_headers(po_number)
     )
   `);
+  db.run('CREATE UNIQUE INDEX IF NOT EXISTS idx_po_items_line_key ON po_items(po_number, line_key)');
 
   // Download history table
   db.run(`
@@ -94,6 +205,9 @@ function createTables() {
       total_size INTEGER,
       download_date TEXT,
       status TEXT,
+      operation TEXT,
+      duration_ms INTEGER,
+      trace TEXT,
       FOREIGN KEY (po_number) REFERENCES po_headers(po_number)
     )
   `);
@@ -108,6 +222,7 @@ function createTables() {
       subject TEXT,
       comment TEXT,
       full_details TEXT,
+      full_details_compressed BLOB,
       message_link TEXT,
       comment_id TEXT,
       created_at TEXT,
@@ -122,10 +237,12 @@ function createTables() {
       item_1 TEXT NOT NULL,
       suffix TEXT,
       internal_seq TEXT UNIQUE,
+      item_key TEXT,
       created_at TEXT,
       UNIQUE(item_1, suffix)
     )
   `);
+  db.run('CREATE INDEX IF NOT EXISTS idx_items_item_key ON items(item_key)');
 
   // Item details table for textile manufacturing data
   db.run(`
@@ -158,137 +275,355 @@ function createTables() {
       UNIQUE(item_1, suffix)
     )
   `);
+
+  // Sync state table (cursors for incremental syncs)
+  db.run(`
+    CREATE TABLE IF NOT EXISTS sync_state (
+      key TEXT PRIMARY KEY,
+      value TEXT,
+      updated_at TEXT
+    )
+  `);
+
+  // PO list delta sync run history
+  db.run(`
+    CREATE TABLE IF NOT EXISTS po_sync_runs (
+      id INTEGER PRIMARY KEY AUTOINCREMENT,
+      triggered_by TEXT,
+      status TEXT,
+      started_at TEXT,
+      finished_at TEXT,
+      duration_ms INTEGER,
+      list_rows INTEGER,
+      new_count INTEGER,
+      changed_count INTEGER,
+      fetched_count INTEGER,
+      failed_count INTEGER,
+      list_duration_ms INTEGER,
+      fetch_duration_ms INTEGER,
+      error TEXT
+    )
+  `);
+
+  db.run('CREATE INDEX IF NOT EXISTS idx_messages_ref_number ON messages(ref_number)');
+  createOrderQueryIndexes();
+}
+
+/**
+ * Indexes behind queryPOs: item aggregates are looked up per PO and the
+ * common sort columns can be walked in order
+ */
+function createOrderQueryIndexes() {
+  db.run('CREATE INDEX IF NOT EXISTS idx_po_items_po_number ON po_items(po_number)');
+  db.run("CREATE INDEX IF NOT EXISTS idx_po_headers_created_at ON po_headers(COALESCE(created_at, ''), po_number)");
+  db.run("CREATE INDEX IF NOT EXISTS idx_po_headers_status ON po_headers(COALESCE(status, ''), po_number)");
+  db.run("CREATE INDEX IF NOT EXISTS idx_po_headers_vendor_name ON po_headers(COALESCE(vendor_name, ''), po_number)");
+  db.run("CREATE INDEX IF NOT EXISTS idx_po_headers_po_date ON po_headers(COALESCE(po_date, ''), po_number)");
 }
 
 /**
- * Migrate existing database to add new columns and tables
+ * Migrate a pre-versioning database to add new columns and tables
+ * Only runs as schema migration 1; every probe is cheap to repeat
  */
-function migrateDatabase() {
+function upgradeLegacySchema() {
+  // Check if messages table exists, if not create it
   try {
-    // Check if messages table exists, if not create it
-    try {
-      db.exec(`SELECT 1 FROM messages LIMIT 1`);
-    } catch (error) {
-      // Messages table doesn't exist, create it
-      console.log('Creating messages table...');
-      db.exec(`
-        CREATE TABLE IF NOT EXISTS messages (
-          id INTEGER PRIMARY KEY AUTOINCREMENT,
-          ref_number TEXT,
-          author TEXT,
-          received_date TEXT,
-          subject TEXT,
-          comment TEXT,
-          full_details TEXT,
-          message_link TEXT,
-          comment_id TEXT,
-          created_at TEXT,
-          updated_at TEXT
-        )
-      `);
-    }
+    db.exec(`SELECT 1 FROM messages LIMIT 1`);
+  } catch (error) {
+    // Messages table doesn't exist, create it
+    console.log('Creating messages table...');
+    db.exec(`
+      CREATE TABLE IF NOT EXISTS messages (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ref_number TEXT,
+        author TEXT,
+        received_date TEXT,
+        subject TEXT,
+        comment TEXT,
+        full_details TEXT,
+        message_link TEXT,
+        comment_id TEXT,
+        created_at TEXT,
+        updated_at TEXT
+      )
+    `);
+  }
 
-    // Check if new columns exist, if not add them
-    const columns = ['po_date', 'ship_by', 'ship_via', 'order_type', 'loc', 'prod_rep'];
-
-    columns.forEach(column => {
-      try {
-        // Try to select the column to see if it exists
-        db.exec(`SELECT ${column} FROM po_headers LIMIT 1`);
-      } catch (error) {
-        // Column doesn't exist, add it
-        console.log(`Adding column ${column} to po_headers table`);
-        db.run(`ALTER TABLE po_headers ADD COLUMN ${column} TEXT`);
-      }
-    });
+  // Check if new columns exist, if not add them
+  const columns = ['po_date', 'ship_by', 'ship_via', 'order_type', 'loc', 'prod_rep'];
 
-    // Check if message_link column exists in messages table
+  columns.forEach(column => {
     try {
-      db.exec(`SELECT message_link FROM messages LIMIT 1`);
+      // Try to select the column to see if it exists
+      db.exec(`SELECT ${column} FROM po_headers LIMIT 1`);
     } catch (error) {
       // Column doesn't exist, add it
-      console.log('Adding column message_link to messages table');
-      db.run(`ALTER TABLE messages ADD COLUMN message_link TEXT`);
+      console.log(`Adding column ${column} to po_headers table`);
+      db.run(`ALTER TABLE po_headers ADD COLUMN ${column} TEXT`);
     }
+  });
 
-    // Check if comment_id column exists in messages table
-    try {
-      db.exec(`SELECT comment_id FROM messages LIMIT 1`);
-    } catch (error) {
-      // Column doesn't exist, add it
-      console.log('Adding column comment_id to messages table');
-      db.run(`ALTER TABLE messages ADD COLUMN comment_id TEXT`);
-    }
+  // Check if message_link column exists in messages table
+  try {
+    db.exec(`SELECT message_link FROM messages LIMIT 1`);
+  } catch (error) {
+    // Column doesn't exist, add it
+    console.log('Adding column message_link to messages table');
+    db.run(`ALTER TABLE messages ADD COLUMN message_link TEXT`);
+  }
+
+  // Check if comment_id column exists in messages table
+  try {
+    db.exec(`SELECT comment_id FROM messages LIMIT 1`);
+  } catch (error) {
+    // Column doesn't exist, add it
+    console.log('Adding column comment_id to messages table');
+    db.run(`ALTER TABLE messages ADD COLUMN comment_id TEXT`);
+  }
+
+  // Check if full_details_compressed column exists in messages table
+  try {
+    db.exec(`SELECT full_details_compressed FROM messages LIMIT 1`);
+  } catch (error) {
+    // Column doesn't exist, add it and move existing bodies into it
+    console.log('Adding column full_details_compressed to messages table');
+    db.run(`ALTER TABLE messages ADD COLUMN full_details_compressed BLOB`);
+    compressExistingMessageBodies();
+  }
+
+  // Check if items table exists, if not create it
+  try {
+    db.exec(`SELECT 1 FROM items LIMIT 1`);
+  } catch (error) {
+    // Items table doesn't exist, create it
+    console.log('Creating items table...');
+    db.exec(`
+      CREATE TABLE IF NOT EXISTS items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        item_1 TEXT NOT NULL,
+        suffix TEXT,
+        internal_seq TEXT UNIQUE,
+        created_at TEXT,
+        UNIQUE(item_1, suffix)
+      )
+    `);
+  }
+
+  // Check if internal_seq column exists in items table
+  try {
+    db.exec(`SELECT internal_seq FROM items LIMIT 1`);
+  } catch (error) {
+    // Column doesn't exist, add it
+    console.log('Adding column internal_seq to items table');
+    db.run(`ALTER TABLE items ADD COLUMN internal_seq TEXT`);
+  }
+
+  // Check if item_details table exists, if not create it
+  try {
+    db.exec(`SELECT 1 FROM item_details LIMIT 1`);
+  } catch (error) {
+    // Item details table doesn't exist, create it
+    console.log('Creating item_details table...');
+    db.exec(`
+      CREATE TABLE IF NOT EXISTS item_details (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        item_1 TEXT NOT NULL,
+        suffix TEXT,
+        brand_name TEXT,
+        machine_number TEXT,
+        machine_opening TEXT,
+        pattern_name TEXT,
+        pattern_writer TEXT,
+        dragon_head TEXT,
+        machine_density TEXT,
+        pattern_density TEXT,
+        total_length_mm TEXT,
+        skirt_opening TEXT,
+        actual_length TEXT,
+        width_mm TEXT,
+        x_coordinate TEXT,
+        y_coordinate TEXT,
+        picks TEXT,
+        cut_per_group TEXT,
+        total_cut TEXT,
+        total_assembly TEXT,
+        schedule_progress TEXT,
+        actual_cut TEXT,
+        created_at TEXT,
+        updated_at TEXT,
+        UNIQUE(item_1, suffix)
+      )
+    `);
+  }
 
-    // Check if items table exists, if not create it
+  // Check if sync_state table exists, if not create it
+  try {
+    db.exec(`SELECT 1 FROM sync_state LIMIT 1`);
+  } catch (error) {
+    // Sync state table doesn't exist, create it
+    console.log('Creating sync_state table...');
+    db.exec(`
+      CREATE TABLE IF NOT EXISTS sync_state (
+        key TEXT PRIMARY KEY,
+        value TEXT,
+        updated_at TEXT
+      )
+    `);
+  }
+
+  // Check if po_sync_runs table exists, if not create it
+  try {
+    db.exec(`SELECT 1 FROM po_sync_runs LIMIT 1`);
+  } catch (error) {
+    console.log('Creating po_sync_runs table...');
+    db.exec(`
+      CREATE TABLE IF NOT EXISTS po_sync_runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        triggered_by TEXT,
+        status TEXT,
+        started_at TEXT,
+        finished_at TEXT,
+        duration_ms INTEGER,
+        list_rows INTEGER,
+        new_count INTEGER,
+        changed_count INTEGER,
+        fetched_count INTEGER,
+        failed_count INTEGER,
+        list_duration_ms INTEGER,
+        fetch_duration_ms INTEGER,
+        error TEXT
+      )
+    `);
+  }
+
+  // Check if the scrape trace columns exist in download_history
+  const historyColumns = { operation: 'TEXT', duration_ms: 'INTEGER', trace: 'TEXT' };
+
+  Object.entries(historyColumns).forEach(([column, type]) => {
     try {
-      db.exec(`SELECT 1 FROM items LIMIT 1`);
+      db.exec(`SELECT ${column} FROM download_history LIMIT 1`);
     } catch (error) {
-      // Items table doesn't exist, create it
-      console.log('Creating items table...');
-      db.exec(`
-        CREATE TABLE IF NOT EXISTS items (
-          id INTEGER PRIMARY KEY AUTOINCREMENT,
-          item_1 TEXT NOT NULL,
-          suffix TEXT,
-          internal_seq TEXT UNIQUE,
-          created_at TEXT,
-          UNIQUE(item_1, suffix)
-        )
-      `);
+      console.log(`Adding column ${column} to download_history table`);
+      db.run(`ALTER TABLE download_history ADD COLUMN ${column} ${type}`);
     }
+  });
 
-    // Check if internal_seq column exists in items table
-    try {
-      db.exec(`SELECT internal_seq FROM items LIMIT 1`);
-    } catch (error) {
-      // Column doesn't exist, add it
-      console.log('Adding column internal_seq to items table');
-      db.run(`ALTER TABLE items ADD COLUMN internal_seq TEXT`);
+  // Index used to skip already-stored messages during incremental sync
+  db.run('CREATE INDEX IF NOT EXISTS idx_messages_ref_number ON messages(ref_number)');
+
+  // Indexes for the server-side order query
+  createOrderQueryIndexes();
+}
+
+/**
+ * Store the full item number (item_1 plus "-suffix") on items so po_items can be
+ * joined on it directly
+ */
+function addItemKeyColumn() {
+  db.run('ALTER TABLE items ADD COLUMN item_key TEXT');
+  db.run("UPDATE items SET item_key = CASE WHEN suffix IS NULL THEN item_1 ELSE item_1 || '-' || suffix END");
+  db.run('CREATE INDEX IF NOT EXISTS idx_items_item_key ON items(item_key)');
+}
+
+/**
+ * Give every stored PO line a line_key and drop the duplicate copies left by
+ * re-fetches, which used to append all of a PO's lines again. A PO whose rows are
+ * k identical copies of the same sequence keeps only the first copy.
+ */
+function addPOItemLineKeys() {
+  db.run('ALTER TABLE po_items ADD COLUMN line_key TEXT');
+
+  const stmt = db.prepare(`SELECT id, po_number, ${PO_ITEM_FIELDS.join(', ')} FROM po_items ORDER BY po_number, id`);
+  const rowsByPO = new Map();
+  while (stmt.step()) {
+    const row = stmt.getAsObject();
+    if (!rowsByPO.has(row.po_number)) {
+      rowsByPO.set(row.po_number, []);
     }
+    rowsByPO.get(row.po_number).push(row);
+  }
+  stmt.free();
 
-    // Check if item_details table exists, if not create it
-    try {
-      db.exec(`SELECT 1 FROM item_details LIMIT 1`);
-    } catch (error) {
-      // Item details table doesn't exist, create it
-      console.log('Creating item_details table...');
-      db.exec(`
-        CREATE TABLE IF NOT EXISTS item_details (
-          id INTEGER PRIMARY KEY AUTOINCREMENT,
-          item_1 TEXT NOT NULL,
-          suffix TEXT,
-          brand_name TEXT,
-          machine_number TEXT,
-          machine_opening TEXT,
-          pattern_name TEXT,
-          pattern_writer TEXT,
-          dragon_head TEXT,
-          machine_density TEXT,
-          pattern_density TEXT,
-          total_length_mm TEXT,
-          skirt_opening TEXT,
-          actual_length TEXT,
-          width_mm TEXT,
-          x_coordinate TEXT,
-          y_coordinate TEXT,
-          picks TEXT,
-          cut_per_group TEXT,
-          total_cut TEXT,
-          total_assembly TEXT,
-          schedule_progress TEXT,
-          actual_cut TEXT,
-          created_at TEXT,
-          updated_at TEXT,
-          UNIQUE(item_1, suffix)
-        )
-      `);
+  const deleteStmt = db.prepare('DELETE FROM po_items WHERE id = ?');
+  const keyStmt = db.prepare('UPDATE po_items SET line_key = ? WHERE id = ?');
+  let removed = 0;
+
+  for (const rows of rowsByPO.values()) {
+    const signatures = rows.map(row => PO_ITEM_FIELDS.map(field => String(row[field] ?? '')).join('\u0000'));
+    let period = rows.length;
+    for (let candidate = 1; candidate < rows.length; candidate++) {
+      if (rows.length % candidate === 0 && signatures.every((signature, i) => signature === signatures[i % candidate])) {
+        period = candidate;
+        break;
+      }
     }
 
-    saveDatabase();
-  } catch (error) {
-    console.error('Error during database migration:', error);
+    rows.slice(period).forEach(row => {
+      deleteStmt.run([row.id]);
+      removed++;
+    });
+
+    const lineKeys = assignLineKeys(rows.slice(0, period).map(row => row.item_number));
+    rows.slice(0, period).forEach((row, i) => keyStmt.run([lineKeys[i], row.id]));
+  }
+
+  deleteStmt.free();
+  keyStmt.free();
+
+  if (removed > 0) {
+    console.log(`Removed ${removed} duplicated PO line(s) left by earlier re-fetches`);
+  }
+  db.run('CREATE UNIQUE INDEX IF NOT EXISTS idx_po_items_line_key ON po_items(po_number, line_key)');
+}
+
+/**
+ * Compress message bodies stored as plain text by older versions
+ * Runs once, when the full_details_compressed column is first added
+ * (inside the migration transaction)
+ */
+function compressExistingMessageBodies() {
+  const selectStmt = db.prepare('SELECT id, full_details FROM messages WHERE full_details IS NOT NULL');
+  const rows = [];
+  while (selectStmt.step()) {
+    rows.push(selectStmt.getAsObject());
+  }
+  selectStmt.free();
+
+  if (rows.length === 0) {
+    return;
+  }
+
+  console.log(`Compressing ${rows.length} stored message bodies...`);
+  const updateStmt = db.prepare('UPDATE messages SET full_details_compressed = ?, full_details = NULL WHERE id = ?');
+  rows.forEach(row => {
+    updateStmt.run([compressText(row.full_details), row.id]);
+  });
+  updateStmt.free();
+
+  // Reclaim the space the plain-text bodies used (VACUUM can't run inside the migration transaction)
+  vacuumAfterMigrations = true;
+}
+
+/**
+ * Compress a message body for storage (brotli)
+ */
+function compressText(text) {
+  if (text === null || text === undefined) {
+    return null;
+  }
+  return zlib.brotliCompressSync(Buffer.from(String(text), 'utf-8'), {
+    params: { [zlib.constants.BROTLI_PARAM_QUALITY]: 9 }
+  });
+}
+
+/**
+ * Decompress a message body read from the database
+ */
+function decompressText(data) {
+  if (!data) {
+    return null;
   }
+  return zlib.brotliDecompressSync(Buffer.from(data)).toString('utf-8');
 }
 
 /**
@@ -296,12 +631,25 @@ function migrateDatabase() {
  */
 export function saveDatabase() {
   if (db) {
+    const start = process.hrtime.bigint();
     const data = db.export();
     const buffer = Buffer.from(data);
     fs.writeFileSync(DB_PATH, buffer);
+    dataVersion++;
+
+    saveDurationHistogram.observe({}, Number(process.hrtime.bigint() - start) / 1e9);
+    saveBytesCounter.inc({}, buffer.length);
+    databaseSizeGauge.set({}, buffer.length);
   }
 }
 
+/**
+ * Current data version, changes whenever the database is written
+ */
+export function getDataVersion() {
+  return `${DATA_EPOCH}-${dataVersion}`;
+}
+
 /**
  * Insert or update PO header
  */
@@ -346,6 +694,9 @@ export function savePOHeader(poData) {
     ]);
 
     stmt.free();
+    poHeaderCache.delete(poData.poNumber);
+    poDisplayCache.delete(poData.poNumber);
+    poListCache.clear();
     saveDatabase();
   } catch (error) {
     console.error('Error in savePOHeader:', error);
@@ -354,36 +705,132 @@ export function savePOHeader(poData) {
   }
 }
 
+// Stored columns compared when a PO is re-fetched (and the matching scraped fields)
+const PO_ITEM_FIELDS = ['item_number', 'description', 'color', 'ship_to', 'need_by', 'qty', 'bundle_qty', 'unit_price', 'extension'];
+const PO_ITEM_SOURCE_FIELDS = ['itemNumber', 'description', 'color', 'shipTo', 'needBy', 'qty', 'bundleQty', 'unitPrice', 'extension'];
+
 /**
- * Insert PO line item
+ * Line identity within a PO: the item number plus its occurrence (the same item
+ * may be ordered on several lines), e.g. "12345-A#1", "12345-A#2"
+ * @param {Array<string>} itemNumbers - Item numbers in page order
  */
-export function savePOItem(itemData) {
-  const stmt = db.prepare(`
-    INSERT INTO po_items (
-      po_number, item_number, description, color, ship_to,
-      need_by, qty, bundle_qty, unit_price, extension
-    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-  `);
+function assignLineKeys(itemNumbers) {
+  const seen = new Map();
+  return itemNumbers.map(itemNumber => {
+    const occurrence = (seen.get(itemNumber) || 0) + 1;
+    seen.set(itemNumber, occurrence);
+    return `${itemNumber ?? ''}#${occurrence}`;
+  });
+}
 
-  stmt.run([
-    itemData.poNumber,
-    itemData.itemNumber,
-    itemData.description,
-    itemData.color,
-    itemData.shipTo,
-    itemData.needBy,
-    itemData.qty,
-    itemData.bundleQty,
-    itemData.unitPrice,
-    itemData.extension
-  ]);
+function normalizeItemValue(value) {
+  return value === undefined || Number.isNaN(value) ? null : value;
+}
 
-  stmt.free();
+/**
+ * Store the scraped line items of a PO, replacing what was stored before
+ * Rows are matched on line_key; only new, changed and vanished lines are written,
+ * in one transaction, and nothing is saved to disk when nothing changed
+ * @param {string} poNumber - PO number
+ * @param {Array<object>} items - Scraped items (itemNumber, description, color, shipTo, ...)
+ * @returns {object} { inserted, updated, deleted, unchanged }
+ */
+export function savePOItems(poNumber, items) {
+  const counts = { inserted: 0, updated: 0, deleted: 0, unchanged: 0 };
+  let selectStmt = null;
+  let insertStmt = null;
+  let updateStmt = null;
+  let deleteStmt = null;
+  let inTransaction = false;
 
-  // Automatically track the item
-  trackItem(itemData.itemNumber);
+  try {
+    const stored = new Map();
+    selectStmt = db.prepare(`SELECT id, line_key, ${PO_ITEM_FIELDS.join(', ')} FROM po_items WHERE po_number = ? ORDER BY id`);
+    selectStmt.bind([poNumber]);
+    while (selectStmt.step()) {
+      const row = selectStmt.getAsObject();
+      if (stored.has(row.line_key)) {
+        // A second row with the same identity can only be a leftover copy
+        stored.get(row.line_key).duplicates.push(row.id);
+      } else {
+        stored.set(row.line_key, { row, duplicates: [] });
+      }
+    }
+    selectStmt.free();
+    selectStmt = null;
+
+    const incoming = items.map(item => PO_ITEM_SOURCE_FIELDS.map(field => normalizeItemValue(item[field])));
+    const lineKeys = assignLineKeys(incoming.map(values => values[0]));
+    insertStmt = db.prepare(`
+      INSERT INTO po_items (po_number, ${PO_ITEM_FIELDS.join(', ')}, line_key)
+      VALUES (?, ${PO_ITEM_FIELDS.map(() => '?').join(', ')}, ?)
+    `);
+    updateStmt = db.prepare(`UPDATE po_items SET ${PO_ITEM_FIELDS.map(field => `${field} = ?`).join(', ')} WHERE id = ?`);
+    deleteStmt = db.prepare('DELETE FROM po_items WHERE id = ?');
+    const insertedItemNumbers = [];
+
+    db.run('BEGIN TRANSACTION');
+    inTransaction = true;
+
+    incoming.forEach((values, i) => {
+      const match = stored.get(lineKeys[i]);
+      if (!match) {
+        insertStmt.run([poNumber, ...values, lineKeys[i]]);
+        insertedItemNumbers.push(values[0]);
+        counts.inserted++;
+        return;
+      }
 
-  saveDatabase();
+      stored.delete(lineKeys[i]);
+      match.duplicates.forEach(id => {
+        deleteStmt.run([id]);
+        counts.deleted++;
+      });
+
+      const changed = PO_ITEM_FIELDS.some((field, f) => String(match.row[field] ?? '') !== String(values[f] ?? ''));
+      if (changed) {
+        updateStmt.run([...values, match.row.id]);
+        counts.updated++;
+      } else {
+        counts.unchanged++;
+      }
+    });
+
+    // Lines no longer on the PO
+    for (const { row, duplicates } of stored.values()) {
+      [row.id, ...duplicates].forEach(id => {
+        deleteStmt.run([id]);
+        counts.deleted++;
+      });
+    }
+
+    insertedItemNumbers.forEach(itemNumber => insertTrackedItem(itemNumber));
+
+    db.run('COMMIT');
+    inTransaction = false;
+
+    [insertStmt, updateStmt, deleteStmt].forEach(stmt => stmt.free());
+    insertStmt = updateStmt = deleteStmt = null;
+
+    if (counts.inserted + counts.updated + counts.deleted > 0) {
+      poItemsCache.delete(poNumber);
+      poDisplayCache.delete(poNumber);
+      saveDatabase();
+    }
+
+    return counts;
+  } catch (error) {
+    if (inTransaction) {
+      db.run('ROLLBACK');
+    }
+    [selectStmt, insertStmt, updateStmt, deleteStmt].forEach(stmt => {
+      if (stmt) {
+        stmt.free();
+      }
+    });
+    console.error('Error saving PO items:', error);
+    throw new Error(`Failed to save PO items: ${error.message}`);
+  }
 }
 
 /**
@@ -392,15 +839,19 @@ export function savePOItem(itemData) {
 export function saveDownloadHistory(historyData) {
   const stmt = db.prepare(`
     INSERT INTO download_history (
-      po_number, files_downloaded, total_size, download_date, status
-    ) VALUES (?, ?, ?, datetime('now'), ?)
+      po_number, files_downloaded, total_size, download_date, status,
+      operation, duration_ms, trace
+    ) VALUES (?, ?, ?, datetime('now'), ?, ?, ?, ?)
   `);
 
   stmt.run([
     historyData.poNumber,
     historyData.filesDownloaded,
     historyData.totalSize,
-    historyData.status
+    historyData.status,
+    historyData.operation || 'download',
+    historyData.durationMs ?? null,
+    historyData.trace ? JSON.stringify(historyData.trace) : null
   ]);
 
   stmt.free();
@@ -413,26 +864,243 @@ export function saveDownloadHistory(historyData) {
  * @param {number} offset - Number of records to skip (optional)
  */
 export function getAllPOs(limit = null, offset = 0) {
-  // First get total count to handle offset properly
-  const countStmt = db.prepare('SELECT COUNT(*) as count FROM po_headers');
-  countStmt.step();
-  const totalCount = countStmt.getAsObject().count;
-  countStmt.free();
-
-  // If offset is beyond total records, return empty array
-  if (offset >= totalCount) {
-    return [];
+  return poListCache.get(`${limit}:${offset}`, () => {
+    // First get total count to handle offset properly
+    const countStmt = db.prepare('SELECT COUNT(*) as count FROM po_headers');
+    countStmt.step();
+    const totalCount = countStmt.getAsObject().count;
+    countStmt.free();
+
+    // If offset is beyond total records, return empty array
+    if (offset >= totalCount) {
+      return [];
+    }
+
+    let query = 'SELECT * FROM po_headers ORDER BY created_at DESC';
+
+    if (limit !== null) {
+      query += ` LIMIT ${parseInt(limit)} OFFSET ${parseInt(offset)}`;
+    }
+
+    const stmt = db.prepare(query);
+    const results = [];
+
+    while (stmt.step()) {
+      results.push(stmt.getAsObject());
+    }
+
+    stmt.free();
+    return results;
+  });
+}
+
+// Columns accepted by queryPOs, mapped to the SQL expressions they filter/sort on
+const ORDER_TEXT_COLUMNS = [
+  'po_number', 'po_date', 'ship_by', 'ship_via', 'order_type', 'status',
+  'loc', 'prod_rep', 'company', 'vendor_name', 'currency', 'created_at'
+];
+
+const ORDER_AGGREGATES = {
+  item_count: 'SELECT COUNT(*) FROM po_items i WHERE i.po_number = h.po_number',
+  total_qty: "SELECT COALESCE(SUM(CAST(REPLACE(CAST(i.qty AS TEXT), ',', '') AS INTEGER)), 0) FROM po_items i WHERE i.po_number = h.po_number",
+  total_amount: 'SELECT COALESCE(SUM(i.extension), 0) FROM po_items i WHERE i.po_number = h.po_number'
+};
+
+function orderColumnExpression(column) {
+  if (ORDER_AGGREGATES[column]) {
+    return `(${ORDER_AGGREGATES[column]})`;
+  }
+  if (ORDER_TEXT_COLUMNS.includes(column)) {
+    return `h.${column}`;
   }
+  return null;
+}
 
-  let query = 'SELECT * FROM po_headers ORDER BY created_at DESC';
+function encodeOrderCursor(row, sort) {
+  return Buffer.from(JSON.stringify({ v: row[sort] ?? '', k: row.po_number })).toString('base64url');
+}
 
-  if (limit !== null) {
-    query += ` LIMIT ${parseInt(limit)} OFFSET ${parseInt(offset)}`;
+function decodeOrderCursor(cursor) {
+  try {
+    const decoded = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf-8'));
+    return decoded && 'v' in decoded && 'k' in decoded ? decoded : null;
+  } catch (error) {
+    return null;
+  }
+}
+
+/**
+ * Query POs with per-column filters, a sort order and a keyset cursor
+ * Filters are case-insensitive substring matches. Item count, quantity and
+ * amount totals are computed per PO through idx_po_items_po_number.
+ * @param {object} options
+ * @param {object} options.filters - Map of column name to filter text
+ * @param {string} options.sort - Column to sort by (default created_at)
+ * @param {string} options.direction - 'asc' or 'desc' (default desc)
+ * @param {string} options.cursor - nextCursor from the previous page
+ * @param {number} options.limit - Page size (default 100, max 1000)
+ */
+export function queryPOs({ filters = {}, sort = 'created_at', direction = 'desc', cursor = null, limit = 100 } = {}) {
+  try {
+    const sortColumn = orderColumnExpression(sort) ? sort : 'created_at';
+    const descending = String(direction).toLowerCase() !== 'asc';
+    const pageSize = Math.min(Math.max(parseInt(limit) || 100, 1), 1000);
+
+    const where = [];
+    const params = [];
+
+    for (const [column, value] of Object.entries(filters || {})) {
+      const expression = orderColumnExpression(column);
+      const text = String(value ?? '').trim();
+      if (!expression || text === '') continue;
+
+      // Escape LIKE wildcards so the filter matches literally, like the old client-side filter
+      where.push(`CAST(${expression} AS TEXT) LIKE ? ESCAPE '\\'`);
+      params.push(`%${text.replace(/[\\%_]/g, char => `\\${char}`)}%`);
+    }
+
+    // Total matching rows, before the cursor narrows to the next page
+    const countStmt = db.prepare(`SELECT COUNT(*) as count FROM po_headers h ${where.length > 0 ? `WHERE ${where.join(' AND ')}` : ''}`);
+    countStmt.bind(params);
+    countStmt.step();
+    const total = countStmt.getAsObject().count;
+    countStmt.free();
+
+    const sortExpression = ORDER_AGGREGATES[sortColumn]
+      ? orderColumnExpression(sortColumn)
+      : `COALESCE(h.${sortColumn}, '')`;
+    const comparator = descending ? '<' : '>';
+    const decodedCursor = cursor ? decodeOrderCursor(cursor) : null;
+
+    if (decodedCursor) {
+      where.push(`(${sortExpression} ${comparator} ? OR (${sortExpression} = ? AND h.po_number ${comparator} ?))`);
+      params.push(decodedCursor.v, decodedCursor.v, decodedCursor.k);
+    }
+
+    const order = descending ? 'DESC' : 'ASC';
+    const stmt = db.prepare(`
+      SELECT h.*,
+        (${ORDER_AGGREGATES.item_count}) AS item_count,
+        (${ORDER_AGGREGATES.total_qty}) AS total_qty,
+        (${ORDER_AGGREGATES.total_amount}) AS total_amount
+      FROM po_headers h
+      ${where.length > 0 ? `WHERE ${where.join(' AND ')}` : ''}
+      ORDER BY ${sortExpression} ${order}, h.po_number ${order}
+      LIMIT ${pageSize + 1}
+    `);
+    stmt.bind(params);
+
+    const orders = [];
+    while (stmt.step()) {
+      orders.push(stmt.getAsObject());
+    }
+    stmt.free();
+
+    // One extra row tells us whether another page exists
+    const hasMore = orders.length > pageSize;
+    if (hasMore) {
+      orders.pop();
+    }
+
+    return {
+      orders,
+      total,
+      nextCursor: hasMore ? encodeOrderCursor(orders[orders.length - 1], sortColumn) : null
+    };
+  } catch (error) {
+    throw new Error(`Failed to query POs: ${error.message}`);
   }
+}
 
-  const stmt = db.prepare(query);
-  const results = [];
+/**
+ * List-page fields of every stored PO, keyed by PO number (for the delta sync)
+ */
+export function getPOListSnapshot() {
+  const stmt = db.prepare(`
+    SELECT po_number, vendor_name, po_date, ship_by, ship_via, order_type, status, loc, prod_rep
+    FROM po_headers
+  `);
+
+  const snapshot = new Map();
+  while (stmt.step()) {
+    const row = stmt.getAsObject();
+    snapshot.set(row.po_number, row);
+  }
+
+  stmt.free();
+  return snapshot;
+}
+
+/**
+ * Record the start of a PO list delta sync run
+ * @param {string} trigger - 'schedule' or 'manual'
+ * @returns {number} Run id
+ */
+export function startPOSyncRun(trigger) {
+  try {
+    const stmt = db.prepare(`
+      INSERT INTO po_sync_runs (triggered_by, status, started_at)
+      VALUES (?, 'running', ?)
+    `);
+    stmt.run([trigger, new Date().toISOString()]);
+    stmt.free();
+
+    const idStmt = db.prepare('SELECT last_insert_rowid() as id');
+    idStmt.step();
+    const id = idStmt.getAsObject().id;
+    idStmt.free();
+
+    saveDatabase();
+    return id;
+  } catch (error) {
+    throw new Error(`Failed to record PO sync run: ${error.message}`);
+  }
+}
+
+/**
+ * Store the outcome of a PO list delta sync run
+ * @param {number} id - Run id from startPOSyncRun
+ * @param {object} run - status, counts, timings and error
+ */
+export function finishPOSyncRun(id, run) {
+  try {
+    const stmt = db.prepare(`
+      UPDATE po_sync_runs SET
+        status = ?, finished_at = ?, duration_ms = ?, list_rows = ?,
+        new_count = ?, changed_count = ?, fetched_count = ?, failed_count = ?,
+        list_duration_ms = ?, fetch_duration_ms = ?, error = ?
+      WHERE id = ?
+    `);
+    stmt.run([
+      run.status,
+      new Date().toISOString(),
+      run.durationMs ?? null,
+      run.listRows ?? null,
+      run.newCount ?? 0,
+      run.changedCount ?? 0,
+      run.fetchedCount ?? 0,
+      run.failedCount ?? 0,
+      run.listDurationMs ?? null,
+      run.fetchDurationMs ?? null,
+      run.error ?? null,
+      id
+    ]);
+    stmt.free();
+    saveDatabase();
+  } catch (error) {
+    throw new Error(`Failed to update PO sync run: ${error.message}`);
+  }
+}
 
+/**
+ * Most recent PO list delta sync runs, newest first
+ * @param {number} limit - Number of runs to return
+ */
+export function getPOSyncRuns(limit = 20) {
+  const stmt = db.prepare('SELECT * FROM po_sync_runs ORDER BY id DESC LIMIT ?');
+  stmt.bind([parseInt(limit) || 20]);
+
+  const results = [];
   while (stmt.step()) {
     results.push(stmt.getAsObject());
   }
@@ -445,32 +1113,71 @@ export function getAllPOs(limit = null, offset = 0) {
  * Get PO by number
  */
 export function getPOByNumber(poNumber) {
-  const stmt = db.prepare('SELECT * FROM po_headers WHERE po_number = ?');
-  stmt.bind([poNumber]);
+  return poHeaderCache.get(poNumber, () => {
+    const stmt = db.prepare('SELECT * FROM po_headers WHERE po_number = ?');
+    stmt.bind([poNumber]);
 
-  let result = null;
-  if (stmt.step()) {
-    result = stmt.getAsObject();
-  }
+    let result = null;
+    if (stmt.step()) {
+      result = stmt.getAsObject();
+    }
 
-  stmt.free();
-  return result;
+    stmt.free();
+    return result;
+  });
 }
 
 /**
  * Get PO items by PO number
  */
 export function getPOItems(poNumber) {
-  const stmt = db.prepare('SELECT * FROM po_items WHERE po_number = ? ORDER BY id');
+  return poItemsCache.get(poNumber, () => {
+    const stmt = db.prepare('SELECT * FROM po_items WHERE po_number = ? ORDER BY id');
+    stmt.bind([poNumber]);
+
+    const results = [];
+    while (stmt.step()) {
+      results.push(stmt.getAsObject());
+    }
+
+    stmt.free();
+    return results;
+  });
+}
+
+/**
+ * Get a PO's number, date and items with each item's internal_seq ("N/A" when untracked)
+ * Served from cache until the PO is written again
+ * @param {string} poNumber - PO number
+ * @returns {object|null} { po_number, po_date, items } or null when the PO doesn't exist
+ */
+export function getPODisplay(poNumber) {
+  return poDisplayCache.get(poNumber, () => loadPODisplay(poNumber));
+}
+
+function loadPODisplay(poNumber) {
+  const po = getPOByNumber(poNumber);
+  if (!po) {
+    return null;
+  }
+
+  const stmt = db.prepare(`
+    SELECT pi.*, COALESCE(
+      (SELECT MIN(i.internal_seq) FROM items i WHERE i.item_key = pi.item_number), 'N/A'
+    ) AS internal_seq
+    FROM po_items pi
+    WHERE pi.po_number = ?
+    ORDER BY pi.id
+  `);
   stmt.bind([poNumber]);
 
-  const results = [];
+  const items = [];
   while (stmt.step()) {
-    results.push(stmt.getAsObject());
+    items.push(stmt.getAsObject());
   }
-
   stmt.free();
-  return results;
+
+  return { po_number: po.po_number, po_date: po.po_date, items };
 }
 
 /**
@@ -489,6 +1196,50 @@ export function getDownloadHistory(poNumber) {
   return results;
 }
 
+function parseTraceRow(row) {
+  return { ...row, trace: row.trace ? JSON.parse(row.trace) : [] };
+}
+
+/**
+ * Get the recorded scrape runs (with span traces) for a PO, newest first
+ * @param {string} poNumber - PO number
+ * @param {number} limit - Maximum number of runs to return
+ */
+export function getPOTraces(poNumber, limit = 20) {
+  const stmt = db.prepare(`
+    SELECT * FROM download_history
+    WHERE po_number = ? AND trace IS NOT NULL
+    ORDER BY id DESC
+    LIMIT ?
+  `);
+  stmt.bind([poNumber, limit]);
+
+  const results = [];
+  while (stmt.step()) {
+    results.push(parseTraceRow(stmt.getAsObject()));
+  }
+
+  stmt.free();
+  return results;
+}
+
+/**
+ * Get a single recorded scrape run by download_history id
+ * @param {number} id - download_history id
+ */
+export function getTraceById(id) {
+  const stmt = db.prepare('SELECT * FROM download_history WHERE id = ?');
+  stmt.bind([id]);
+
+  let result = null;
+  if (stmt.step()) {
+    result = parseTraceRow(stmt.getAsObject());
+  }
+
+  stmt.free();
+  return result;
+}
+
 /**
  * Search POs
  */
@@ -535,6 +1286,10 @@ export function deletePO(poNumber) {
     headerStmt.bind([poNumber]);
     headerStmt.step();
     headerStmt.free();
+    poHeaderCache.delete(poNumber);
+    poItemsCache.delete(poNumber);
+    poDisplayCache.delete(poNumber);
+    poListCache.clear();
 
     saveDatabase();
     return true;
@@ -552,6 +1307,10 @@ export function deleteAllPOs() {
     db.run('DELETE FROM po_items');
     db.run('DELETE FROM download_history');
     db.run('DELETE FROM po_headers');
+    poHeaderCache.clear();
+    poItemsCache.clear();
+    poDisplayCache.clear();
+    poListCache.clear();
     saveDatabase();
     return true;
   } catch (error) {
@@ -577,11 +1336,12 @@ export function saveMessage(messageData) {
   try {
     const now = new Date().toISOString();
 
+    // Bodies are stored compressed; full_details stays NULL for new rows
     const stmt = db.prepare(`
       INSERT OR REPLACE INTO messages (
-        ref_number, author, received_date, subject, comment, full_details, message_link, comment_id,
-        created_at, updated_at
-      ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ref_number, author, received_date, subject, comment, full_details, full_details_compressed,
+        message_link, comment_id, created_at, updated_at
+      ) VALUES (?, ?, ?, ?, ?, NULL, ?, ?, ?, ?, ?)
     `);
 
     stmt.run([
@@ -590,7 +1350,7 @@ export function saveMessage(messageData) {
       messageData.receivedDate,
       messageData.subject,
       messageData.comment,
-      messageData.fullDetails,
+      compressText(messageData.fullDetails),
       messageData.messageLink || null,
       messageData.commentId || null,
       now,
@@ -606,10 +1366,24 @@ export function saveMessage(messageData) {
 }
 
 /**
- * Get all messages
+ * Get message list rows (without bodies) with optional pagination
+ * @param {number} limit - Maximum number of records to return (optional)
+ * @param {number} offset - Number of records to skip (optional)
  */
-export function getAllMessages() {
-  const stmt = db.prepare('SELECT * FROM messages ORDER BY received_date DESC');
+export function getAllMessages(limit = null, offset = 0) {
+  const query = `
+    SELECT id, ref_number, author, received_date, subject, comment, message_link, comment_id,
+           created_at, updated_at,
+           (full_details_compressed IS NOT NULL OR full_details IS NOT NULL) AS has_details
+    FROM messages
+    ORDER BY received_date DESC
+  `;
+
+  const stmt = db.prepare(limit !== null ? `${query} LIMIT ? OFFSET ?` : query);
+  if (limit !== null) {
+    stmt.bind([limit, offset]);
+  }
+
   const results = [];
 
   while (stmt.step()) {
@@ -620,6 +1394,93 @@ export function getAllMessages() {
   return results;
 }
 
+/**
+ * Count stored messages
+ */
+export function countMessages() {
+  const stmt = db.prepare('SELECT COUNT(*) as count FROM messages');
+  stmt.step();
+  const count = stmt.getAsObject().count;
+  stmt.free();
+  return count;
+}
+
+/**
+ * Get a single message with its decompressed body
+ */
+export function getMessageById(id) {
+  const stmt = db.prepare('SELECT * FROM messages WHERE id = ?');
+  stmt.bind([id]);
+
+  let result = null;
+  if (stmt.step()) {
+    const row = stmt.getAsObject();
+    const { full_details_compressed, ...message } = row;
+    result = {
+      ...message,
+      full_details: full_details_compressed ? decompressText(full_details_compressed) : message.full_details
+    };
+  }
+
+  stmt.free();
+  return result;
+}
+
+/**
+ * Check whether a message is already stored
+ * Matches on ref_number, and on comment_id too when one is known
+ */
+export function messageExists(refNumber, commentId = null) {
+  const stmt = commentId
+    ? db.prepare('SELECT 1 FROM messages WHERE ref_number = ? AND (comment_id = ? OR comment_id IS NULL) LIMIT 1')
+    : db.prepare('SELECT 1 FROM messages WHERE ref_number = ? LIMIT 1');
+  stmt.bind(commentId ? [refNumber, commentId] : [refNumber]);
+
+  const exists = stmt.step();
+  stmt.free();
+  return exists;
+}
+
+/**
+ * Get a sync state value (stored as JSON) by key
+ */
+export function getSyncState(key) {
+  const stmt = db.prepare('SELECT value, updated_at FROM sync_state WHERE key = ?');
+  stmt.bind([key]);
+
+  let result = null;
+  if (stmt.step()) {
+    const row = stmt.getAsObject();
+    try {
+      result = { ...JSON.parse(row.value), updatedAt: row.updated_at };
+    } catch (error) {
+      console.error(`Invalid sync state for ${key}:`, error);
+    }
+  }
+
+  stmt.free();
+  return result;
+}
+
+/**
+ * Save a sync state value (stored as JSON) by key
+ */
+export function setSyncState(key, value) {
+  try {
+    const stmt = db.prepare(`
+      INSERT OR REPLACE INTO sync_state (key, value, updated_at)
+      VALUES (?, ?, ?)
+    `);
+
+    stmt.run([key, JSON.stringify(value), new Date().toISOString()]);
+    stmt.free();
+    saveDatabase();
+  } catch (error) {
+    console.error('Error saving sync state:', error);
+    throw new Error(`Failed to save sync state: ${error.message}`);
+  }
+}
+
 /**
  * Delete a single message by ID
  */
@@ -657,57 +1518,82 @@ export function deleteAllMessages() {
  */
 export function trackItem(itemNumber) {
   try {
-    if (!itemNumber || itemNumber.trim() === '') {
-      return;
+    if (insertTrackedItem(itemNumber)) {
+      saveDatabase();
     }
+  } catch (error) {
+    console.error('Error tracking item:', error);
+  }
+}
 
-    const now = new Date().toISOString();
-    let item_1, suffix;
-
-    // Split by "-" to get prefix and suffix
-    const parts = itemNumber.split('-');
-    if (parts.length > 1) {
-      item_1 = parts[0];
-      suffix = parts.slice(1).join('-'); // Join remaining parts in case there are multiple "-"
-    } else {
-      item_1 = itemNumber;
-      suffix = null;
-    }
+/**
+ * Add an item number to the items table without writing to disk
+ * @returns {boolean} Whether a new item was added
+ */
+function insertTrackedItem(itemNumber) {
+  if (!itemNumber || itemNumber.trim() === '') {
+    return false;
+  }
 
-    // Get the next internal_seq number
-    const maxSeqStmt = db.prepare(`
-      SELECT internal_seq FROM items
-      WHERE internal_seq IS NOT NULL
-      ORDER BY internal_seq DESC
-      LIMIT 1
-    `);
+  // UNIQUE(item_1, suffix) doesn't stop repeats when suffix is NULL, so check first
+  const existsStmt = db.prepare('SELECT 1 FROM items WHERE item_key = ? LIMIT 1');
+  existsStmt.bind([itemNumber]);
+  const exists = existsStmt.step();
+  existsStmt.free();
+  if (exists) {
+    return false;
+  }
 
-    let nextSeqNum = 1;
-    if (maxSeqStmt.step()) {
-      const maxSeq = maxSeqStmt.getAsObject().internal_seq;
-      if (maxSeq) {
-        // Extract number from ITEM0000001 format
-        const currentNum = parseInt(maxSeq.replace('ITEM', ''), 10);
-        nextSeqNum = currentNum + 1;
-      }
+  const now = new Date().toISOString();
+  let item_1, suffix;
+
+  // Split by "-" to get prefix and suffix
+  const parts = itemNumber.split('-');
+  if (parts.length > 1) {
+    item_1 = parts[0];
+    suffix = parts.slice(1).join('-'); // Join remaining parts in case there are multiple "-"
+  } else {
+    item_1 = itemNumber;
+    suffix = null;
+  }
+
+  // Get the next internal_seq number
+  const maxSeqStmt = db.prepare(`
+    SELECT internal_seq FROM items
+    WHERE internal_seq IS NOT NULL
+    ORDER BY internal_seq DESC
+    LIMIT 1
+  `);
+
+  let nextSeqNum = 1;
+  if (maxSeqStmt.step()) {
+    const maxSeq = maxSeqStmt.getAsObject().internal_seq;
+    if (maxSeq) {
+      // Extract number from ITEM0000001 format
+      const currentNum = parseInt(maxSeq.replace('ITEM', ''), 10);
+      nextSeqNum = currentNum + 1;
     }
-    maxSeqStmt.free();
+  }
+  maxSeqStmt.free();
 
-    // Format as ITEM0000001
-    const internal_seq = `ITEM${String(nextSeqNum).padStart(7, '0')}`;
+  // Format as ITEM0000001
+  const internal_seq = `ITEM${String(nextSeqNum).padStart(7, '0')}`;
 
-    // Insert or ignore if already exists (UNIQUE constraint)
-    const stmt = db.prepare(`
-      INSERT OR IGNORE INTO items (item_1, suffix, internal_seq, created_at)
-      VALUES (?, ?, ?, ?)
-    `);
+  // Insert or ignore if already exists (UNIQUE constraint)
+  const stmt = db.prepare(`
+    INSERT OR IGNORE INTO items (item_1, suffix, internal_seq, item_key, created_at)
+    VALUES (?, ?, ?, ?, ?)
+  `);
 
-    stmt.run([item_1, suffix, internal_seq, now]);
-    stmt.free();
-    saveDatabase();
-  } catch (error) {
-    console.error('Error tracking item:', error);
+  stmt.run([item_1, suffix, internal_seq, itemNumber, now]);
+  stmt.free();
+
+  // A new internal_seq can fill in lines of any PO
+  const added = db.getRowsModified() > 0;
+  if (added) {
+    poDisplayCache.clear();
   }
+  return added;
 }
 
 /**
@@ -742,6 +1628,7 @@ export function rebuildItemsTable() {
   try {
     // Clear existing items
     db.run('DELETE FROM items');
+    poDisplayCache.clear();
 
     // Get all unique item numbers from po_items
     const stmt = db.prepare(`
@@ -770,60 +1657,95 @@ export function rebuildItemsTable() {
   }
 }
 
+const ITEM_DETAIL_FIELDS = [
+  'brand_name', 'machine_number', 'machine_opening', 'pattern_name', 'pattern_writer',
+  'dragon_head', 'machine_density', 'pattern_density', 'total_length_mm', 'skirt_opening',
+  'actual_length', 'width_mm', 'x_coordinate', 'y_coordinate', 'picks', 'cut_per_group',
+  'total_cut', 'total_assembly', 'schedule_progress', 'actual_cut'
+];
+
+/**
+ * Prepare the statements used to upsert item details
+ * Update-then-insert instead of INSERT OR REPLACE: a NULL suffix never conflicts
+ * on UNIQUE(item_1, suffix), and created_at is kept without a lookup per row
+ */
+function prepareItemDetailsUpsert() {
+  return {
+    update: db.prepare(`
+      UPDATE item_details
+      SET ${ITEM_DETAIL_FIELDS.map(field => `${field} = ?`).join(', ')}, updated_at = ?
+      WHERE item_1 = ? AND suffix IS ?
+    `),
+    insert: db.prepare(`
+      INSERT INTO item_details (
+        item_1, suffix, ${ITEM_DETAIL_FIELDS.join(', ')}, created_at, updated_at
+      ) VALUES (${new Array(ITEM_DETAIL_FIELDS.length + 4).fill('?').join(', ')})
+    `),
+    free() {
+      this.update.free();
+      this.insert.free();
+    }
+  };
+}
+
+function upsertItemDetails(statements, detailsData, now) {
+  const suffix = detailsData.suffix || null;
+  const values = ITEM_DETAIL_FIELDS.map(field => detailsData[field] || '');
+
+  statements.update.run([...values, now, detailsData.item_1, suffix]);
+  if (db.getRowsModified() === 0) {
+    statements.insert.run([detailsData.item_1, suffix, ...values, now, now]);
+  }
+  itemDetailsCache.delete(itemDetailsKey(detailsData.item_1, suffix));
+}
+
 /**
  * Save or update item details
+ * @param {object} detailsData - Item details (item_1, suffix and the detail fields)
  */
 export function saveItemDetails(detailsData) {
   try {
-    const now = new Date().toISOString();
+    const statements = prepareItemDetailsUpsert();
+    upsertItemDetails(statements, detailsData, new Date().toISOString());
+    statements.free();
+    saveDatabase();
 
-    const stmt = db.prepare(`
-      INSERT OR REPLACE INTO item_details (
-        item_1, suffix, brand_name, machine_number, machine_opening,
-        pattern_name, pattern_writer, dragon_head, machine_density,
-        pattern_density, total_length_mm, skirt_opening, actual_length,
-        width_mm, x_coordinate, y_coordinate, picks, cut_per_group,
-        total_cut, total_assembly, schedule_progress, actual_cut,
-        created_at, updated_at
-      ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                COALESCE((SELECT created_at FROM item_details WHERE item_1 = ? AND suffix IS ?), ?), ?)
-    `);
+    return { success: true, message: 'Item details saved successfully' };
+  } catch (error) {
+    console.error('Error saving item details:', error);
+    throw new Error(`Failed to save item details: ${error.message}`);
+  }
+}
 
-    stmt.run([
-      detailsData.item_1,
-      detailsData.suffix || null,
-      detailsData.brand_name || '',
-      detailsData.machine_number || '',
-      detailsData.machine_opening || '',
-      detailsData.pattern_name || '',
-      detailsData.pattern_writer || '',
-      detailsData.dragon_head || '',
-      detailsData.machine_density || '',
-      detailsData.pattern_density || '',
-      detailsData.total_length_mm || '',
-      detailsData.skirt_opening || '',
-      detailsData.actual_length || '',
-      detailsData.width_mm || '',
-      detailsData.x_coordinate || '',
-      detailsData.y_coordinate || '',
-      detailsData.picks || '',
-      detailsData.cut_per_group || '',
-      detailsData.total_cut || '',
-      detailsData.total_assembly || '',
-      detailsData.schedule_progress || '',
-      detailsData.actual_cut || '',
-      detailsData.item_1,
-      detailsData.suffix || null,
-      now,
-      now
-    ]);
+/**
+ * Save or update details for many items in one transaction and one database write
+ * @param {Array<object>} detailsList - Item details (item_1, suffix and the detail fields)
+ */
+export function saveItemDetailsBatch(detailsList) {
+  let statements = null;
+  let inTransaction = false;
+  try {
+    const now = new Date().toISOString();
+    statements = prepareItemDetailsUpsert();
 
-    stmt.free();
+    db.run('BEGIN TRANSACTION');
+    inTransaction = true;
+    detailsList.forEach(detailsData => upsertItemDetails(statements, detailsData, now));
+    db.run('COMMIT');
+    inTransaction = false;
+
+    statements.free();
     saveDatabase();
 
-    return { success: true, message: 'Item details saved successfully' };
+    return { success: true, saved: detailsList.length };
   } catch (error) {
-    console.error('Error saving item details:', error);
+    if (inTransaction) {
+      db.run('ROLLBACK');
+    }
+    if (statements) {
+      statements.free();
+    }
+    console.error('Error saving item details batch:', error);
     throw new Error(`Failed to save item details: ${error.message}`);
   }
 }
@@ -833,22 +1755,60 @@ export function saveItemDetails(detailsData) {
  */
 export function getItemDetails(item_1, suffix) {
   try {
-    const stmt = db.prepare(`
-      SELECT * FROM item_details
-      WHERE item_1 = ? AND suffix IS ?
-    `);
+    return itemDetailsCache.get(itemDetailsKey(item_1, suffix), () => {
+      const stmt = db.prepare(`
+        SELECT * FROM item_details
+        WHERE item_1 = ? AND suffix IS ?
+      `);
 
-    stmt.bind([item_1, suffix || null]);
+      stmt.bind([item_1, suffix || null]);
 
-    let result = null;
-    if (stmt.step()) {
-      result = stmt.getAsObject();
-    }
+      let result = null;
+      if (stmt.step()) {
+        result = stmt.getAsObject();
+      }
 
-    stmt.free();
-    return result;
+      stmt.free();
+      return result;
+    });
   } catch (error) {
     console.error('Error getting item details:', error);
     return null;
   }
 }
+
+// Pairs per lookup query (two bound parameters each, well under SQLite's limit)
+const ITEM_DETAILS_LOOKUP_CHUNK = 400;
+
+/**
+ * Get details for many (item_1, suffix) pairs
+ * @param {Array<object>} keys - [{ item_1, suffix }]
+ * @returns {Array<object|null>} Details per key, in the order requested (null when missing)
+ */
+export function getItemDetailsBatch(keys) {
+  try {
+    const found = new Map();
+    const keyOf = (item_1, suffix) => `${item_1}\u0000${suffix ?? ''}`;
+
+    for (let start = 0; start < keys.length; start += ITEM_DETAILS_LOOKUP_CHUNK) {
+      const chunk = keys.slice(start, start + ITEM_DETAILS_LOOKUP_CHUNK);
+      const stmt = db.prepare(`
+        WITH wanted(item_1, suffix) AS (VALUES ${chunk.map(() => '(?, ?)').join(', ')})
+        SELECT d.* FROM wanted w
+        JOIN item_details d ON d.item_1 = w.item_1 AND d.suffix IS w.suffix
+      `);
+      stmt.bind(chunk.flatMap(key => [key.item_1, key.suffix || null]));
+
+      while (stmt.step()) {
+        const row = stmt.getAsObject();
+        found.set(keyOf(row.item_1, row.suffix), row);
+      }
+      stmt.free();
+    }
+
+    return keys.map(key => found.get(keyOf(key.item_1, key.suffix || null)) || null);
+  } catch (error) {
+    console.error('Error getting item details batch:', error);
+    throw new Error(`Failed to get item details: ${error.message}`);
+  }
+}
@@ -0,0 +1,201 @@
+import fs from 'fs';
+import path from 'path';
+import zlib from 'zlib';
+import crypto from 'crypto';
+
+// Responses smaller than this are sent as-is; compressing them costs more than it saves
+const COMPRESSION_THRESHOLD = 1024;
+const COMPRESSIBLE_TYPES = /json|text|javascript|css|html|xml|svg/i;
+
+const CONTENT_TYPES = {
+  '.html': 'text/html; charset=utf-8',
+  '.js': 'application/javascript; charset=utf-8',
+  '.css': 'text/css; charset=utf-8',
+  '.json': 'application/json; charset=utf-8',
+  '.svg': 'image/svg+xml',
+  '.png': 'image/png',
+  '.jpg': 'image/jpeg',
+  '.ico': 'image/x-icon'
+};
+
+const IMMUTABLE_CACHE = 'public, max-age=31536000, immutable';
+
+/**
+ * Pick the best content encoding the client accepts (br preferred over gzip)
+ * @param {object} req - Express request
+ */
+function negotiateEncoding(req) {
+  const encoding = req.acceptsEncodings('br', 'gzip');
+  return encoding === 'br' || encoding === 'gzip' ? encoding : null;
+}
+
+function compressBuffer(encoding, buffer, callback) {
+  if (encoding === 'br') {
+    zlib.brotliCompress(buffer, {
+      params: {
+        [zlib.constants.BROTLI_PARAM_QUALITY]: 4,
+        [zlib.constants.BROTLI_PARAM_SIZE_HINT]: buffer.length
+      }
+    }, callback);
+  } else {
+    zlib.gzip(buffer, { level: 6 }, callback);
+  }
+}
+
+/**
+ * Middleware that gzip/brotli-compresses text bodies sent through res.send / res.json
+ * Streamed responses (express.static, res.sendFile) pass through untouched
+ */
+export function compressResponses() {
+  return (req, res, next) => {
+    const originalSend = res.send;
+
+    res.send = function (body) {
+      if (typeof body !== 'string' && !Buffer.isBuffer(body)) {
+        return originalSend.call(this, body);
+      }
+
+      // Mirror express' own default so the type survives sending a Buffer
+      if (typeof body === 'string' && !this.get('Content-Type')) {
+        this.type('html');
+      }
+
+      const buffer = typeof body === 'string' ? Buffer.from(body) : body;
+      const contentType = this.get('Content-Type') || '';
+      const encoding = negotiateEncoding(req);
+
+      this.vary('Accept-Encoding');
+
+      if (!encoding ||
+          buffer.length < COMPRESSION_THRESHOLD ||
+          !COMPRESSIBLE_TYPES.test(contentType) ||
+          this.get('Content-Encoding') ||
+          this.statusCode === 204 || this.statusCode === 304) {
+        return originalSend.call(this, body);
+      }
+
+      compressBuffer(encoding, buffer, (error, compressed) => {
+        if (error) {
+          originalSend.call(res, body);
+          return;
+        }
+        res.set('Content-Encoding', encoding);
+        originalSend.call(res, compressed);
+      });
+
+      return this;
+    };
+
+    next();
+  };
+}
+
+/**
+ * Middleware that validates list endpoints against the database change counter
+ * The ETag only depends on the data version and the request URL, so a matching
+ * If-None-Match is answered with 304 before any query runs
+ * @param {Function} getVersion - Returns the current database data version
+ */
+export function dataETag(getVersion) {
+  return (req, res, next) => {
+    const hash = crypto.createHash('sha1')
+      .update(`${getVersion()}:${req.originalUrl}`)
+      .digest('base64url');
+
+    res.set('ETag', `W/"${hash}"`);
+    res.set('Cache-Control', 'no-cache');
+
+    if (req.fresh) {
+      return res.status(304).end();
+    }
+
+    next();
+  };
+}
+
+function buildAsset(body, contentType) {
+  const compressible = COMPRESSIBLE_TYPES.test(contentType);
+  return {
+    body,
+    contentType,
+    etag: `"${crypto.createHash('sha256').update(body).digest('hex').slice(0, 16)}"`,
+    gzip: compressible ? zlib.gzipSync(body, { level: 9 }) : null,
+    br: compressible ? zlib.brotliCompressSync(body, {
+      params: { [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY }
+    }) : null
+  };
+}
+
+/**
+ * Serve the top-level files in public/ from memory with fingerprinted URLs
+ * app.js becomes app.<hash>.js (cached for a year, immutable); index.html is
+ * rewritten to reference the fingerprinted names and always revalidated.
+ * Assets are read and pre-compressed once at startup.
+ * @param {string} publicDir - Folder holding the static frontend
+ */
+export function fingerprintedAssets(publicDir) {
+  const routes = new Map();
+  const fingerprints = new Map();
+  const files = fs.readdirSync(publicDir).filter(name => fs.statSync(path.join(publicDir, name)).isFile());
+
+  for (const name of files) {
+    if (name === 'index.html') continue;
+
+    const body = fs.readFileSync(path.join(publicDir, name));
+    const ext = path.extname(name);
+    const hash = crypto.createHash('sha256').update(body).digest('hex').slice(0, 10);
+    const fingerprinted = `${path.basename(name, ext)}.${hash}${ext}`;
+    const asset = buildAsset(body, CONTENT_TYPES[ext] || 'application/octet-stream');
+
+    fingerprints.set(name, fingerprinted);
+    routes.set(`/${fingerprinted}`, { ...asset, cacheControl: IMMUTABLE_CACHE });
+    // Unversioned URL still works for anything that links to it directly
+    routes.set(`/${name}`, { ...asset, cacheControl: 'no-cache' });
+  }
+
+  const indexPath = path.join(publicDir, 'index.html');
+  if (fs.existsSync(indexPath)) {
+    const html = fs.readFileSync(indexPath, 'utf-8').replace(
+      /(src|href)="([^"/:]+)"/g,
+      (match, attr, name) => fingerprints.has(name) ? `${attr}="${fingerprints.get(name)}"` : match
+    );
+    const asset = { ...buildAsset(Buffer.from(html), CONTENT_TYPES['.html']), cacheControl: 'no-cache' };
+    routes.set('/', asset);
+    routes.set('/index.html', asset);
+  }
+
+  console.log(`✓ Fingerprinted ${fingerprints.size} static asset(s)`);
+
+  return (req, res, next) => {
+    if (req.method !== 'GET' && req.method !== 'HEAD') {
+      return next();
+    }
+
+    const asset = routes.get(req.path);
+    if (!asset) {
+      return next();
+    }
+
+    res.set('Content-Type', asset.contentType);
+    res.set('Cache-Control', asset.cacheControl);
+    res.set('ETag', asset.etag);
+    res.vary('Accept-Encoding');
+
+    if (req.fresh) {
+      return res.status(304).end();
+    }
+
+    const encoding = asset.gzip ? negotiateEncoding(req) : null;
+    const body = encoding ? asset[encoding] : asset.body;
+
+    if (encoding) {
+      res.set('Content-Encoding', encoding);
+    }
+    res.set('Content-Length', String(body.length));
+
+    if (req.method === 'HEAD') {
+      return res.end();
+    }
+    res.end(body);
+  };
+}
@@ -2,7 +2,12 @@ import { chromium } from 'playwright';
 import fs from 'fs';
 import path from 'path';
 import { fileURLToPath } from 'url';
-import { initDatabase, savePOHeader, savePOItem, saveDownloadHistory, saveMessage } from './database.js';
+import { initDatabase, savePOHeader, savePOItems, saveDownloadHistory, saveMessage } from './database.js';
+import { loadManifest, saveManifest, isLocalCopyIntact, getConditionalHeaders, hashBuffer } from './artwork-manifest.js';
+import { getJournalPath, readJournal, openJournal, isFinished, createProgress } from './batch-journal.js';
+import { loadSession, saveSession, clearSession } from './session-store.js';
+import { createThrottle, checkResponse } from './request-throttle.js';
+import { readPOListRows, findPOListRow, readPOHeader, readPOItems, readItemLinks, readArtworkUrl, readMessageRows, PO_DETAIL_EXTRACTOR } from './page-extractors.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
@@ -12,13 +17,327 @@ function loadConfig() {
   return JSON.parse(fs.readFileSync(path.join(__dirname, 'config.json'), 'utf-8'));
 }
 
+// Default resource blocking profile. "resource_blocking" in config.json only needs the
+// keys to change (e.g. { "enabled": false }); each key given replaces its default whole,
+// so a list set there must repeat any default entries it should keep.
+// The extractors only read server-rendered DOM, so images, fonts and media are dropped
+// everywhere except on pages whose rules allow them back (e.g. the login button and
+// the frame menus, which need their images to be clickable/hoverable). The artwork
+// link on ItemDetail.aspx is read from its onclick attribute and the file is fetched
+// through the request context, so it is never affected by route blocking.
+// Page rules may also list allow_url_patterns to keep specific resources.
+const DEFAULT_RESOURCE_BLOCKING = {
+  enabled: true,
+  wait_until: 'domcontentloaded',
+  blocked_resource_types: ['image', 'font', 'media'],
+  blocked_url_patterns: [
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'hotjar.com'
+  ],
+  page_rules: [
+    { match: 'login.aspx', allow_resource_types: ['image'] },
+    { match: 'mnuSetup.aspx', allow_resource_types: ['image'] },
+    { match: 'factoryPODetail.aspx', block_resource_types: ['stylesheet'] },
+    { match: 'ItemDetail.aspx', block_resource_types: ['stylesheet'] }
+  ]
+};
+
+/**
+ * Merge the configured resource blocking profile over the defaults
+ * @param {object} config - Loaded config.json
+ */
+function resolveResourceProfile(config) {
+  return { ...DEFAULT_RESOURCE_BLOCKING, ...(config.resource_blocking || {}) };
+}
+
+/**
+ * Decide whether a request should be blocked under the given profile
+ * Documents are never blocked; page rules are matched against the URL of the
+ * frame that issued the request
+ * @param {object} profile - Resolved resource blocking profile
+ * @param {string} resourceType - Playwright resource type (image, font, stylesheet, ...)
+ * @param {string} url - Requested URL
+ * @param {string} pageUrl - URL of the frame issuing the request
+ */
+function shouldBlockRequest(profile, resourceType, url, pageUrl) {
+  if (!profile.enabled || resourceType === 'document') {
+    return false;
+  }
+
+  const rules = (profile.page_rules || []).filter(rule => pageUrl && pageUrl.includes(rule.match));
+
+  if (rules.some(rule => (rule.allow_url_patterns || []).some(pattern => url.includes(pattern)))) {
+    return false;
+  }
+
+  if ((profile.blocked_url_patterns || []).some(pattern => url.includes(pattern))) {
+    return true;
+  }
+
+  if (rules.some(rule => (rule.block_resource_types || []).includes(resourceType))) {
+    return true;
+  }
+
+  if (rules.some(rule => (rule.allow_resource_types || []).includes(resourceType))) {
+    return false;
+  }
+
+  return (profile.blocked_resource_types || []).includes(resourceType);
+}
+
+/**
+ * Run an async function over items with at most `limit` calls in flight
+ * @param {Array} items - Items to process
+ * @param {number} limit - Maximum concurrent calls
+ * @param {Function} fn - Async function called with (item, index)
+ */
+async function mapWithConcurrency(items, limit, fn) {
+  const results = new Array(items.length);
+  let nextIndex = 0;
+
+  const worker = async () => {
+    while (nextIndex < items.length) {
+      const index = nextIndex++;
+      results[index] = await fn(items[index], index);
+    }
+  };
+
+  const workers = Array.from({ length: Math.min(limit, items.length) }, () => worker());
+  await Promise.all(workers);
+  return results;
+}
+
+/**
+ * Parse a Received column value like "1/30/26 22:25" into a Date
+ * @param {string} value - Received date text from the message table
+ * @returns {Date|null} Parsed date (local time), or null if unrecognised
+ */
+function parseReceivedDate(value) {
+  const match = (value || '').trim().match(/^(\d{1,2})\/(\d{1,2})\/(\d{2,4})(?:\s+(\d{1,2}):(\d{2})(?::(\d{2}))?\s*([AP]M)?)?/i);
+  if (!match) {
+    return null;
+  }
+
+  const [, month, day, yearText, hourText = '0', minute = '0', second = '0', meridiem] = match;
+  const year = yearText.length === 2 ? 2000 + parseInt(yearText, 10) : parseInt(yearText, 10);
+  let hour = parseInt(hourText, 10);
+  if (meridiem) {
+    hour = (hour % 12) + (meridiem.toUpperCase() === 'PM' ? 12 : 0);
+  }
+
+  return new Date(year, parseInt(month, 10) - 1, parseInt(day, 10), hour, parseInt(minute, 10), parseInt(second, 10));
+}
+
 class EBrandIDDownloader {
-  constructor() {
+  /**
+   * @param {object} options
+   * @param {object} options.store - Persistence functions (savePOHeader, savePOItems, saveDownloadHistory),
+   *                                 defaults to database.js; scrape workers pass an IPC-backed store
+   * @param {Function} options.onStepTiming - Called with { step, duration } after every timed step
+   */
+  constructor(options = {}) {
+    this.store = options.store || { savePOHeader, savePOItems, saveDownloadHistory };
+    this.onStepTiming = options.onStepTiming || null;
     this.browser = null;
     this.page = null;
     this.context = null;
     this.downloadResults = [];
     this.config = null;
+    this.stepTimings = [];
+    this.resourceProfile = null;
+    this.sessionRestored = false;
+    this.throttle = null;
+    this.blockedRequestCount = 0;
+    this.messageDetailUrlTemplate = null;
+  }
+
+  /**
+   * Run one scrape step and record it as a span in the current PO trace
+   * The span is passed to fn, which may fill in bytes and retries
+   * @param {string} step - Step name (e.g. "navigate:po-list")
+   * @param {Function} fn - Async function performing the step
+   * @param {object} attributes - Extra span fields (e.g. { item: "1234" })
+   */
+  async timeStep(step, fn, attributes = {}) {
+    const start = Date.now();
+    const span = { step, start: new Date(start).toISOString(), duration: 0, bytes: 0, retries: 0, ...attributes };
+    try {
+      return await fn(span);
+    } catch (error) {
+      span.error = error.message;
+      throw error;
+    } finally {
+      span.duration = Date.now() - start;
+      this.stepTimings.push(span);
+      console.log(`  ⏱ ${step}: ${span.duration} ms`);
+      if (this.onStepTiming) {
+        this.onStepTiming({ step, duration: span.duration });
+      }
+    }
+  }
+
+  /**
+   * Run a timed step that makes requests to e-brandid through the shared throttle
+   * Transient failures are retried with backoff; the span records how many retries it took
+   * @param {string} step - Step name (e.g. "navigate:po-detail")
+   * @param {Function} fn - Async function performing one attempt of the step
+   * @param {object} attributes - Extra span fields (e.g. { item: "1234" })
+   */
+  async requestStep(step, fn, attributes = {}) {
+    return this.timeStep(step, (span) => this.throttle.run(() => fn(span), {
+      onRetry: (attempt, error, delay) => {
+        span.retries = attempt;
+        console.log(`  ↻ ${step} failed (${error.message}), retry ${attempt}/${this.throttle.maxRetries} in ${delay} ms`);
+      }
+    }), attributes);
+  }
+
+  /**
+   * Retries needed by the steps recorded for the current PO
+   * @param {Array} timings - Spans of the run
+   */
+  countRetries(timings) {
+    return timings.reduce((sum, timing) => sum + (timing.retries || 0), 0);
+  }
+
+  /**
+   * Start a fresh set of step timings (one set per PO)
+   */
+  resetStepTimings() {
+    this.stepTimings = [];
+    return this.stepTimings;
+  }
+
+  /**
+   * Total time spent in the recorded steps for the current PO
+   */
+  totalStepTime() {
+    return this.stepTimings.reduce((sum, timing) => sum + timing.duration, 0);
+  }
+
+  /**
+   * Store a PO's scraped line items, writing only the lines that changed
+   * @param {string} poNumber - Purchase Order number
+   * @param {Array} poItems - Items from the PO detail page
+   * @returns {object} { inserted, updated, deleted, unchanged }
+   */
+  async savePOItems(poNumber, poItems) {
+    const changes = await this.store.savePOItems(poNumber, poItems);
+    console.log(`✓ ${poItems.length} line items saved to database ` +
+      `(${changes.inserted} new, ${changes.updated} updated, ${changes.deleted} removed, ${changes.unchanged} unchanged)`);
+    return changes;
+  }
+
+  /**
+   * Store the outcome of a PO run together with its span trace in download_history
+   * @param {string} operation - "download" or "fetch-po"
+   * @param {object} result - Result object of the run (its timings are the trace)
+   * @param {number} startedAt - Run start time (ms since epoch)
+   */
+  saveRunHistory(operation, result, startedAt) {
+    try {
+      this.store.saveDownloadHistory({
+        poNumber: result.poNumber,
+        operation: operation,
+        filesDownloaded: result.filesDownloaded || 0,
+        totalSize: result.totalSize || 0,
+        status: result.status,
+        durationMs: Date.now() - startedAt,
+        trace: result.timings
+      });
+      console.log('✓ Download history saved to database');
+    } catch (error) {
+      console.log(`⚠ Could not save download history: ${error.message}`);
+    }
+  }
+
+  /**
+   * Wait until a frame matching the predicate is attached to the page
+   * @param {Function} predicate - Called with each Playwright frame
+   * @param {string} description - Used in the timeout error message
+   */
+  async waitForFrame(predicate, description) {
+    const timeout = this.config.timeout_seconds * 1000;
+    const deadline = Date.now() + timeout;
+
+    while (Date.now() < deadline) {
+      const frame = this.page.frames().find(predicate);
+      if (frame) {
+        return frame;
+      }
+      await new Promise(resolve => setTimeout(resolve, 100));
+    }
+
+    throw new Error(`Could not find ${description} frame`);
+  }
+
+  /**
+   * Mark the document currently loaded in a frame so a later navigation can be detected
+   * @param {object} frame - Playwright frame
+   */
+  async markFrameStale(frame) {
+    await frame.evaluate(() => { window.__ebrandidStale = true; }).catch(() => {});
+  }
+
+  /**
+   * Wait until a frame has replaced the document marked by markFrameStale()
+   * and the given ready selector is present
+   * @param {object} frame - Playwright frame
+   * @param {string} readySelector - Element that signals the page is usable
+   */
+  async waitForFrameReady(frame, readySelector) {
+    await frame.waitForFunction((selector) => {
+      return !window.__ebrandidStale
+        && document.readyState !== 'loading'
+        && document.querySelector(selector) !== null;
+    }, readySelector, {
+      timeout: this.config.timeout_seconds * 1000,
+      polling: 100
+    });
+  }
+
+  /**
+   * Submit the PO search in the list page and wait for the result grid to refresh
+   * The wait ends once the postback has replaced the page marked stale; the row
+   * must be on the new page, since it may already be on the list being replaced.
+   * When the PO is not in the list the wait ends when the new page has loaded.
+   * @param {object} spaceFrame - Frame holding the PO list page
+   * @param {string} poNumber - Purchase Order number, or '' for the whole list
+   */
+  async submitPOSearch(spaceFrame, poNumber) {
+    await this.markFrameStale(spaceFrame);
+    await spaceFrame.fill('#txtWONum', poNumber);
+    await spaceFrame.press('#txtWONum', 'Enter');
+
+    try {
+      await spaceFrame.waitForFunction((po) => {
+        // Nothing on the old page counts, it is about to be thrown away
+        if (window.__ebrandidStale || document.readyState === 'loading') {
+          return false;
+        }
+
+        // An empty search lists every PO, so there is no row to look for
+        if (!po) {
+          return document.readyState === 'complete';
+        }
+
+        const rows = Array.from(document.querySelectorAll('table tr'));
+        const rowFound = rows.some(row => {
+          const cells = row.querySelectorAll('td');
+          if (cells.length < 9) return false;
+          const linkText = cells[0].querySelector('a')?.textContent.trim();
+          return cells[0].textContent.trim() === po || linkText === po;
+        });
+        return rowFound || document.readyState === 'complete';
+      }, poNumber, {
+        timeout: this.config.timeout_seconds * 1000,
+        polling: 100
+      });
+    } catch (error) {
+      console.log(`⚠ Search results did not refresh: ${error.message}`);
+    }
   }
 
   /**
@@ -28,6 +347,7 @@ class EBrandIDDownloader {
   async initialize(headless) {
     // Load fresh config
     this.config = loadConfig();
+    this.throttle = createThrottle(this.config);
 
     // Use provided headless parameter, or fall back to config value
     const useHeadless = headless !== undefined ? headless : this.config.headless;
@@ -42,13 +362,59 @@ class EBrandIDDownloader {
         '--host-resolver-rules="MAP app.e-brandid.com 13.77.146.165"'
       ]
     });
+    // Start from the saved login session when there is one (validated in login())
+    const storageState = loadSession(this.config);
+    this.sessionRestored = storageState !== null;
     this.context = await this.browser.newContext({
-      acceptDownloads: true
+      acceptDownloads: true,
+      ...(storageState ? { storageState } : {})
     });
+
+    // Block resources the extractors never read (applies to every page in the context)
+    this.resourceProfile = resolveResourceProfile(this.config);
+    if (this.resourceProfile.enabled) {
+      await this.context.route('**/*', route => this.handleRoute(route));
+      console.log('Resource blocking enabled');
+    }
+
     this.page = await this.context.newPage();
     console.log('Browser initialized successfully');
   }
 
+  /**
+   * Route handler that aborts requests blocked by the resource profile
+   * @param {object} route - Playwright route
+   */
+  async handleRoute(route) {
+    const request = route.request();
+
+    let pageUrl = '';
+    try {
+      pageUrl = request.frame().url();
+    } catch (error) {
+      // Requests without a frame (e.g. service workers) are matched by type only
+    }
+
+    if (shouldBlockRequest(this.resourceProfile, request.resourceType(), request.url(), pageUrl)) {
+      this.blockedRequestCount++;
+      return route.abort('blockedbyclient');
+    }
+
+    return route.continue();
+  }
+
+  /**
+   * Load state to wait for on pages we only extract DOM from
+   * With resource blocking on, the server-rendered DOM is all we need, so there is no
+   * point waiting for the network to go idle
+   */
+  getExtractionWaitUntil() {
+    if (this.resourceProfile && this.resourceProfile.enabled) {
+      return this.resourceProfile.wait_until;
+    }
+    return 'networkidle';
+  }
+
   /**
    * Login to e-brandid system
    */
@@ -56,6 +422,15 @@ class EBrandIDDownloader {
     // Reload config to get latest credentials
     this.config = loadConfig();
 
+    if (this.sessionRestored) {
+      if (await this.probeSession()) {
+        console.log('Login successful! (reused saved session)');
+        return;
+      }
+      console.log('Saved login session has expired, logging in again...');
+      clearSession(this.config);
+    }
+
     console.log('Navigating to login page...');
     await this.page.goto(this.config.login_url, {
       waitUntil: 'networkidle',
@@ -73,12 +448,12 @@ class EBrandIDDownloader {
     await this.page.fill('input[name="txtUserName"]', this.config.username);
     await this.page.fill('input[name="txtPassword"]', this.config.password);
 
-    // Click the login image button
-    await this.page.click('img[onclick*="Login"]');
-
-    // Wait for navigation after login
-    await this.page.waitForLoadState('networkidle', {
-      timeout: this.config.timeout_seconds * 1000
+    // Click the login image button and wait until we are redirected away from the login page
+    await this.timeStep('login:submit', async () => {
+      await this.page.click('img[onclick*="Login"]');
+      await this.page.waitForURL(url => !url.toString().includes('login.aspx'), {
+        timeout: this.config.timeout_seconds * 1000
+      }).catch(() => {});
     });
 
     // Verify login success
@@ -88,6 +463,30 @@ class EBrandIDDownloader {
     }
 
     console.log('Login successful!');
+
+    try {
+      saveSession(this.config, await this.context.storageState());
+    } catch (error) {
+      console.log(`⚠ Could not save login session: ${error.message}`);
+    }
+  }
+
+  /**
+   * Check that the restored session is still accepted by opening the index page
+   * The site redirects to login.aspx when the session is gone; on success the page
+   * is left on index.aspx, just as after a form login
+   */
+  async probeSession() {
+    try {
+      await this.timeStep('login:probe', () => this.page.goto('https://app.e-brandid.com/Bidnet/index.aspx', {
+        waitUntil: 'load',
+        timeout: this.config.timeout_seconds * 1000
+      }));
+      return !this.page.url().includes('login.aspx');
+    } catch (error) {
+      console.log(`⚠ Session probe failed: ${error.message}`);
+      return false;
+    }
   }
 
   /**
@@ -98,61 +497,50 @@ class EBrandIDDownloader {
 
     try {
       // After login, we should already be on index.aspx with frames
-      // Wait for the page to fully load
-      console.log('Waiting for page to load completely...');
-      await this.page.waitForLoadState('networkidle', {
-        timeout: this.config.timeout_seconds * 1000
+      // The page uses frames - wait for the navigation frame to be ready
+      console.log('Waiting for navigation frame...');
+      const navigFrame = await this.timeStep('navigate:index-frames', async () => {
+        const frame = await this.waitForFrame(f => f.name() === 'navig' || f.url().includes('mnuSetup.aspx'), 'navigation');
+        await frame.waitForLoadState('load', { timeout: this.config.timeout_seconds * 1000 });
+        return frame;
       });
-      await this.page.waitForTimeout(2000);
-
-      // The page uses frames - find the navigation frame
-      console.log('Looking for navigation frame...');
-      const navigFrame = this.page.frames().find(f => f.name() === 'navig' || f.url().includes('mnuSetup.aspx'));
-
-      if (!navigFrame) {
-        throw new Error('Could not find navigation frame');
-      }
 
       console.log('Found navigation frame');
 
-      // Hover over "Search" menu in the navigation frame
-      console.log('Hovering over Search menu...');
-      const searchDiv = navigFrame.locator('div').filter({ hasText: /^Search$/ }).first();
-      await searchDiv.hover();
-
-      // Wait for menu to expand
-      await this.page.waitForTimeout(1500);
-
       // The menu items appear in the SPACE frame, not the navigation frame
-      // Find the space frame first
-      let spaceFrame = this.page.frames().find(f => f.name() === 'space');
-
-      if (!spaceFrame) {
-        throw new Error('Could not find space frame');
-      }
-
-      // Click on "Purchase Order" from the dropdown menu in the space frame
-      console.log('Clicking Purchase Order from menu...');
-      await spaceFrame.click('text=Purchase Order');
-
-      // Wait for the space frame to navigate to the PO list page
-      await this.page.waitForTimeout(3000);
-
-      console.log('Purchase Order list page should be loaded');
-
-      // Re-find the space frame after navigation
-      spaceFrame = this.page.frames().find(f => f.name() === 'space');
-
-      if (!spaceFrame) {
-        throw new Error('Could not find space frame');
-      }
+      const spaceFrame = await this.waitForFrame(f => f.name() === 'space', 'space');
+
+      await this.timeStep('navigate:po-list', async () => {
+        // Hover over "Search" menu in the navigation frame
+        console.log('Hovering over Search menu...');
+        const searchDiv = navigFrame.locator('div').filter({ hasText: /^Search$/ }).first();
+        await searchDiv.hover();
+
+        // Click on "Purchase Order" from the dropdown menu in the space frame
+        // (the click waits for the menu item to become visible)
+        console.log('Clicking Purchase Order from menu...');
+        await this.markFrameStale(spaceFrame);
+        await spaceFrame.click('text=Purchase Order');
+
+        // Wait for the space frame to navigate to the PO list page
+        await this.waitForFrameReady(spaceFrame, '#ddlStatus');
+      });
 
       console.log('Found space frame');
 
       // Select "All" from status dropdown in the space frame
       console.log('Selecting "All" status...');
-      await spaceFrame.selectOption('#ddlStatus', '0');
-      await this.page.waitForTimeout(1000);
+      await this.timeStep('navigate:status-filter', async () => {
+        // Selecting the value already shown fires no change event, so there is no postback to wait for
+        if (await spaceFrame.inputValue('#ddlStatus') === '0') {
+          return;
+        }
+
+        // The dropdown posts back; wait for the new list page before searching in it
+        await this.markFrameStale(spaceFrame);
+        await spaceFrame.selectOption('#ddlStatus', '0');
+        await this.waitForFrameReady(spaceFrame, '#ddlStatus');
+      });
 
       console.log('✓ Purchase Order list page ready');
       return true;
@@ -170,32 +558,27 @@ class EBrandIDDownloader {
 
     try {
       // After login, we should already be on index.aspx with frames
-      // Wait for the page to fully load
-      console.log('Waiting for page to load completely...');
-      await this.page.waitForLoadState('networkidle', {
-        timeout: this.config.timeout_seconds * 1000
+      // The page uses frames - wait for the navigation frame to be ready
+      console.log('Waiting for navigation frame...');
+      const navigFrame = await this.timeStep('navigate:index-frames', async () => {
+        const frame = await this.waitForFrame(f => f.name() === 'navig' || f.url().includes('mnuSetup.aspx'), 'navigation');
+        await frame.waitForLoadState('load', { timeout: this.config.timeout_seconds * 1000 });
+        return frame;
       });
-      await this.page.waitForTimeout(2000);
-
-      // The page uses frames - find the navigation frame
-      console.log('Looking for navigation frame...');
-      const navigFrame = this.page.frames().find(f => f.name() === 'navig' || f.url().includes('mnuSetup.aspx'));
-
-      if (!navigFrame) {
-        throw new Error('Could not find navigation frame');
-      }
 
       console.log('Found navigation frame');
 
-      // Hover over "Messages" menu and click it
-      console.log('Hovering over Messages menu and clicking...');
-      const messagesDiv = navigFrame.locator('div').filter({ hasText: /^Messages$/ }).first();
-      await messagesDiv.hover();
-      await this.page.waitForTimeout(500);
-      await messagesDiv.click();
+      const spaceFrame = await this.waitForFrame(f => f.name() === 'space', 'space');
 
-      // Wait for the message page to load
-      await this.page.waitForTimeout(3000);
+      // Hover over "Messages" menu and click it, then wait for the message table
+      console.log('Hovering over Messages menu and clicking...');
+      await this.timeStep('navigate:messages', async () => {
+        const messagesDiv = navigFrame.locator('div').filter({ hasText: /^Messages$/ }).first();
+        await messagesDiv.hover();
+        await this.markFrameStale(spaceFrame);
+        await messagesDiv.click();
+        await this.waitForFrameReady(spaceFrame, 'table tr td');
+      });
 
       console.log('✓ Message page ready');
       return true;
@@ -207,25 +590,23 @@ class EBrandIDDownloader {
 
   /**
    * Extract messages from the Messages page
+   * Message bodies are fetched directly through the context's request API, several at
+   * a time, instead of opening each Subject popup. Rows whose detail URL cannot be
+   * worked out fall back to the popup.
    * @param {string} customDate - Optional date in YYYY-MM-DD format (e.g., "2026-01-30")
+   * @param {object} options - Optional overrides
+   * @param {boolean} options.screenshots - Save screenshots of the list and popups (default: config.message_screenshots)
+   * @param {string} options.detailMode - "request" (default) or "popup" to force the old popup flow
+   * @param {number} options.concurrency - Parallel detail requests (default: config.message_detail_concurrency or 8)
    */
-  async extractMessages(customDate = null) {
+  async extractMessages(customDate = null, options = {}) {
     console.log('\nExtracting messages from Messages page...');
 
     try {
-      // Create screenshots directory
-      const screenshotsDir = path.join(__dirname, 'screenshots');
-      if (!fs.existsSync(screenshotsDir)) {
-        fs.mkdirSync(screenshotsDir, { recursive: true });
-      }
+      const detailOptions = this.resolveMessageDetailOptions(options);
 
-      // Capture screenshot of the messages page
-      const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
-      await this.page.screenshot({
-        path: path.join(screenshotsDir, `messages-page-${timestamp}.png`),
-        fullPage: true
-      });
-      console.log(`Screenshot saved: messages-page-${timestamp}.png`);
+      // Capture screenshot of the messages page (only when screenshots are requested)
+      await this.screenshotMessageList(detailOptions.screenshotsDir);
 
       // Find the space frame
       const spaceFrame = this.page.frames().find(f => f.name() === 'space');
@@ -252,146 +633,414 @@ class EBrandIDDownloader {
 
       console.log(`Filtering messages for date: ${todayStr}`);
 
-      // Extract all messages from the table, filtering by the target date
-      const messages = await spaceFrame.evaluate(({ dateStr, dateStrPadded }) => {
-        const rows = Array.from(document.querySelectorAll('table tr'));
-        const messageData = [];
-        const debugInfo = [];
+      // Extract all messages from the table, then keep the target date
+      // The Received column format is like "1/30/26 22:25"
+      const table = await this.readMessageTable(spaceFrame);
+      const messages = {
+        messages: table.messages.filter(message =>
+          message.receivedDate.startsWith(todayStr) || message.receivedDate.startsWith(todayStrPadded)),
+        debug: table.debug
+      };
 
-        for (let rowIndex = 0; rowIndex < rows.length; rowIndex++) {
-          const row = rows[rowIndex];
-          const cells = row.querySelectorAll('td');
+      console.log(`✓ Found ${messages.messages.length} messages from ${todayStr}`);
+      console.log('Debug info (first 5 rows):', JSON.stringify(messages.debug.slice(0, 5), null, 2));
 
-          // Debug: log what we find
-          if (cells.length > 0) {
-            debugInfo.push({
-              cellCount: cells.length,
-              cell0: cells[0]?.textContent.trim().substring(0, 50),
-              cell1: cells[1]?.textContent.trim().substring(0, 50),
-              cell2: cells[2]?.textContent.trim().substring(0, 50),
-              cell3: cells[3]?.textContent.trim().substring(0, 50),
-              cell4: cells[4]?.textContent.trim().substring(0, 50),
-              cell5: cells[5]?.textContent.trim().substring(0, 50),
-              cell6: cells[6]?.textContent.trim().substring(0, 50),
-              cell7: cells[7]?.textContent.trim().substring(0, 50),
-              hasSubHeader: cells[0]?.className?.includes('SubHeader')
-            });
-          }
+      await this.loadMessageDetails(spaceFrame, messages.messages, detailOptions);
 
-          // Skip header rows (rows with SubHeader class or th elements)
-          if (cells.length > 0 && cells[0].className?.includes('SubHeader')) {
-            continue;
-          }
+      return messages;
+    } catch (error) {
+      console.error('Failed to extract messages:', error);
+      throw error;
+    }
+  }
 
-          if (cells.length >= 8) {
-            // Extract: Ref#, Author, Received, Subject, Comment
-            // Note: First 3 cells are icon columns, data starts at cells[3]
-            const refNumber = cells[3].textContent.trim();
-            const author = cells[4].textContent.trim();
-            const receivedDate = cells[5].textContent.trim();
-            const subjectCell = cells[6];
-            const subject = subjectCell.textContent.trim();
-            const comment = cells[7].textContent.trim();
-
-            // Only include messages from the target date (any time from 00:00 to 23:59)
-            // The Received column format is like "1/30/26 22:25"
-            // Check if the date starts with the target date
-            if (receivedDate.startsWith(dateStr) || receivedDate.startsWith(dateStrPadded)) {
-              // Check if Subject cell has a link
-              const subjectLink = subjectCell.querySelector('a');
-              const hasSubjectLink = subjectLink !== null;
-
-              messageData.push({
-                refNumber,
-                author,
-                receivedDate,
-                subject,
-                comment,
-                rowIndex,
-                hasSubjectLink
-              });
-            }
-          }
-        }
+  /**
+   * Extract only messages newer than a sync cursor, walking back through table pages
+   * The message table is newest-first, so paging stops at the first row older than
+   * the cursor (or when there is no next page). Rows already stored are not fetched.
+   * @param {object} cursor - { receivedAt } high-water mark (ISO string), or null for everything
+   * @param {object} options - Same as extractMessages, plus:
+   * @param {Function} options.isStored - Called with a message row, returns (a promise of) true if already saved
+   * @param {number} options.maxPages - Safety limit on table pages to scan (default 50)
+   */
+  async extractMessagesSince(cursor, options = {}) {
+    console.log(`\nSyncing messages newer than ${cursor && cursor.receivedAt ? cursor.receivedAt : 'the beginning'}...`);
 
-        return { messages: messageData, debug: debugInfo };
-      }, { dateStr: todayStr, dateStrPadded: todayStrPadded });
+    const detailOptions = this.resolveMessageDetailOptions(options);
+    const isStored = options.isStored || (() => false);
+    const maxPages = options.maxPages || 50;
+    const cursorTime = cursor && cursor.receivedAt ? new Date(cursor.receivedAt).getTime() : null;
 
-      console.log(`✓ Found ${messages.messages.length} messages from ${todayStr}`);
-      console.log('Debug info (first 5 rows):', JSON.stringify(messages.debug.slice(0, 5), null, 2));
+    const spaceFrame = this.page.frames().find(f => f.name() === 'space');
+    if (!spaceFrame) {
+      throw new Error('Could not find space frame');
+    }
 
-      // Limit to first 10 messages
-      const messagesToProcess = messages.messages.slice(0, 10);
-      console.log(`Processing first ${messagesToProcess.length} messages...`);
-
-      // For each message, click into the Subject to get full details
-      for (const message of messagesToProcess) {
-        if (message.hasSubjectLink) {
-          console.log(`\nClicking into message Subject: ${message.subject}`);
-
-          // Wait for popup to open when clicking the Subject link in the specific row
-          const [popup] = await Promise.all([
-            this.page.waitForEvent('popup'),
-            spaceFrame.evaluate((rowIndex) => {
-              const rows = Array.from(document.querySelectorAll('table tr'));
-              const row = rows[rowIndex];
-              const cells = row.querySelectorAll('td');
-              const subjectCell = cells[6]; // Subject column
-              const link = subjectCell.querySelector('a');
-              if (link) {
-                link.click();
-              }
-            }, message.rowIndex)
-          ]);
-
-          // Wait for popup to load
-          await popup.waitForLoadState('networkidle');
-          await popup.waitForTimeout(1000);
-
-          // Capture screenshot of the message popup
-          const popupTimestamp = new Date().toISOString().replace(/[:.]/g, '-');
-          await popup.screenshot({
-            path: path.join(screenshotsDir, `message-${message.refNumber}-${popupTimestamp}.png`),
-            fullPage: true
-          });
-          console.log(`  Screenshot saved: message-${message.refNumber}-${popupTimestamp}.png`);
-
-          // Capture the message link (URL)
-          const messageLink = popup.url();
-          console.log(`  Message link: ${messageLink}`);
-
-          // Extract CommentId from URL
-          let commentId = null;
-          try {
-            const url = new URL(messageLink);
-            commentId = url.searchParams.get('CommentId');
-            console.log(`  Comment ID: ${commentId}`);
-          } catch (error) {
-            console.log(`  Could not extract Comment ID: ${error.message}`);
-          }
+    await this.screenshotMessageList(detailOptions.screenshotsDir);
 
-          // Extract full details from the popup with HTML styling
-          const fullDetails = await popup.evaluate(() => {
-            // Get the full HTML content with styling
-            return document.body.innerHTML;
-          });
+    const result = { messages: [], skipped: 0, pagesScanned: 0, newest: null };
 
-          message.fullDetails = fullDetails;
-          message.messageLink = messageLink;
-          message.commentId = commentId;
-          console.log(`✓ Extracted details for Subject: ${message.subject}`);
+    while (result.pagesScanned < maxPages) {
+      const table = await this.readMessageTable(spaceFrame);
+      result.pagesScanned++;
+
+      let reachedCursor = false;
+      const fresh = [];
+
+      for (const message of table.messages) {
+        const receivedTime = message.receivedAt ? new Date(message.receivedAt).getTime() : null;
+
+        // Rows at exactly the cursor time are re-checked against the database
+        if (cursorTime !== null && receivedTime !== null && receivedTime < cursorTime) {
+          reachedCursor = true;
+          continue;
+        }
 
-          // Close the popup
-          await popup.close();
-          await this.page.waitForTimeout(500);
+        if (receivedTime !== null && (!result.newest || receivedTime > new Date(result.newest.receivedAt).getTime())) {
+          result.newest = message;
+        }
+
+        if (await isStored(message)) {
+          result.skipped++;
+        } else {
+          fresh.push(message);
         }
       }
 
-      return messages;
+      console.log(`  Page ${result.pagesScanned}: ${fresh.length} new, ${table.messages.length - fresh.length} old or stored`);
+
+      // Details must be loaded while this page is showing (popup fallback clicks rows)
+      await this.loadMessageDetails(spaceFrame, fresh, detailOptions);
+      result.messages.push(...fresh);
+
+      if (reachedCursor || !(await this.goToNextGridPage(spaceFrame))) {
+        break;
+      }
+    }
+
+    console.log(`✓ Sync found ${result.messages.length} new messages across ${result.pagesScanned} page(s), skipped ${result.skipped} already stored`);
+    return result;
+  }
+
+  /**
+   * Resolve message detail options against config defaults
+   * @param {object} options - Options passed to extractMessages / extractMessagesSince
+   */
+  resolveMessageDetailOptions(options) {
+    const screenshots = options.screenshots !== undefined ? options.screenshots : Boolean(this.config.message_screenshots);
+    const screenshotsDir = screenshots ? path.join(__dirname, 'screenshots') : null;
+
+    // Create screenshots directory (only when screenshots are requested)
+    if (screenshotsDir && !fs.existsSync(screenshotsDir)) {
+      fs.mkdirSync(screenshotsDir, { recursive: true });
+    }
+
+    return {
+      screenshotsDir,
+      detailMode: options.detailMode || this.config.message_detail_mode || 'request',
+      concurrency: options.concurrency || this.config.message_detail_concurrency || 8
+    };
+  }
+
+  /**
+   * Save a full-page screenshot of the message list
+   * @param {string} screenshotsDir - Target folder, or null to skip
+   */
+  async screenshotMessageList(screenshotsDir) {
+    if (!screenshotsDir) {
+      return;
+    }
+
+    const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
+    await this.page.screenshot({
+      path: path.join(screenshotsDir, `messages-page-${timestamp}.png`),
+      fullPage: true
+    });
+    console.log(`Screenshot saved: messages-page-${timestamp}.png`);
+  }
+
+  /**
+   * Read every message row on the current table page in one evaluation
+   * @param {object} spaceFrame - Frame holding the message table
+   */
+  async readMessageTable(spaceFrame) {
+    const table = await spaceFrame.evaluate(readMessageRows);
+
+    table.messages.forEach(message => {
+      const receivedAt = parseReceivedDate(message.receivedDate);
+      message.receivedAt = receivedAt ? receivedAt.toISOString() : null;
+    });
+
+    return table;
+  }
+
+  /**
+   * Click the next page link in a grid pager (message table, PO list), if there is one
+   * @param {object} spaceFrame - Frame holding the grid
+   * @returns {boolean} true if the next page was loaded
+   */
+  async goToNextGridPage(spaceFrame) {
+    await this.markFrameStale(spaceFrame);
+
+    const clicked = await spaceFrame.evaluate(() => {
+      const links = Array.from(document.querySelectorAll('table a'));
+
+      // GridView/DataGrid pagers render the current page as a plain <span> number
+      const pagerSpan = Array.from(document.querySelectorAll('table td span'))
+        .find(span => /^\d+$/.test(span.textContent.trim()) && span.closest('td').querySelector('a, span + a'));
+      const currentPage = pagerSpan ? parseInt(pagerSpan.textContent.trim(), 10) : 1;
+
+      const next = links.find(a => a.textContent.trim() === String(currentPage + 1))
+        || links.find(a => (a.getAttribute('href') || '').includes('Page$Next'))
+        || links.find(a => ['>', '>>', 'Next', 'Next >'].includes(a.textContent.trim()));
+
+      if (!next) {
+        return false;
+      }
+
+      next.click();
+      return true;
+    });
+
+    if (!clicked) {
+      return false;
+    }
+
+    await this.waitForFrameReady(spaceFrame, 'table tr td');
+    return true;
+  }
+
+  /**
+   * Load full details for message rows (direct requests, popup as fallback)
+   * @param {object} spaceFrame - Frame holding the message table
+   * @param {Array} messageRows - Rows from readMessageTable (updated in place)
+   * @param {object} detailOptions - Result of resolveMessageDetailOptions
+   */
+  async loadMessageDetails(spaceFrame, messageRows, detailOptions) {
+    const { screenshotsDir, detailMode, concurrency } = detailOptions;
+    const linkedMessages = messageRows.filter(message => message.hasSubjectLink);
+
+    if (linkedMessages.length === 0) {
+      return;
+    }
+
+    if (detailMode === 'popup') {
+      for (const message of linkedMessages) {
+        await this.extractMessageDetailFromPopup(spaceFrame, message, screenshotsDir);
+      }
+      return;
+    }
+
+    // Rows that only expose a CommentId need a URL template. Learn it from one popup
+    // (the popup URL carries the CommentId) unless config.message_detail_url provides it.
+    if (!this.messageDetailUrlTemplate) {
+      this.messageDetailUrlTemplate = this.config.message_detail_url || null;
+    }
+    const needsTemplate = linkedMessages.filter(message => !message.detailUrl);
+    if (!this.messageDetailUrlTemplate && needsTemplate.length > 0) {
+      const sample = needsTemplate[0];
+      await this.extractMessageDetailFromPopup(spaceFrame, sample, screenshotsDir);
+      if (sample.commentId && sample.messageLink && sample.messageLink.includes(sample.commentId)) {
+        this.messageDetailUrlTemplate = sample.messageLink.replace(sample.commentId, '{commentId}');
+      }
+    }
+
+    const pending = [];
+    for (const message of linkedMessages) {
+      if (message.fullDetails !== undefined) {
+        continue;
+      }
+      if (!message.detailUrl && message.commentId && this.messageDetailUrlTemplate) {
+        message.detailUrl = this.messageDetailUrlTemplate.replace('{commentId}', message.commentId);
+      }
+      pending.push(message);
+    }
+
+    console.log(`Fetching ${pending.length} message details (${concurrency} at a time)...`);
+
+    const failed = [];
+    await mapWithConcurrency(pending, concurrency, async (message) => {
+      if (!message.detailUrl) {
+        failed.push(message);
+        return;
+      }
+      try {
+        await this.fetchMessageDetail(message);
+      } catch (error) {
+        console.log(`  ⚠ Could not fetch details for ${message.refNumber}: ${error.message}`);
+        failed.push(message);
+      }
+    });
+
+    // Anything we could not fetch directly goes through the popup, one at a time
+    for (const message of failed) {
+      await this.extractMessageDetailFromPopup(spaceFrame, message, screenshotsDir);
+    }
+
+    console.log(`✓ Extracted details for ${linkedMessages.length} messages (${failed.length} via popup)`);
+  }
+
+  /**
+   * Fetch a message's detail page through the request context (shares the login cookies)
+   * Goes through the shared throttle like every other request to e-brandid
+   * @param {object} message - Message row with detailUrl set (updated in place)
+   */
+  async fetchMessageDetail(message) {
+    const html = await this.requestStep('transfer:message-detail', async (span) => {
+      const response = checkResponse(await this.context.request.get(message.detailUrl, {
+        timeout: this.config.timeout_seconds * 1000
+      }), `Message ${message.refNumber} detail`);
+
+      if (!response.ok()) {
+        throw new Error(`HTTP ${response.status()}`);
+      }
+
+      const body = await response.text();
+      span.bytes = Buffer.byteLength(body);
+      return body;
+    }, { message: message.refNumber });
+
+    // Not retried: the caller falls back to the popup for these
+    if (html.includes('txtUserName')) {
+      throw new Error('Session expired (got login page)');
+    }
+
+    // Keep only the body markup, matching what the popup flow stored
+    const bodyMatch = html.match(/<body[^>]*>([\s\S]*)<\/body>/i);
+
+    let commentId = message.commentId;
+    try {
+      commentId = new URL(message.detailUrl).searchParams.get('CommentId') || commentId;
     } catch (error) {
-      console.error('Failed to extract messages:', error);
-      throw error;
+      // Keep the CommentId parsed from the row
+    }
+
+    message.fullDetails = bodyMatch ? bodyMatch[1] : html;
+    message.messageLink = message.detailUrl;
+    message.commentId = commentId;
+  }
+
+  /**
+   * Open a message's Subject popup and extract its details (fallback path)
+   * @param {object} spaceFrame - Frame holding the message table
+   * @param {object} message - Message row (updated in place)
+   * @param {string} screenshotsDir - Folder for the popup screenshot, or null to skip it
+   */
+  async extractMessageDetailFromPopup(spaceFrame, message, screenshotsDir) {
+    console.log(`\nClicking into message Subject: ${message.subject}`);
+
+    // Wait for popup to open when clicking the Subject link in the specific row
+    const [popup] = await Promise.all([
+      this.page.waitForEvent('popup'),
+      spaceFrame.evaluate((rowIndex) => {
+        const rows = Array.from(document.querySelectorAll('table tr'));
+        const row = rows[rowIndex];
+        const cells = row.querySelectorAll('td');
+        const subjectCell = cells[6]; // Subject column
+        const link = subjectCell.querySelector('a');
+        if (link) {
+          link.click();
+        }
+      }, message.rowIndex)
+    ]);
+
+    // Wait for popup to load
+    await popup.waitForLoadState('networkidle');
+
+    // Capture screenshot of the message popup
+    if (screenshotsDir) {
+      const popupTimestamp = new Date().toISOString().replace(/[:.]/g, '-');
+      await popup.screenshot({
+        path: path.join(screenshotsDir, `message-${message.refNumber}-${popupTimestamp}.png`),
+        fullPage: true
+      });
+      console.log(`  Screenshot saved: message-${message.refNumber}-${popupTimestamp}.png`);
     }
+
+    // Capture the message link (URL)
+    const messageLink = popup.url();
+    console.log(`  Message link: ${messageLink}`);
+
+    // Extract CommentId from URL
+    let commentId = message.commentId || null;
+    try {
+      const url = new URL(messageLink);
+      commentId = url.searchParams.get('CommentId') || commentId;
+      console.log(`  Comment ID: ${commentId}`);
+    } catch (error) {
+      console.log(`  Could not extract Comment ID: ${error.message}`);
+    }
+
+    // Extract full details from the popup with HTML styling
+    const fullDetails = await popup.evaluate(() => {
+      // Get the full HTML content with styling
+      return document.body.innerHTML;
+    });
+
+    message.fullDetails = fullDetails;
+    message.messageLink = messageLink;
+    message.commentId = commentId;
+    console.log(`✓ Extracted details for Subject: ${message.subject}`);
+
+    // Close the popup
+    await popup.close();
+  }
+
+  /**
+   * Read every PO row of the Purchase Order list, walking through the grid pages
+   * Assumes we're already on the list page (status "All"); used by the scheduled delta sync
+   * @param {object} options
+   * @param {number} options.maxPages - Safety limit on list pages to read (default 200)
+   */
+  async extractPOListRows(options = {}) {
+    console.log('\nReading the full Purchase Order list...');
+
+    const maxPages = options.maxPages || 200;
+    const spaceFrame = this.page.frames().find(f => f.name() === 'space');
+
+    if (!spaceFrame) {
+      throw new Error('Could not find space frame');
+    }
+
+    // An empty PO number search lists every PO for the selected status
+    await this.timeStep('search:po-list', () => this.submitPOSearch(spaceFrame, ''));
+
+    const rowsByPO = new Map();
+    let pagesScanned = 0;
+
+    while (pagesScanned < maxPages) {
+      const rows = await this.timeStep('extract:po-list-page', () => this.readPOListTable(spaceFrame));
+      pagesScanned++;
+
+      const before = rowsByPO.size;
+      rows.forEach(row => rowsByPO.set(row.poNumber, row));
+      console.log(`  Page ${pagesScanned}: ${rows.length} rows`);
+
+      // Stop when the pager has no next page, or it wrapped around to rows we already have
+      if (rowsByPO.size === before || !(await this.goToNextGridPage(spaceFrame))) {
+        break;
+      }
+    }
+
+    console.log(`✓ Read ${rowsByPO.size} POs from ${pagesScanned} list page(s)`);
+    return Array.from(rowsByPO.values());
+  }
+
+  /**
+   * Read the PO rows currently shown in the list grid (same columns as extractPOListData)
+   * @param {object} spaceFrame - Frame holding the PO list
+   */
+  async readPOListTable(spaceFrame) {
+    return await spaceFrame.evaluate(readPOListRows);
+  }
+
+  /**
+   * Find one PO's row in the list grid currently shown (null if it is not there)
+   * @param {object} spaceFrame - Frame holding the PO list
+   * @param {string} poNumber - Purchase Order number
+   */
+  async readPOListRow(spaceFrame, poNumber) {
+    return await spaceFrame.evaluate(findPOListRow, poNumber);
   }
 
   /**
@@ -410,47 +1059,12 @@ class EBrandIDDownloader {
         throw new Error('Could not find space frame');
       }
 
-      // Enter PO number in search box in the space frame
-      console.log(`Entering PO number ${poNumber}...`);
-      await spaceFrame.fill('#txtWONum', poNumber);
-      await this.page.waitForTimeout(500);
-
-      // Submit search - press Enter
-      console.log('Submitting search...');
-      await spaceFrame.press('#txtWONum', 'Enter');
-      await this.page.waitForTimeout(3000);
+      // Enter PO number in search box and submit - waits for the result grid to refresh
+      console.log(`Searching for PO number ${poNumber}...`);
+      await this.timeStep('search:po-list', () => this.submitPOSearch(spaceFrame, poNumber));
 
       // Extract data from the table row in the space frame
-      const listData = await spaceFrame.evaluate((po) => {
-        // Find all table rows with data cells
-        const rows = Array.from(document.querySelectorAll('table tr'));
-
-        // Look for the row containing this PO number
-        for (const row of rows) {
-          const cells = row.querySelectorAll('td');
-          if (cells.length >= 9) {
-            // Get text from first cell, checking both direct text and link text
-            const firstCellText = cells[0].textContent.trim();
-            const linkText = cells[0].querySelector('a')?.textContent.trim();
-
-            // Check if either matches the PO number
-            if (firstCellText === po || linkText === po) {
-              return {
-                poNumber: firstCellText || linkText,
-                vendorName: cells[1]?.textContent.trim() || '',
-                poDate: cells[2]?.textContent.trim() || '',
-                shipBy: cells[3]?.textContent.trim() || '',
-                shipVia: cells[4]?.textContent.trim() || '',
-                orderType: cells[5]?.textContent.trim() || '',
-                status: cells[6]?.textContent.trim() || '',
-                loc: cells[7]?.textContent.trim() || '',
-                prodRep: cells[8]?.textContent.trim() || ''
-              };
-            }
-          }
-        }
-        return null;
-      }, poNumber);
+      const listData = await this.readPOListRow(spaceFrame, poNumber);
 
       if (listData) {
         console.log('✓ Found PO in list, extracted table data');
@@ -481,10 +1095,10 @@ class EBrandIDDownloader {
     const poUrl = `${this.config.po_detail_url}?po_id=${poNumber}`;
     console.log(`\nNavigating to PO detail page ${poNumber}...`);
 
-    await this.page.goto(poUrl, {
-      waitUntil: 'networkidle',
+    await this.requestStep('navigate:po-detail', async () => checkResponse(await this.page.goto(poUrl, {
+      waitUntil: this.getExtractionWaitUntil(),
       timeout: this.config.timeout_seconds * 1000
-    });
+    }), `PO ${poNumber} detail page`));
 
     // Verify page loaded successfully
     const currentUrl = this.page.url();
@@ -505,54 +1119,60 @@ class EBrandIDDownloader {
     // Navigate back to index.aspx (which has the list page in the space frame)
     const indexPageUrl = 'https://app.e-brandid.com/Bidnet/index.aspx';
 
-    await this.page.goto(indexPageUrl, {
-      waitUntil: 'networkidle',
-      timeout: this.config.timeout_seconds * 1000
-    });
-
-    await this.page.waitForTimeout(2000);
+    await this.requestStep('navigate:back-to-index', async () => {
+      checkResponse(await this.page.goto(indexPageUrl, {
+        waitUntil: 'load',
+        timeout: this.config.timeout_seconds * 1000
+      }), 'Index page');
 
-    // Find the space frame
-    const spaceFrame = this.page.frames().find(f => f.name() === 'space');
-    if (!spaceFrame) {
-      throw new Error('Could not find space frame');
-    }
+      // Wait for the space frame to finish loading instead of sleeping
+      const spaceFrame = await this.waitForFrame(f => f.name() === 'space', 'space');
+      await spaceFrame.waitForLoadState('load', { timeout: this.config.timeout_seconds * 1000 });
+    });
 
     console.log('✓ Back on index page with list page loaded');
     return true;
   }
 
+  /**
+   * Extract the PO header, line items and item links from the detail page in one evaluation
+   * @param {string} poNumber - Purchase Order number
+   * @param {object} listData - Row from the PO list to merge into the header, if found
+   * @param {object} page - Page showing the PO detail (defaults to the main page)
+   */
+  async extractPODetail(poNumber, listData = null, page = this.page) {
+    console.log('Extracting PO header, line items and item links...');
+
+    const detail = await page.evaluate(PO_DETAIL_EXTRACTOR);
+
+    console.log(`Found ${detail.items.length} line items, ${detail.itemLinks.length} item links`);
+    return {
+      header: this.mergeListData(detail.header, poNumber, listData),
+      items: detail.items.map(item => ({ ...item, poNumber })),
+      itemLinks: detail.itemLinks
+    };
+  }
+
   /**
    * Extract PO header information from the page
+   * @param {string} poNumber - Purchase Order number
+   * @param {object} listData - Row from the PO list to merge into the header, if found
+   * @param {object} page - Page showing the PO detail (defaults to the main page)
    */
-  async extractPOHeader(poNumber, listData = null) {
+  async extractPOHeader(poNumber, listData = null, page = this.page) {
     console.log('Extracting PO header information...');
 
-    const poData = await this.page.evaluate(() => {
-      const getText = (selector) => {
-        const el = document.querySelector(selector);
-        return el ? el.textContent.trim() : '';
-      };
-
-      return {
-        poNumber: getText('#lblBidPOid'),
-        status: getText('#lblStatus').replace(/<[^>]*>/g, '').replace(/\*+/g, '').trim(),
-        company: getText('#lblCompany'),
-        currency: getText('#lblCurrency'),
-        terms: getText('#lblTerms'),
-        vendorName: getText('#lblVendorName'),
-        vendorAddress1: getText('#lblVendAddr1'),
-        vendorAddress2: getText('#lblVendAddr2'),
-        vendorAddress3: getText('#lblVendAddr3'),
-        shipToName: getText('#lblBIDName'),
-        shipToAddress1: getText('#lblBIDAddr1'),
-        shipToAddress2: getText('#lblBIDAddr2'),
-        shipToAddress3: getText('#lblBIDAddr3'),
-        cancelDate: getText('#lblCancelDate'),
-        totalAmount: null
-      };
-    });
+    const poData = await page.evaluate(readPOHeader);
+    return this.mergeListData(poData, poNumber, listData);
+  }
 
+  /**
+   * Fill in the header fields that only the PO list shows
+   * @param {object} poData - Header read from the detail page (updated in place)
+   * @param {string} poNumber - Purchase Order number
+   * @param {object} listData - Row from the PO list, or null
+   */
+  mergeListData(poData, poNumber, listData) {
     poData.poNumber = poNumber; // Ensure PO number is set
 
     // Merge list data if available
@@ -586,73 +1206,24 @@ class EBrandIDDownloader {
 
   /**
    * Extract PO line items from the page
+   * @param {string} poNumber - Purchase Order number
+   * @param {object} page - Page showing the PO detail (defaults to the main page)
    */
-  async extractPOItems(poNumber) {
+  async extractPOItems(poNumber, page = this.page) {
     console.log('Extracting PO line items...');
 
-    const items = await this.page.evaluate(() => {
-      const rows = Array.from(document.querySelectorAll('#tblItems tbody tr, table[id*="tblItems"] tbody tr'));
-      const itemRows = rows.filter(row => {
-        const cells = row.querySelectorAll('td');
-        return cells.length >= 9 && !row.classList.contains('tableHeaderText');
-      });
-
-      return itemRows.map(row => {
-        const cells = Array.from(row.querySelectorAll('td'));
-        if (cells.length < 9) return null;
-
-        const parsePrice = (str) => {
-          const cleaned = str.replace(/[$,]/g, '').trim();
-          return cleaned ? parseFloat(cleaned) : 0;
-        };
-
-        const parseInt = (str) => {
-          const cleaned = str.replace(/[,]/g, '').trim();
-          return cleaned && cleaned !== 'NA' ? Number(cleaned) : 0;
-        };
-
-        return {
-          itemNumber: cells[0].textContent.trim(),
-          description: cells[1].textContent.trim(),
-          color: cells[2].textContent.trim(),
-          shipTo: cells[3].textContent.trim(),
-          needBy: cells[4].textContent.trim(),
-          qty: parseInt(cells[5].textContent),
-          bundleQty: cells[6].textContent.trim(),
-          unitPrice: parsePrice(cells[7].textContent),
-          extension: parsePrice(cells[8].textContent)
-        };
-      }).filter(item => item !== null && item.itemNumber && !item.itemNumber.includes('Total'));
-    });
-
+    const items = await page.evaluate(readPOItems);
     return items.map(item => ({ ...item, poNumber }));
   }
 
   /**
    * Get all item links from PO page
+   * @param {object} page - Page showing the PO detail (defaults to the main page)
    */
-  async getItemLinks() {
+  async getItemLinks(page = this.page) {
     console.log('Extracting item links from PO page...');
 
-    const items = await this.page.$$eval('a[href="#"][onclick*="openItemDetail"]', (anchors) => {
-      return anchors.map(a => ({
-        itemNumber: a.textContent.trim(),
-        onclick: a.getAttribute('onclick')
-      }));
-    });
-
-    // Extract request_id and item_suffix_id from onclick attribute
-    const itemDetails = items.map(item => {
-      const match = item.onclick.match(/openItemDetail\((\d+),\s*(\d+)\)/);
-      if (match) {
-        return {
-          itemNumber: item.itemNumber,
-          requestId: match[1],
-          itemSuffixId: match[2]
-        };
-      }
-      return null;
-    }).filter(item => item !== null);
+    const itemDetails = await page.evaluate(readItemLinks);
 
     console.log(`Found ${itemDetails.length} items`);
     return itemDetails;
@@ -664,15 +1235,13 @@ class EBrandIDDownloader {
    */
   async extractArtworkUrl(popup) {
     try {
-      await popup.waitForLoadState('networkidle', { timeout: 10000 });
+      await popup.waitForLoadState(this.getExtractionWaitUntil(), { timeout: 10000 });
 
       // Look for the artwork download link
-      const artworkUrl = await popup.$eval('a[id*="ArtworkImageDownload"]', (link) => {
-        const onclick = link.getAttribute('onclick');
-        // Extract URL from MM_openBrWindow('URL',...)
-        const match = onclick.match(/MM_openBrWindow\('([^']+)'/);
-        return match ? match[1] : null;
-      });
+      const artworkUrl = await popup.evaluate(readArtworkUrl);
+      if (!artworkUrl) {
+        console.log('  No artwork found for this item');
+      }
 
       return artworkUrl;
     } catch (error) {
@@ -683,10 +1252,12 @@ class EBrandIDDownloader {
 
   /**
    * Download artwork for a single item
+   * Skips the transfer when the manifest shows the local copy is still current
    * @param {object} item - Item details
    * @param {string} poNumber - PO number for folder organization
+   * @param {object} manifest - Optional artwork manifest for the PO (updated in place)
    */
-  async downloadItemArtwork(item, poNumber) {
+  async downloadItemArtwork(item, poNumber, manifest = null) {
     console.log(`\n  Processing item: ${item.itemNumber}`);
 
     try {
@@ -695,10 +1266,14 @@ class EBrandIDDownloader {
 
       // Create a new page for the item detail
       const itemPage = await this.context.newPage();
-      await itemPage.goto(itemDetailUrl, { waitUntil: 'networkidle', timeout: 15000 });
+      const spanAttributes = { item: item.itemNumber };
+      await this.requestStep('navigate:item-detail', async () => checkResponse(
+        await itemPage.goto(itemDetailUrl, { waitUntil: this.getExtractionWaitUntil(), timeout: 15000 }),
+        `Item ${item.itemNumber} detail page`
+      ), spanAttributes);
 
       // Extract artwork URL
-      const artworkUrl = await this.extractArtworkUrl(itemPage);
+      const artworkUrl = await this.timeStep('resolve:artwork-url', () => this.extractArtworkUrl(itemPage), spanAttributes);
 
       if (!artworkUrl) {
         console.log('  ⚠ No artwork available');
@@ -714,13 +1289,56 @@ class EBrandIDDownloader {
         fs.mkdirSync(downloadDir, { recursive: true });
       }
 
-      // Download the file directly using fetch
-      const response = await itemPage.request.get(artworkUrl);
-      const buffer = await response.body();
-
       const filename = path.basename(artworkUrl);
       const filepath = path.join(downloadDir, filename);
 
+      // Only send validators if the file we downloaded last time is still on disk
+      const entry = manifest ? manifest.items[item.itemNumber] : null;
+      const canSkip = entry && entry.url === artworkUrl && isLocalCopyIntact(downloadDir, entry);
+
+      // Download the file directly using fetch (conditional when we have a previous copy)
+      const response = await this.requestStep('transfer:artwork', async () => checkResponse(await itemPage.request.get(artworkUrl, {
+        headers: canSkip ? getConditionalHeaders(entry) : {}
+      }), 'Artwork request'), spanAttributes);
+
+      if (canSkip && response.status() === 304) {
+        console.log(`  ✓ Unchanged (304), skipped: ${filename}`);
+        await itemPage.close();
+        return this.skippedArtworkResult(item, entry, filepath);
+      }
+
+      if (!response.ok()) {
+        await itemPage.close();
+        throw new Error(`Artwork request failed with HTTP ${response.status()}`);
+      }
+
+      const buffer = await this.timeStep('transfer:artwork-body', async (span) => {
+        const body = await response.body();
+        span.bytes = body.length;
+        return body;
+      }, spanAttributes);
+      const sha256 = hashBuffer(buffer);
+      const headers = response.headers();
+
+      if (manifest) {
+        manifest.items[item.itemNumber] = {
+          url: artworkUrl,
+          filename: filename,
+          size: buffer.length,
+          etag: headers['etag'] || null,
+          lastModified: headers['last-modified'] || null,
+          sha256: sha256,
+          downloadedAt: canSkip && entry.sha256 === sha256 ? entry.downloadedAt : new Date().toISOString()
+        };
+      }
+
+      // Server ignored the validators but sent identical content - keep the existing file
+      if (canSkip && entry.sha256 === sha256) {
+        console.log(`  ✓ Unchanged (same hash), skipped: ${filename}`);
+        await itemPage.close();
+        return this.skippedArtworkResult(item, entry, filepath);
+      }
+
       fs.writeFileSync(filepath, buffer);
       console.log(`  ✓ Downloaded: ${filename}`);
 
@@ -728,6 +1346,7 @@ class EBrandIDDownloader {
 
       return {
         success: true,
+        skipped: false,
         itemNumber: item.itemNumber,
         filename: filename,
         filepath: filepath,
@@ -744,6 +1363,23 @@ class EBrandIDDownloader {
     }
   }
 
+  /**
+   * Build the result for an item whose artwork is already up to date on disk
+   * @param {object} item - Item details
+   * @param {object} entry - Manifest entry for the item
+   * @param {string} filepath - Local path of the existing file
+   */
+  skippedArtworkResult(item, entry, filepath) {
+    return {
+      success: true,
+      skipped: true,
+      itemNumber: item.itemNumber,
+      filename: entry.filename,
+      filepath: filepath,
+      size: entry.size
+    };
+  }
+
   /**
    * Fetch PO information without downloading artwork (optimized for batch processing)
    * Assumes we're already on the PO list page
@@ -754,11 +1390,15 @@ class EBrandIDDownloader {
     console.log(`Fetching PO Information: ${poNumber}`);
     console.log('='.repeat(60));
 
+    const startedAt = Date.now();
     const result = {
       poNumber: poNumber,
       status: 'success',
       itemsFound: 0,
-      error: null
+      itemChanges: null,
+      error: null,
+      retries: 0,
+      timings: this.resetStepTimings()
     };
 
     try {
@@ -768,43 +1408,12 @@ class EBrandIDDownloader {
         throw new Error('Could not find space frame');
       }
 
-      // Step 1: Clear search box and enter PO number
+      // Step 1-2: Enter PO number and submit search (fill replaces the previous value)
       console.log(`Searching for PO ${poNumber}...`);
-      await spaceFrame.fill('#txtWONum', '');
-      await this.page.waitForTimeout(300);
-      await spaceFrame.fill('#txtWONum', poNumber);
-      await this.page.waitForTimeout(500);
-
-      // Step 2: Submit search
-      console.log('Submitting search...');
-      await spaceFrame.press('#txtWONum', 'Enter');
-      await this.page.waitForTimeout(3000);
+      await this.timeStep('search:po-list', () => this.submitPOSearch(spaceFrame, poNumber));
 
       // Step 3: Extract list data from table
-      const listData = await spaceFrame.evaluate((po) => {
-        const rows = Array.from(document.querySelectorAll('table tr'));
-        for (const row of rows) {
-          const cells = row.querySelectorAll('td');
-          if (cells.length >= 9) {
-            const firstCellText = cells[0].textContent.trim();
-            const linkText = cells[0].querySelector('a')?.textContent.trim();
-            if (firstCellText === po || linkText === po) {
-              return {
-                poNumber: firstCellText || linkText,
-                vendorName: cells[1]?.textContent.trim() || '',
-                poDate: cells[2]?.textContent.trim() || '',
-                shipBy: cells[3]?.textContent.trim() || '',
-                shipVia: cells[4]?.textContent.trim() || '',
-                orderType: cells[5]?.textContent.trim() || '',
-                status: cells[6]?.textContent.trim() || '',
-                loc: cells[7]?.textContent.trim() || '',
-                prodRep: cells[8]?.textContent.trim() || ''
-              };
-            }
-          }
-        }
-        return null;
-      }, poNumber);
+      const listData = await this.readPOListRow(spaceFrame, poNumber);
 
       if (listData) {
         console.log('✓ Found PO in list');
@@ -816,98 +1425,21 @@ class EBrandIDDownloader {
       const detailUrl = `${this.config.po_detail_url}?po_id=${poNumber}`;
       console.log('Opening detail page...');
       const detailPage = await this.context.newPage();
-      await detailPage.goto(detailUrl, {
-        waitUntil: 'networkidle',
+      await this.requestStep('navigate:po-detail', async () => checkResponse(await detailPage.goto(detailUrl, {
+        waitUntil: this.getExtractionWaitUntil(),
         timeout: this.config.timeout_seconds * 1000
-      });
-
-      // Step 5: Extract PO header from detail page
-      const poHeader = await detailPage.evaluate(() => {
-        const getText = (selector) => {
-          const el = document.querySelector(selector);
-          return el ? el.textContent.trim() : '';
-        };
-        return {
-          poNumber: getText('#lblBidPOid'),
-          status: getText('#lblStatus').replace(/<[^>]*>/g, '').replace(/\*+/g, '').trim(),
-          company: getText('#lblCompany'),
-          currency: getText('#lblCurrency'),
-          terms: getText('#lblTerms'),
-          vendorName: getText('#lblVendorName'),
-          vendorAddress1: getText('#lblVendAddr1'),
-          vendorAddress2: getText('#lblVendAddr2'),
-          vendorAddress3: getText('#lblVendAddr3'),
-          shipToName: getText('#lblBIDName'),
-          shipToAddress1: getText('#lblBIDAddr1'),
-          shipToAddress2: getText('#lblBIDAddr2'),
-          shipToAddress3: getText('#lblBIDAddr3'),
-          cancelDate: getText('#lblCancelDate'),
-          totalAmount: null
-        };
-      });
+      }), `PO ${poNumber} detail page`));
 
-      // Merge with list data
-      poHeader.poNumber = poNumber;
-      if (listData) {
-        poHeader.poDate = listData.poDate || null;
-        poHeader.shipBy = listData.shipBy || null;
-        poHeader.shipVia = listData.shipVia || null;
-        poHeader.orderType = listData.orderType || null;
-        poHeader.loc = listData.loc || null;
-        poHeader.prodRep = listData.prodRep || null;
-        if (!poHeader.status && listData.status) {
-          poHeader.status = listData.status;
-        }
-        if (!poHeader.vendorName && listData.vendorName) {
-          poHeader.vendorName = listData.vendorName;
-        }
-      }
+      // Step 5: Extract PO header and line items from detail page (merged with list data)
+      const detail = await this.timeStep('extract:po-detail', () => this.extractPODetail(poNumber, listData, detailPage));
 
       // Save PO header
-      savePOHeader(poHeader);
+      this.store.savePOHeader(detail.header);
       console.log('✓ PO header saved to database');
 
-      // Step 6: Extract PO line items from detail page
-      const poItems = await detailPage.evaluate(() => {
-        const rows = Array.from(document.querySelectorAll('#tblItems tbody tr, table[id*="tblItems"] tbody tr'));
-        const itemRows = rows.filter(row => {
-          const cells = row.querySelectorAll('td');
-          return cells.length >= 9 && !row.classList.contains('tableHeaderText');
-        });
-
-        return itemRows.map(row => {
-          const cells = Array.from(row.querySelectorAll('td'));
-          if (cells.length < 9) return null;
-
-          const parsePrice = (str) => {
-            const cleaned = str.replace(/[$,]/g, '').trim();
-            return cleaned ? parseFloat(cleaned) : 0;
-          };
-
-          const parseInt = (str) => {
-            const cleaned = str.replace(/[,]/g, '').trim();
-            return cleaned && cleaned !== 'NA' ? Number(cleaned) : 0;
-          };
-
-          return {
-            itemNumber: cells[0].textContent.trim(),
-            description: cells[1].textContent.trim(),
-            color: cells[2].textContent.trim(),
-            shipTo: cells[3].textContent.trim(),
-            needBy: cells[4].textContent.trim(),
-            qty: parseInt(cells[5].textContent),
-            bundleQty: cells[6].textContent.trim(),
-            unitPrice: parsePrice(cells[7].textContent),
-            extension: parsePrice(cells[8].textContent)
-          };
-        }).filter(item => item !== null && item.itemNumber && !item.itemNumber.includes('Total'));
-      });
-
-      // Add PO number to each item and save
-      const itemsWithPO = poItems.map(item => ({ ...item, poNumber }));
-      itemsWithPO.forEach(item => savePOItem(item));
-      result.itemsFound = itemsWithPO.length;
-      console.log(`✓ ${itemsWithPO.length} line items saved to database`);
+      // Step 6: Save PO line items
+      result.itemChanges = await this.savePOItems(poNumber, detail.items);
+      result.itemsFound = detail.items.length;
 
       // Step 7: Close detail page and return to list page
       await detailPage.close();
@@ -916,12 +1448,16 @@ class EBrandIDDownloader {
       console.log(`\n${'='.repeat(60)}`);
       console.log(`PO ${poNumber} Information Fetched Successfully`);
       console.log(`  Items found: ${result.itemsFound}`);
+      console.log(`  Timed steps: ${this.totalStepTime()} ms`);
       console.log('='.repeat(60));
 
     } catch (error) {
       console.error(`Error fetching PO ${poNumber}:`, error);
       result.status = 'failed';
       result.error = error.message;
+    } finally {
+      result.retries = this.countRetries(result.timings);
+      this.saveRunHistory('fetch-po', result, startedAt);
     }
 
     return result;
@@ -940,7 +1476,10 @@ class EBrandIDDownloader {
       poNumber: poNumber,
       status: 'success',
       itemsFound: 0,
-      error: null
+      itemChanges: null,
+      error: null,
+      retries: 0,
+      timings: this.resetStepTimings()
     };
 
     try {
@@ -953,22 +1492,22 @@ class EBrandIDDownloader {
       // Step 3: Navigate to PO detail page
       await this.navigateToPODetailPage(poNumber);
 
-      // Step 4: Extract and save PO header information (merge with list data)
+      // Step 4: Extract PO header (merged with list data) and line items in one pass
+      const detail = await this.timeStep('extract:po-detail', () => this.extractPODetail(poNumber, listData));
+
+      // Step 5: Save PO header information
       try {
-        const poHeader = await this.extractPOHeader(poNumber, listData);
-        savePOHeader(poHeader);
+        this.store.savePOHeader(detail.header);
         console.log('✓ PO header saved to database');
       } catch (error) {
         console.log(`⚠ Could not save PO header: ${error.message}`);
         throw error;
       }
 
-      // Step 5: Extract and save PO line items
+      // Step 6: Save PO line items
       try {
-        const poItems = await this.extractPOItems(poNumber);
-        poItems.forEach(item => savePOItem(item));
-        result.itemsFound = poItems.length;
-        console.log(`✓ ${poItems.length} line items saved to database`);
+        result.itemChanges = await this.savePOItems(poNumber, detail.items);
+        result.itemsFound = detail.items.length;
       } catch (error) {
         console.log(`⚠ Could not save PO items: ${error.message}`);
         throw error;
@@ -977,9 +1516,10 @@ class EBrandIDDownloader {
       console.log(`\n${'='.repeat(60)}`);
       console.log(`PO ${poNumber} Information Fetched Successfully`);
       console.log(`  Items found: ${result.itemsFound}`);
+      console.log(`  Timed steps: ${this.totalStepTime()} ms`);
       console.log('='.repeat(60));
 
-      // Step 6: Navigate back to index page for next PO
+      // Step 7: Navigate back to index page for next PO
       await this.navigateBackToPOListPage();
 
     } catch (error) {
@@ -988,6 +1528,7 @@ class EBrandIDDownloader {
       result.error = error.message;
     }
 
+    result.retries = this.countRetries(result.timings);
     return result;
   }
 
@@ -1000,14 +1541,19 @@ class EBrandIDDownloader {
     console.log(`Processing PO: ${poNumber}`);
     console.log('='.repeat(60));
 
+    const startedAt = Date.now();
     const result = {
       poNumber: poNumber,
       status: 'success',
       itemsProcessed: 0,
       filesDownloaded: 0,
+      filesSkipped: 0,
       totalSize: 0,
+      itemChanges: null,
       files: [],
-      errors: []
+      errors: [],
+      retries: 0,
+      timings: this.resetStepTimings()
     };
 
     try {
@@ -1020,26 +1566,26 @@ class EBrandIDDownloader {
       // Step 3: Navigate to PO detail page
       await this.navigateToPODetailPage(poNumber);
 
-      // Step 4: Extract and save PO header information (merge with list data)
+      // Step 4: Extract PO header (merged with list data), line items and item links in one pass
+      const detail = await this.timeStep('extract:po-detail', () => this.extractPODetail(poNumber, listData));
+
+      // Step 5: Save PO header information
       try {
-        const poHeader = await this.extractPOHeader(poNumber, listData);
-        savePOHeader(poHeader);
+        this.store.savePOHeader(detail.header);
         console.log('✓ PO header saved to database');
       } catch (error) {
         console.log(`⚠ Could not save PO header: ${error.message}`);
       }
 
-      // Step 5: Extract and save PO line items
+      // Step 6: Save PO line items
       try {
-        const poItems = await this.extractPOItems(poNumber);
-        poItems.forEach(item => savePOItem(item));
-        console.log(`✓ ${poItems.length} line items saved to database`);
+        result.itemChanges = await this.savePOItems(poNumber, detail.items);
       } catch (error) {
         console.log(`⚠ Could not save PO items: ${error.message}`);
       }
 
-      // Get all item links
-      const items = await this.getItemLinks();
+      // Item links were read with the rest of the detail page
+      const items = detail.itemLinks;
       result.itemsProcessed = items.length;
 
       if (items.length === 0) {
@@ -1050,17 +1596,26 @@ class EBrandIDDownloader {
         return result;
       }
 
+      // Load the manifest from the previous run so unchanged artwork is skipped
+      const downloadDir = path.join(__dirname, this.config.download_directory, poNumber);
+      const manifest = loadManifest(downloadDir, poNumber);
+
       // Download artwork for each item
       for (const item of items) {
-        const downloadResult = await this.downloadItemArtwork(item, poNumber);
+        const downloadResult = await this.downloadItemArtwork(item, poNumber, manifest);
 
         if (downloadResult.success) {
-          result.filesDownloaded++;
-          result.totalSize += downloadResult.size;
+          if (downloadResult.skipped) {
+            result.filesSkipped++;
+          } else {
+            result.filesDownloaded++;
+            result.totalSize += downloadResult.size;
+          }
           result.files.push({
             itemNumber: downloadResult.itemNumber,
             filename: downloadResult.filename,
-            size: downloadResult.size
+            size: downloadResult.size,
+            skipped: downloadResult.skipped
           });
         } else {
           result.errors.push({
@@ -1070,36 +1625,35 @@ class EBrandIDDownloader {
         }
       }
 
-      // Save download history to database
       try {
-        saveDownloadHistory({
-          poNumber: poNumber,
-          filesDownloaded: result.filesDownloaded,
-          totalSize: result.totalSize,
-          status: result.status
-        });
-        console.log('✓ Download history saved to database');
+        saveManifest(downloadDir, manifest);
       } catch (error) {
-        console.log(`⚠ Could not save download history: ${error.message}`);
+        console.log(`⚠ Could not save artwork manifest: ${error.message}`);
       }
 
       console.log(`\n${'='.repeat(60)}`);
       console.log(`PO ${poNumber} Summary:`);
       console.log(`  Items processed: ${result.itemsProcessed}`);
       console.log(`  Files downloaded: ${result.filesDownloaded}`);
+      console.log(`  Files skipped (unchanged): ${result.filesSkipped}`);
       console.log(`  Total size: ${(result.totalSize / 1024 / 1024).toFixed(2)} MB`);
       if (result.errors.length > 0) {
         console.log(`  Errors: ${result.errors.length}`);
       }
+      console.log(`  Timed steps: ${this.totalStepTime()} ms`);
       console.log('='.repeat(60));
 
-      // Step 6: Navigate back to index page for next PO
+      // Step 7: Navigate back to index page for next PO
       await this.navigateBackToPOListPage();
 
     } catch (error) {
       console.error(`\n✗ Failed to process PO ${poNumber}: ${error.message}`);
       result.status = 'failed';
       result.errors.push({ reason: error.message });
+    } finally {
+      // Every run is recorded, failed or not, so its trace can be inspected
+      result.retries = this.countRetries(result.timings);
+      this.saveRunHistory('download', result, startedAt);
     }
 
     return result;
@@ -1107,24 +1661,89 @@ class EBrandIDDownloader {
 
   /**
    * Process multiple PO numbers in batch
+   * Every finished PO is appended to the batch journal, so an interrupted run can be
+   * continued with resume (POs already journaled, unless failed, are skipped)
    * @param {Array<string>} poNumbers - Array of PO numbers
+   * @param {object} options - { jobs: POs processed concurrently, resume: continue the last journal }
    */
-  async processBatch(poNumbers) {
+  async processBatch(poNumbers, options = {}) {
+    const { jobs = 1, resume = false } = options;
+    const journalPath = getJournalPath(path.join(__dirname, this.config.download_directory));
+    const previous = resume ? readJournal(journalPath) : new Map();
+    const pending = poNumbers.filter(poNumber => !(previous.has(poNumber) && isFinished(previous.get(poNumber))));
+
     console.log(`\n${'='.repeat(60)}`);
     console.log(`Starting batch processing of ${poNumbers.length} POs`);
+    if (resume) {
+      console.log(`Resuming from ${journalPath}: ${poNumbers.length - pending.length} already done, ${pending.length} to go`);
+    }
     console.log('='.repeat(60));
 
-    const results = [];
+    const results = new Map();
+    poNumbers.forEach(poNumber => {
+      if (previous.has(poNumber) && isFinished(previous.get(poNumber))) {
+        results.set(poNumber, previous.get(poNumber));
+      }
+    });
 
-    for (const poNumber of poNumbers) {
-      const result = await this.downloadPOArtwork(poNumber);
-      results.push(result);
+    const journal = openJournal(journalPath, resume);
+    const progress = createProgress(pending.length);
+
+    // Each lane is a page in the logged-in browser context working through the queue
+    const lanes = [this];
+    try {
+      const laneCount = Math.max(1, Math.min(parseInt(jobs) || 1, pending.length));
+      for (let i = 1; i < laneCount; i++) {
+        try {
+          lanes.push(await this.openLane());
+        } catch (error) {
+          console.log(`⚠ Could not open batch lane ${i + 1}, continuing with ${lanes.length}: ${error.message}`);
+          break;
+        }
+      }
+      if (lanes.length > 1) {
+        console.log(`Processing with ${lanes.length} concurrent pages`);
+      }
+
+      let next = 0;
+      await Promise.all(lanes.map(async (lane) => {
+        while (next < pending.length) {
+          const poNumber = pending[next++];
+          const result = await lane.downloadPOArtwork(poNumber);
+          journal.append(result);
+          results.set(poNumber, result);
+          console.log(`\n${progress.record(result)}`);
+        }
+      }));
+    } finally {
+      for (const lane of lanes.slice(1)) {
+        await lane.close();
+      }
     }
 
-    // Generate summary report
-    this.generateReport(results);
+    // Generate summary report (covers POs finished by earlier runs too)
+    const ordered = [...new Set(poNumbers)].filter(poNumber => results.has(poNumber)).map(poNumber => results.get(poNumber));
+    this.generateReport(ordered);
 
-    return results;
+    return ordered;
+  }
+
+  /**
+   * Open another downloader on its own page of this logged-in browser context
+   * Used for concurrent batch processing; closing it only closes its page
+   */
+  async openLane() {
+    const lane = new EBrandIDDownloader({ store: this.store, onStepTiming: this.onStepTiming });
+    lane.config = this.config;
+    lane.context = this.context;
+    lane.resourceProfile = this.resourceProfile;
+    // One throttle for all lanes, so backoff and concurrency apply to the whole batch
+    lane.throttle = this.throttle;
+    lane.page = await this.context.newPage();
+
+    // The session cookie is shared, so the index page opens without logging in again
+    await lane.navigateBackToPOListPage();
+    return lane;
   }
 
   /**
@@ -1137,18 +1756,27 @@ class EBrandIDDownloader {
     console.log('='.repeat(60));
 
     const totalPOs = results.length;
-    const successfulPOs = results.filter(r => r.status === 'success' && r.filesDownloaded > 0).length;
+    const successfulPOs = results.filter(r => r.status === 'success' && (r.filesDownloaded + (r.filesSkipped || 0)) > 0).length;
     const totalFiles = results.reduce((sum, r) => sum + r.filesDownloaded, 0);
+    const totalSkipped = results.reduce((sum, r) => sum + (r.filesSkipped || 0), 0);
     const totalSize = results.reduce((sum, r) => sum + r.totalSize, 0);
     const totalErrors = results.reduce((sum, r) => sum + r.errors.length, 0);
 
     console.log(`Total POs processed: ${totalPOs}`);
     console.log(`Successful POs: ${successfulPOs}`);
     console.log(`Total files downloaded: ${totalFiles}`);
+    console.log(`Total files skipped (unchanged): ${totalSkipped}`);
     console.log(`Total size: ${(totalSize / 1024 / 1024).toFixed(2)} MB`);
     if (totalErrors > 0) {
       console.log(`Total errors: ${totalErrors}`);
     }
+    const totalRetries = results.reduce((sum, r) => sum + (r.retries || 0), 0);
+    if (totalRetries > 0) {
+      console.log(`Requests retried: ${totalRetries}`);
+    }
+    if (this.throttle && this.throttle.circuitOpenings > 0) {
+      console.log(`Requests paused after repeated failures: ${this.throttle.circuitOpenings} time(s)`);
+    }
 
     // Save detailed report to file
     const reportPath = path.join(__dirname, this.config.download_directory, 'download-report.json');
@@ -1161,9 +1789,15 @@ class EBrandIDDownloader {
    * Close browser
    */
   async close() {
+    if (this.blockedRequestCount > 0) {
+      console.log(`\nBlocked ${this.blockedRequestCount} unneeded resource requests`);
+    }
     if (this.browser) {
       await this.browser.close();
       console.log('\nBrowser closed');
+    } else if (this.page) {
+      // Batch lane: the browser belongs to the downloader that opened it
+      await this.page.close();
     }
   }
 }
@@ -1177,28 +1811,50 @@ async function main() {
     console.log('  Single PO:  node index.js <PO_NUMBER>');
     console.log('  Batch:      node index.js <PO1> <PO2> <PO3> ...');
     console.log('  From file:  node index.js --file <path-to-file>');
+    console.log('\nOptions:');
+    console.log('  --jobs <N>  Process N POs at a time (one browser page each)');
+    console.log('  --resume    Skip POs finished by the last interrupted batch (see batch-journal.jsonl)');
     console.log('\nExamples:');
     console.log('  node index.js 1303061');
     console.log('  node index.js 1303061 1307938');
     console.log('  node index.js --file po-list.txt');
+    console.log('  node index.js --file po-list.txt --jobs 3 --resume');
     process.exit(1);
   }
 
   let poNumbers = [];
+  let jobs = 1;
+  let resume = false;
 
-  // Check if reading from file
-  if (args[0] === '--file') {
-    if (args.length < 2) {
-      console.error('Error: Please specify a file path');
-      process.exit(1);
+  for (let i = 0; i < args.length; i++) {
+    const arg = args[i];
+
+    if (arg === '--file') {
+      // Read PO numbers from a file
+      if (i + 1 >= args.length) {
+        console.error('Error: Please specify a file path');
+        process.exit(1);
+      }
+      const fileContent = fs.readFileSync(args[++i], 'utf-8');
+      poNumbers.push(...fileContent.split('\n')
+        .map(line => line.trim())
+        .filter(line => line && !line.startsWith('#')));
+    } else if (arg === '--jobs') {
+      jobs = parseInt(args[++i]);
+      if (!(jobs >= 1)) {
+        console.error('Error: --jobs needs a number of 1 or more');
+        process.exit(1);
+      }
+    } else if (arg === '--resume') {
+      resume = true;
+    } else {
+      poNumbers.push(arg);
     }
-    const filePath = args[1];
-    const fileContent = fs.readFileSync(filePath, 'utf-8');
-    poNumbers = fileContent.split('\n')
-      .map(line => line.trim())
-      .filter(line => line && !line.startsWith('#'));
-  } else {
-    poNumbers = args;
+  }
+
+  if (poNumbers.length === 0) {
+    console.error('Error: No PO numbers given');
+    process.exit(1);
   }
 
   console.log(`Processing ${poNumbers.length} PO(s): ${poNumbers.join(', ')}`);
@@ -1212,7 +1868,7 @@ async function main() {
   try {
     await downloader.initialize();
     await downloader.login();
-    await downloader.processBatch(poNumbers);
+    await downloader.processBatch(poNumbers, { jobs, resume });
   } catch (error) {
     console.error('\n✗ Fatal error:', error.message);
     console.error(error.stack);
@@ -0,0 +1,189 @@
+// Minimal Prometheus metrics registry (text exposition format 0.0.4)
+// Counters, gauges and histograms with labels; gauges may be collected lazily
+// through a callback when /metrics is scraped.
+
+const registry = new Map();
+
+const DEFAULT_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10];
+
+function labelKey(labelNames, labels = {}) {
+  return labelNames.map(name => String(labels[name] ?? '')).join('\u0000');
+}
+
+function formatLabels(labelNames, key, extra = '') {
+  const values = key === '' && labelNames.length === 0 ? [] : key.split('\u0000');
+  const pairs = labelNames.map((name, i) =>
+    `${name}="${values[i].replace(/\\/g, '\\\\').replace(/\n/g, '\\n').replace(/"/g, '\\"')}"`
+  );
+  if (extra) {
+    pairs.push(extra);
+  }
+  return pairs.length > 0 ? `{${pairs.join(',')}}` : '';
+}
+
+function formatValue(value) {
+  if (value === Infinity) return '+Inf';
+  if (value === -Infinity) return '-Inf';
+  return Number.isNaN(value) ? 'NaN' : String(value);
+}
+
+function register(metric) {
+  if (registry.has(metric.name)) {
+    return registry.get(metric.name);
+  }
+  registry.set(metric.name, metric);
+  return metric;
+}
+
+/**
+ * Monotonic counter
+ * @param {string} name - Metric name
+ * @param {string} help - Help text
+ * @param {Array<string>} labelNames - Label names
+ */
+export function createCounter(name, help, labelNames = []) {
+  const values = new Map();
+
+  return register({
+    name,
+    inc(labels = {}, amount = 1) {
+      const key = labelKey(labelNames, labels);
+      values.set(key, (values.get(key) || 0) + amount);
+    },
+    render() {
+      const lines = [`# HELP ${name} ${help}`, `# TYPE ${name} counter`];
+      for (const [key, value] of values) {
+        lines.push(`${name}${formatLabels(labelNames, key)} ${formatValue(value)}`);
+      }
+      return lines;
+    }
+  });
+}
+
+/**
+ * Gauge, set directly or produced by collect() at scrape time
+ * @param {string} name - Metric name
+ * @param {string} help - Help text
+ * @param {Array<string>} labelNames - Label names
+ * @param {Function} collect - Optional async () => number | Array<{labels, value}>
+ */
+export function createGauge(name, help, labelNames = [], collect = null) {
+  const values = new Map();
+
+  return register({
+    name,
+    set(labels = {}, value) {
+      values.set(labelKey(labelNames, labels), value);
+    },
+    async render() {
+      if (collect) {
+        const collected = await collect();
+        if (typeof collected === 'number') {
+          values.set(labelKey(labelNames, {}), collected);
+        } else if (Array.isArray(collected)) {
+          values.clear();
+          collected.forEach(({ labels, value }) => values.set(labelKey(labelNames, labels), value));
+        }
+      }
+
+      const lines = [`# HELP ${name} ${help}`, `# TYPE ${name} gauge`];
+      for (const [key, value] of values) {
+        lines.push(`${name}${formatLabels(labelNames, key)} ${formatValue(value)}`);
+      }
+      return lines;
+    }
+  });
+}
+
+/**
+ * Histogram with cumulative buckets, _sum and _count series
+ * @param {string} name - Metric name
+ * @param {string} help - Help text
+ * @param {Array<string>} labelNames - Label names
+ * @param {Array<number>} buckets - Upper bounds, ascending
+ */
+export function createHistogram(name, help, labelNames = [], buckets = DEFAULT_BUCKETS) {
+  const series = new Map();
+
+  return register({
+    name,
+    observe(labels = {}, value) {
+      const key = labelKey(labelNames, labels);
+      let entry = series.get(key);
+      if (!entry) {
+        entry = { counts: new Array(buckets.length).fill(0), sum: 0, count: 0 };
+        series.set(key, entry);
+      }
+      for (let i = 0; i < buckets.length; i++) {
+        if (value <= buckets[i]) {
+          entry.counts[i]++;
+        }
+      }
+      entry.sum += value;
+      entry.count++;
+    },
+    render() {
+      const lines = [`# HELP ${name} ${help}`, `# TYPE ${name} histogram`];
+      for (const [key, entry] of series) {
+        buckets.forEach((bound, i) => {
+          lines.push(`${name}_bucket${formatLabels(labelNames, key, `le="${bound}"`)} ${entry.counts[i]}`);
+        });
+        lines.push(`${name}_bucket${formatLabels(labelNames, key, 'le="+Inf"')} ${entry.count}`);
+        lines.push(`${name}_sum${formatLabels(labelNames, key)} ${formatValue(entry.sum)}`);
+        lines.push(`${name}_count${formatLabels(labelNames, key)} ${entry.count}`);
+      }
+      return lines;
+    }
+  });
+}
+
+/**
+ * Time a synchronous or async function into a histogram (seconds)
+ * @param {object} histogram - Histogram from createHistogram
+ * @param {object} labels - Label values
+ * @param {Function} fn - Function to run
+ */
+export function timeCall(histogram, labels, fn) {
+  const start = process.hrtime.bigint();
+  const observe = () => histogram.observe(labels, Number(process.hrtime.bigint() - start) / 1e9);
+
+  let result;
+  try {
+    result = fn();
+  } catch (error) {
+    observe();
+    throw error;
+  }
+
+  if (result && typeof result.then === 'function') {
+    return result.finally(observe);
+  }
+  observe();
+  return result;
+}
+
+/**
+ * Wrap every function of a module namespace so each call is timed into a histogram
+ * @param {object} module - Module namespace (import * as db from './database.js')
+ * @param {object} histogram - Histogram with a "function" label
+ */
+export function instrumentFunctions(module, histogram) {
+  const wrapped = {};
+  for (const [name, value] of Object.entries(module)) {
+    wrapped[name] = typeof value === 'function'
+      ? (...args) => timeCall(histogram, { function: name }, () => value(...args))
+      : value;
+  }
+  return wrapped;
+}
+
+/**
+ * Render every registered metric in Prometheus text format
+ */
+export async function renderMetrics() {
+  const lines = [];
+  for (const metric of registry.values()) {
+    lines.push(...(await metric.render()));
+  }
+  return `${lines.join('\n')}\n`;
+}
@@ -0,0 +1,275 @@
+// In-page extractors for the e-brandid pages
+// Each function runs inside the browser via page.evaluate / frame.evaluate and reads
+// every field it needs in that one evaluation, so an extractor costs a single IPC
+// round trip however many rows or fields the page has. Playwright serializes the
+// function source, so these must stay self-contained: no imports, no references to
+// anything outside the function body, and a JSON-serializable return value.
+// bench-extractors.js runs them against the captured pages without a login.
+
+/**
+ * Read the PO rows currently shown in the Purchase Order list grid
+ */
+export function readPOListRows() {
+  const rows = Array.from(document.querySelectorAll('table tr'));
+  const results = [];
+
+  for (const row of rows) {
+    const cells = row.querySelectorAll(':scope > td');
+    if (cells.length < 9) continue;
+
+    const linkText = cells[0].querySelector('a')?.textContent.trim();
+    const poNumber = linkText || cells[0].textContent.trim();
+
+    // Header and layout rows have no PO number-like first cell
+    if (!poNumber || !/\d/.test(poNumber) || /\s/.test(poNumber)) continue;
+
+    results.push({
+      poNumber,
+      vendorName: cells[1]?.textContent.trim() || '',
+      poDate: cells[2]?.textContent.trim() || '',
+      shipBy: cells[3]?.textContent.trim() || '',
+      shipVia: cells[4]?.textContent.trim() || '',
+      orderType: cells[5]?.textContent.trim() || '',
+      status: cells[6]?.textContent.trim() || '',
+      loc: cells[7]?.textContent.trim() || '',
+      prodRep: cells[8]?.textContent.trim() || ''
+    });
+  }
+
+  return results;
+}
+
+/**
+ * Find the list grid row of one PO (null if it is not shown)
+ * @param {string} po - Purchase Order number
+ */
+export function findPOListRow(po) {
+  const rows = Array.from(document.querySelectorAll('table tr'));
+
+  for (const row of rows) {
+    const cells = row.querySelectorAll('td');
+    if (cells.length < 9) continue;
+
+    // Match either the cell text or the link text of the first cell
+    const firstCellText = cells[0].textContent.trim();
+    const linkText = cells[0].querySelector('a')?.textContent.trim();
+
+    if (firstCellText === po || linkText === po) {
+      return {
+        poNumber: firstCellText || linkText,
+        vendorName: cells[1]?.textContent.trim() || '',
+        poDate: cells[2]?.textContent.trim() || '',
+        shipBy: cells[3]?.textContent.trim() || '',
+        shipVia: cells[4]?.textContent.trim() || '',
+        orderType: cells[5]?.textContent.trim() || '',
+        status: cells[6]?.textContent.trim() || '',
+        loc: cells[7]?.textContent.trim() || '',
+        prodRep: cells[8]?.textContent.trim() || ''
+      };
+    }
+  }
+
+  return null;
+}
+
+/**
+ * Read the header labels of the PO detail page (factoryPODetail.aspx)
+ */
+export function readPOHeader() {
+  const getText = (selector) => {
+    const el = document.querySelector(selector);
+    return el ? el.textContent.trim() : '';
+  };
+
+  return {
+    poNumber: getText('#lblBidPOid'),
+    status: getText('#lblStatus').replace(/<[^>]*>/g, '').replace(/\*+/g, '').trim(),
+    company: getText('#lblCompany'),
+    currency: getText('#lblCurrency'),
+    terms: getText('#lblTerms'),
+    vendorName: getText('#lblVendorName'),
+    vendorAddress1: getText('#lblVendAddr1'),
+    vendorAddress2: getText('#lblVendAddr2'),
+    vendorAddress3: getText('#lblVendAddr3'),
+    shipToName: getText('#lblBIDName'),
+    shipToAddress1: getText('#lblBIDAddr1'),
+    shipToAddress2: getText('#lblBIDAddr2'),
+    shipToAddress3: getText('#lblBIDAddr3'),
+    cancelDate: getText('#lblCancelDate'),
+    totalAmount: null
+  };
+}
+
+/**
+ * Read the line items table of the PO detail page
+ */
+export function readPOItems() {
+  const parsePrice = (str) => {
+    const cleaned = str.replace(/[$,]/g, '').trim();
+    return cleaned ? parseFloat(cleaned) : 0;
+  };
+
+  const parseQty = (str) => {
+    const cleaned = str.replace(/[,]/g, '').trim();
+    return cleaned && cleaned !== 'NA' ? Number(cleaned) : 0;
+  };
+
+  const rows = Array.from(document.querySelectorAll('#tblItems tbody tr, table[id*="tblItems"] tbody tr'));
+  const items = [];
+
+  for (const row of rows) {
+    const cells = row.querySelectorAll('td');
+    if (cells.length < 9 || row.classList.contains('tableHeaderText')) continue;
+
+    const itemNumber = cells[0].textContent.trim();
+    if (!itemNumber || itemNumber.includes('Total')) continue;
+
+    items.push({
+      itemNumber,
+      description: cells[1].textContent.trim(),
+      color: cells[2].textContent.trim(),
+      shipTo: cells[3].textContent.trim(),
+      needBy: cells[4].textContent.trim(),
+      qty: parseQty(cells[5].textContent),
+      bundleQty: cells[6].textContent.trim(),
+      unitPrice: parsePrice(cells[7].textContent),
+      extension: parsePrice(cells[8].textContent)
+    });
+  }
+
+  return items;
+}
+
+/**
+ * Read the item detail links of the PO detail page
+ * The request_id and item_suffix_id come from the openItemDetail(...) onclick handler
+ */
+export function readItemLinks() {
+  const anchors = Array.from(document.querySelectorAll('a[href="#"][onclick*="openItemDetail"]'));
+  const links = [];
+
+  for (const a of anchors) {
+    const match = (a.getAttribute('onclick') || '').match(/openItemDetail\((\d+),\s*(\d+)\)/);
+    if (match) {
+      links.push({
+        itemNumber: a.textContent.trim(),
+        requestId: match[1],
+        itemSuffixId: match[2]
+      });
+    }
+  }
+
+  return links;
+}
+
+/**
+ * Read the artwork download URL of the item detail page (null if there is none)
+ */
+export function readArtworkUrl() {
+  const link = document.querySelector('a[id*="ArtworkImageDownload"]');
+  if (!link) {
+    return null;
+  }
+
+  // The URL is the first argument of MM_openBrWindow('URL',...)
+  const match = (link.getAttribute('onclick') || '').match(/MM_openBrWindow\('([^']+)'/);
+  return match ? match[1] : null;
+}
+
+/**
+ * Read every message row of the Messages table
+ * Returns the rows plus cell dumps of the first few table rows for the debug log
+ */
+export function readMessageRows() {
+  const DEBUG_ROWS = 5;
+  const rows = Array.from(document.querySelectorAll('table tr'));
+  const messageData = [];
+  const debugInfo = [];
+
+  // Work out the detail URL and CommentId behind a Subject link without clicking it
+  const resolveLink = (link) => {
+    const href = link.getAttribute('href') || '';
+    const onclick = link.getAttribute('onclick') || '';
+    const source = `${href} ${onclick}`;
+
+    let detailUrl = null;
+    if (href && href !== '#' && !href.toLowerCase().startsWith('javascript:')) {
+      detailUrl = href;
+    } else {
+      const urlMatch = source.match(/['"]([^'"]+\.aspx[^'"]*)['"]/i);
+      if (urlMatch) {
+        detailUrl = urlMatch[1];
+      }
+    }
+
+    let commentId = null;
+    const idMatch = source.match(/CommentId=(\d+)/i) || onclick.match(/\((?:\s*['"]?)(\d+)/);
+    if (idMatch) {
+      commentId = idMatch[1];
+    }
+
+    return {
+      detailUrl: detailUrl ? new URL(detailUrl, document.baseURI).href : null,
+      commentId
+    };
+  };
+
+  for (let rowIndex = 0; rowIndex < rows.length; rowIndex++) {
+    const cells = rows[rowIndex].querySelectorAll('td');
+    if (cells.length === 0) continue;
+
+    const isSubHeader = cells[0].className?.includes('SubHeader');
+
+    // Only the first rows are logged, so don't ship the rest back to Node
+    if (debugInfo.length < DEBUG_ROWS) {
+      const debug = { cellCount: cells.length };
+      for (let i = 0; i < 8; i++) {
+        debug[`cell${i}`] = cells[i]?.textContent.trim().substring(0, 50);
+      }
+      debug.hasSubHeader = isSubHeader;
+      debugInfo.push(debug);
+    }
+
+    // Skip header rows (rows with SubHeader class)
+    if (isSubHeader || cells.length < 8) continue;
+
+    // Ref#, Author, Received, Subject, Comment - the first 3 cells are icon columns
+    const subjectCell = cells[6];
+    const subjectLink = subjectCell.querySelector('a');
+    const { detailUrl, commentId } = subjectLink
+      ? resolveLink(subjectLink)
+      : { detailUrl: null, commentId: null };
+
+    messageData.push({
+      refNumber: cells[3].textContent.trim(),
+      author: cells[4].textContent.trim(),
+      receivedDate: cells[5].textContent.trim(),
+      subject: subjectCell.textContent.trim(),
+      comment: cells[7].textContent.trim(),
+      rowIndex,
+      hasSubjectLink: subjectLink !== null,
+      detailUrl,
+      commentId
+    });
+  }
+
+  return { messages: messageData, debug: debugInfo };
+}
+
+/**
+ * Build one evaluate() expression that runs several extractors and returns their
+ * results keyed by name, e.g. { header: readPOHeader, items: readPOItems }
+ * @param {object} extractors - Map of result name to extractor function (no arguments)
+ */
+export function combineExtractors(extractors) {
+  const fields = Object.entries(extractors)
+    .map(([name, extractor]) => `${JSON.stringify(name)}: (${extractor.toString()})()`);
+  return `({ ${fields.join(', ')} })`;
+}
+
+// Everything read from the PO detail page in a single round trip
+export const PO_DETAIL_EXTRACTOR = combineExtractors({
+  header: readPOHeader,
+  items: readPOItems,
+  itemLinks: readItemLinks
+});
@@ -59,19 +59,30 @@ function filterTable(table, filterInputs, tbody) {
 }
 
 // Initialize filters for all tables when DOM is loaded
+// (orders, messages and items are VirtualTables, which filter their own records)
 document.addEventListener('DOMContentLoaded', () => {
-    initializeTableFilters('messages-table');
-    initializeTableFilters('orders-table');
     initializeTableFilters('po-items-table');
 });
 
 // Re-initialize filters when tables are populated
 function reinitializeFilters() {
-    initializeTableFilters('messages-table');
-    initializeTableFilters('orders-table');
     initializeTableFilters('po-items-table');
 }
 
+// Format a timestamp as YYYY/MM/DD HH:mm:ss
+function formatTimestamp(value) {
+    if (!value) return 'N/A';
+
+    const date = new Date(value);
+    const year = date.getFullYear();
+    const month = String(date.getMonth() + 1).padStart(2, '0');
+    const day = String(date.getDate()).padStart(2, '0');
+    const hours = String(date.getHours()).padStart(2, '0');
+    const minutes = String(date.getMinutes()).padStart(2, '0');
+    const seconds = String(date.getSeconds()).padStart(2, '0');
+    return `${year}/${month}/${day} ${hours}:${minutes}:${seconds}`;
+}
+
 // Custom Modal Functions
 function showModal(message, buttons) {
     return new Promise((resolve) => {
@@ -264,17 +275,20 @@ function displayResults(results) {
     results.forEach(result => {
         const row = document.createElement('tr');
 
-        const statusClass = result.status === 'success' && result.filesDownloaded > 0
+        // Skipped files are already up to date on disk, so they count towards success
+        const filesAvailable = (result.filesDownloaded || 0) + (result.filesSkipped || 0);
+
+        const statusClass = result.status === 'success' && filesAvailable > 0
             ? 'status-success'
             : result.status === 'failed'
             ? 'status-failed'
             : 'status-partial';
 
-        const statusText = result.status === 'success' && result.filesDownloaded > 0
+        const statusText = result.status === 'success' && filesAvailable > 0
             ? 'Success'
             : result.status === 'failed'
             ? 'Failed'
-            : result.filesDownloaded > 0
+            : filesAvailable > 0
             ? 'Partial'
             : 'No Files';
 
@@ -288,6 +302,7 @@ function displayResults(results) {
             <td class="${statusClass}">${statusText}</td>
             <td>${result.itemsProcessed || 0}</td>
             <td>${result.filesDownloaded || 0}</td>
+            <td>${result.filesSkipped || 0}</td>
             <td>${formatBytes(result.totalSize || 0)}</td>
             <td>${errorCell}</td>
         `;
@@ -423,6 +438,169 @@ const backToListBtn = document.getElementById('back-to-list-btn');
 let currentOffset = 0;
 let currentOrders = [];
 
+// Orders table column -> /api/orders/query column (filter inputs and sortable headers)
+const ORDER_QUERY_COLUMNS = [
+    null, 'po_number', 'po_date', 'ship_by', 'ship_via', 'order_type', 'status', 'loc', 'prod_rep',
+    'company', 'vendor_name', 'item_count', 'total_qty', 'total_amount', 'currency', 'created_at'
+];
+const ORDER_QUERY_PAGE_SIZE = 200;
+
+// Server-side query state, set once a column filter or sort is used
+let orderQuery = null;
+let orderQuerySequence = 0;
+let orderQueryLoading = false;
+
+const ordersTable = new VirtualTable({
+    tableId: 'orders-table',
+    columnCount: 20,
+    emptyMessage: 'No orders found',
+    onFilter: (filters) => updateOrderQuery({ filters }),
+    onReachEnd: () => loadMoreQueriedOrders(),
+    rowValues: (order, index) => [
+        index + 1,
+        order.po_number,
+        order.po_date || 'N/A',
+        order.ship_by || 'N/A',
+        order.ship_via || 'N/A',
+        order.order_type || 'N/A',
+        order.status || 'N/A',
+        order.loc || 'N/A',
+        order.prod_rep || 'N/A',
+        order.company || 'N/A',
+        order.vendor_name || 'N/A',
+        order.item_count || 0,
+        (order.total_qty || 0).toLocaleString(),
+        `$${(order.total_amount || 0).toFixed(2)}`,
+        order.currency || 'N/A',
+        formatTimestamp(order.created_at)
+    ],
+    renderRow: (order, index, values) => `
+            ${values.slice(0, 11).map(value => `<td>${value}</td>`).join('')}
+            ${values.slice(11, 14).map(value => `<td style="text-align: right;">${value}</td>`).join('')}
+            <td>${values[14]}</td>
+            <td>${values[15]}</td>
+            <td><button class="view-detail-btn" data-po="${order.po_number}">View Details</button></td>
+            <td><button class="qc-report-btn" data-po="${order.po_number}">QC report</button></td>
+            <td><button class="create-po-btn" data-po="${order.po_number}">Create PO</button></td>
+            <td><button class="delete-btn" data-po="${order.po_number}">Delete</button></td>
+        `
+});
+
+// Sortable headers: click to sort on the server, click again to reverse
+document.querySelectorAll('#orders-table thead tr:first-child th').forEach((th, column) => {
+    if (!ORDER_QUERY_COLUMNS[column]) return;
+
+    th.classList.add('sortable');
+    th.dataset.sort = ORDER_QUERY_COLUMNS[column];
+    th.addEventListener('click', () => {
+        const sort = ORDER_QUERY_COLUMNS[column];
+        const current = orderQuery || {};
+        const direction = current.sort === sort && current.direction === 'asc' ? 'desc' : 'asc';
+        updateOrderQuery({ sort, direction });
+    });
+});
+
+// Apply a filter/sort change and fetch the first page from /api/orders/query
+async function updateOrderQuery(changes) {
+    orderQuery = {
+        filters: {},
+        sort: 'created_at',
+        direction: 'desc',
+        ...orderQuery,
+        ...changes,
+        nextCursor: null
+    };
+
+    document.querySelectorAll('#orders-table thead th.sortable').forEach(th => {
+        th.classList.remove('sort-asc', 'sort-desc');
+        if (th.dataset.sort === orderQuery.sort) {
+            th.classList.add(orderQuery.direction === 'asc' ? 'sort-asc' : 'sort-desc');
+        }
+    });
+
+    await queryOrders(false);
+}
+
+async function loadMoreQueriedOrders() {
+    if (!orderQuery || !orderQuery.nextCursor || orderQueryLoading) return;
+    await queryOrders(true);
+}
+
+async function queryOrders(append) {
+    const sequence = ++orderQuerySequence;
+    const params = new URLSearchParams({
+        sort: orderQuery.sort,
+        direction: orderQuery.direction,
+        limit: ORDER_QUERY_PAGE_SIZE
+    });
+
+    for (const [column, value] of Object.entries(orderQuery.filters)) {
+        const queryColumn = ORDER_QUERY_COLUMNS[column];
+        if (queryColumn) {
+            params.append(`filters[${queryColumn}]`, value);
+        }
+    }
+    if (append) {
+        params.set('cursor', orderQuery.nextCursor);
+    }
+
+    orderQueryLoading = true;
+    try {
+        const response = await fetch(`/api/orders/query?${params}`);
+        const data = await response.json();
+
+        if (!response.ok) {
+            throw new Error(data.error || response.statusText);
+        }
+
+        // A newer filter/sort change superseded this request
+        if (sequence !== orderQuerySequence) return;
+
+        orderQuery.nextCursor = data.nextCursor;
+        currentOrders = append ? currentOrders.concat(data.orders) : data.orders;
+        currentOffset = 0;
+        displayOrdersList(currentOrders, !append);
+
+        document.getElementById('orders-footer').innerHTML =
+            `<tr><td colspan="20">Showing ${currentOrders.length} of ${data.total} matching orders</td></tr>`;
+    } catch (error) {
+        await showAlert('Error querying orders: ' + error.message);
+    } finally {
+        if (sequence === orderQuerySequence) {
+            orderQueryLoading = false;
+        }
+    }
+}
+
+// Leave query mode (used by Latest/All/Search, which load their own lists)
+function resetOrderQuery() {
+    orderQuery = null;
+    orderQuerySequence++;
+    orderQueryLoading = false;
+    ordersTable.clearFilters();
+    document.querySelectorAll('#orders-table thead th.sortable').forEach(th => {
+        th.classList.remove('sort-asc', 'sort-desc');
+    });
+}
+
+// One delegated handler for the row buttons (rows are re-rendered while scrolling)
+ordersBody.addEventListener('click', async (e) => {
+    const button = e.target.closest('button[data-po]');
+    if (!button) return;
+
+    const poNumber = button.getAttribute('data-po');
+
+    if (button.classList.contains('view-detail-btn')) {
+        await loadPODetail(poNumber);
+    } else if (button.classList.contains('qc-report-btn')) {
+        await generateQCReport(poNumber);
+    } else if (button.classList.contains('delete-btn')) {
+        await deletePO(poNumber);
+    } else if (button.classList.contains('create-po-btn')) {
+        await openPODisplayModal(poNumber);
+    }
+});
+
 // Auto-load latest 10 POs when Order Status view is activated
 document.querySelectorAll('.nav-button').forEach(button => {
     const originalClickHandler = button.onclick;
@@ -435,6 +613,15 @@ document.querySelectorAll('.nav-button').forEach(button => {
 
 // Load more orders (10 more)
 loadMoreBtn.addEventListener('click', async () => {
+    if (orderQuery) {
+        if (!orderQuery.nextCursor) {
+            await showAlert('No more records to load');
+            return;
+        }
+        await loadMoreQueriedOrders();
+        return;
+    }
+
     currentOffset += 10;
     await loadLatestOrders(10, currentOffset, true);
 });
@@ -515,7 +702,7 @@ deleteAllBtn.addEventListener('click', async () => {
         await showAlert('All Purchase Orders deleted successfully');
 
         // Clear the orders list display
-        ordersBody.innerHTML = '<tr><td colspan="19" style="text-align: center;">No orders found</td></tr>';
+        ordersTable.showMessage('No orders found');
         currentOrders = [];
         currentOffset = 0;
     } catch (error) {
@@ -534,6 +721,10 @@ async function loadLatestOrders(limit = 10, offset = 0, append = false) {
         const response = await fetch(`/api/orders?limit=${limit}&offset=${offset}`);
         const orders = await response.json();
 
+        if (!append) {
+            resetOrderQuery();
+        }
+
         if (append) {
             // If no more records, show alert and don't update display
             if (orders.length === 0) {
@@ -556,6 +747,7 @@ async function loadAllOrders() {
     try {
         const response = await fetch('/api/orders');
         const orders = await response.json();
+        resetOrderQuery();
         currentOrders = orders;
         currentOffset = 0;
         displayOrdersList(orders);
@@ -568,6 +760,7 @@ async function searchOrders(term) {
     try {
         const response = await fetch(`/api/orders/search/${encodeURIComponent(term)}`);
         const orders = await response.json();
+        resetOrderQuery();
         currentOrders = orders;
         currentOffset = 0;
         displayOrdersList(orders);
@@ -576,98 +769,13 @@ async function searchOrders(term) {
     }
 }
 
-function displayOrdersList(orders) {
-    ordersBody.innerHTML = '';
+function displayOrdersList(orders, scrollToTop = true) {
     const ordersFooter = document.getElementById('orders-footer');
     ordersFooter.innerHTML = '';
     ordersListSection.style.display = 'block';
     poDetailSection.style.display = 'none';
 
-    if (orders.length === 0) {
-        ordersBody.innerHTML = '<tr><td colspan="20" style="text-align: center;">No orders found</td></tr>';
-        return;
-    }
-
-    orders.forEach((order, index) => {
-        const row = document.createElement('tr');
-
-        // Format created_at as YYYY/MM/DD HH:mm:ss
-        let formattedDate = 'N/A';
-        if (order.created_at) {
-            const date = new Date(order.created_at);
-            const year = date.getFullYear();
-            const month = String(date.getMonth() + 1).padStart(2, '0');
-            const day = String(date.getDate()).padStart(2, '0');
-            const hours = String(date.getHours()).padStart(2, '0');
-            const minutes = String(date.getMinutes()).padStart(2, '0');
-            const seconds = String(date.getSeconds()).padStart(2, '0');
-            formattedDate = `${year}/${month}/${day} ${hours}:${minutes}:${seconds}`;
-        }
-
-        // Format quantity with commas
-        const qty = order.total_qty || 0;
-        const formattedQty = qty.toLocaleString();
-
-        // Format amount with 2 decimal places
-        const amount = order.total_amount || 0;
-        const formattedAmount = amount.toFixed(2);
-
-        row.innerHTML = `
-            <td>${index + 1}</td>
-            <td>${order.po_number}</td>
-            <td>${order.po_date || 'N/A'}</td>
-            <td>${order.ship_by || 'N/A'}</td>
-            <td>${order.ship_via || 'N/A'}</td>
-            <td>${order.order_type || 'N/A'}</td>
-            <td>${order.status || 'N/A'}</td>
-            <td>${order.loc || 'N/A'}</td>
-            <td>${order.prod_rep || 'N/A'}</td>
-            <td>${order.company || 'N/A'}</td>
-            <td>${order.vendor_name || 'N/A'}</td>
-            <td style="text-align: right;">${order.item_count || 0}</td>
-            <td style="text-align: right;">${formattedQty}</td>
-            <td style="text-align: right;">$${formattedAmount}</td>
-            <td>${order.currency || 'N/A'}</td>
-            <td>${formattedDate}</td>
-            <td><button class="view-detail-btn" data-po="${order.po_number}">View Details</button></td>
-            <td><button class="qc-report-btn" data-po="${order.po_number}">QC report</button></td>
-            <td><button class="create-po-btn" data-po="${order.po_number}">Create PO</button></td>
-            <td><button class="delete-btn" data-po="${order.po_number}">Delete</button></td>
-        `;
-        ordersBody.appendChild(row);
-    });
-
-    // Add click handlers to view detail buttons
-    document.querySelectorAll('.view-detail-btn').forEach(btn => {
-        btn.addEventListener('click', async (e) => {
-            const poNumber = e.target.getAttribute('data-po');
-            await loadPODetail(poNumber);
-        });
-    });
-
-    // Add click handlers to QC report buttons
-    document.querySelectorAll('.qc-report-btn').forEach(btn => {
-        btn.addEventListener('click', async (e) => {
-            const poNumber = e.target.getAttribute('data-po');
-            await generateQCReport(poNumber);
-        });
-    });
-
-    // Add click handlers to delete buttons
-    document.querySelectorAll('.delete-btn').forEach(btn => {
-        btn.addEventListener('click', async (e) => {
-            const poNumber = e.target.getAttribute('data-po');
-            await deletePO(poNumber);
-        });
-    });
-
-    // Add click handlers to create PO buttons
-    document.querySelectorAll('.create-po-btn').forEach(btn => {
-        btn.addEventListener('click', async (e) => {
-            const poNumber = e.target.getAttribute('data-po');
-            await openPODisplayModal(poNumber);
-        });
-    });
+    ordersTable.setRows(orders, scrollToTop);
 }
 
 async function loadPODetail(poNumber) {
@@ -861,37 +969,87 @@ const messageProgressLog = document.getElementById('message-progress-log');
 const messagesListSection = document.getElementById('messages-list-section');
 const messagesBody = document.getElementById('messages-body');
 
+const MESSAGE_PAGE_SIZE = 500;
+
+const messagesTable = new VirtualTable({
+    tableId: 'messages-table',
+    columnCount: 7,
+    emptyMessage: 'No messages in database',
+    rowValues: (message) => [
+        message.refNumber,
+        message.author,
+        message.receivedDate,
+        message.subject,
+        message.comment
+    ],
+    renderRow: (message, index, values) => `
+            ${values.map(value => `<td title="${String(value ?? '').replace(/"/g, '&quot;')}">${value}</td>`).join('')}
+            <td><button class="submit-btn view-message-btn" data-index="${index}">View</button></td>
+            <td><button class="submit-btn delete-message-btn" data-id="${message.id}" style="background-color: #d32f2f;">Delete</button></td>
+        `
+});
+
+messagesBody.addEventListener('click', (e) => {
+    const button = e.target.closest('button');
+    if (!button) return;
+
+    if (button.classList.contains('view-message-btn')) {
+        showMessageDetails(parseInt(button.getAttribute('data-index')));
+    } else if (button.classList.contains('delete-message-btn')) {
+        deleteMessageById(parseInt(button.getAttribute('data-id')));
+    }
+});
+
+// Fetch the message list page by page (bodies are loaded on demand by showMessageDetails)
+async function fetchMessageList() {
+    const messages = [];
+    let total = null;
+
+    while (total === null || messages.length < total) {
+        const response = await fetch(`/api/messages?limit=${MESSAGE_PAGE_SIZE}&offset=${messages.length}`);
+        const data = await response.json();
+        total = data.total;
+
+        if (!data.messages || data.messages.length === 0) {
+            break;
+        }
+
+        data.messages.forEach(msg => messages.push({
+            id: msg.id,
+            refNumber: msg.ref_number,
+            author: msg.author,
+            receivedDate: msg.received_date,
+            subject: msg.subject,
+            comment: msg.comment,
+            hasDetails: Boolean(msg.has_details),
+            messageLink: msg.message_link,
+            commentId: msg.comment_id
+        }));
+    }
+
+    return messages;
+}
+
 // Function to load all messages from database
 async function loadAllMessagesFromDatabase() {
     try {
-        messagesBody.innerHTML = '';
+        messagesTable.showMessage('');
         messageProgressSection.style.display = 'none';
         messagesListSection.style.display = 'block';
 
-        const response = await fetch('/api/messages');
-        const data = await response.json();
+        const messages = await fetchMessageList();
 
-        if (data.messages && data.messages.length > 0) {
-            messagesTitle.textContent = `All Messages from Database (${data.messages.length} total)`;
-            displayMessages(data.messages.map(msg => ({
-                id: msg.id,
-                refNumber: msg.ref_number,
-                author: msg.author,
-                receivedDate: msg.received_date,
-                subject: msg.subject,
-                comment: msg.comment,
-                fullDetails: msg.full_details,
-                messageLink: msg.message_link,
-                commentId: msg.comment_id
-            })));
+        if (messages.length > 0) {
+            messagesTitle.textContent = `All Messages from Database (${messages.length} total)`;
+            displayMessages(messages);
         } else {
             messagesTitle.textContent = 'No Messages Found';
-            messagesBody.innerHTML = '<tr><td colspan="7" style="text-align: center;">No messages in database</td></tr>';
+            messagesTable.showMessage('No messages in database');
         }
     } catch (error) {
         console.error('Error loading messages:', error);
         messagesTitle.textContent = 'Error Loading Messages';
-        messagesBody.innerHTML = '<tr><td colspan="7" style="text-align: center;">Error loading messages</td></tr>';
+        messagesTable.showMessage('Error loading messages');
     }
 }
 
@@ -940,44 +1098,51 @@ function pollMessageJobStatus(jobId) {
                 }
 
                 fetchMsgBtn.disabled = false;
+                document.getElementById('sync-msg-btn').disabled = false;
             } else if (data.status === 'failed') {
                 clearInterval(interval);
                 addMessageProgressLog(`Job failed: ${data.error}`, 'error');
                 fetchMsgBtn.disabled = false;
+                document.getElementById('sync-msg-btn').disabled = false;
             }
         } catch (error) {
             clearInterval(interval);
             addMessageProgressLog(`Error polling status: ${error.message}`, 'error');
             fetchMsgBtn.disabled = false;
+            document.getElementById('sync-msg-btn').disabled = false;
         }
     }, 1000);
 }
 
 function displayMessages(messages) {
-    messagesBody.innerHTML = '';
     messagesListSection.style.display = 'block';
 
     // Store messages globally for showMessageDetails
     window.currentMessages = messages;
 
-    messages.forEach(message => {
-        const row = document.createElement('tr');
-        row.innerHTML = `
-            <td>${message.refNumber}</td>
-            <td>${message.author}</td>
-            <td>${message.receivedDate}</td>
-            <td>${message.subject}</td>
-            <td>${message.comment}</td>
-            <td><button class="submit-btn" onclick="showMessageDetails('${message.refNumber}')">View</button></td>
-            <td><button class="submit-btn" onclick="deleteMessageById(${message.id})" style="background-color: #d32f2f;">Delete</button></td>
-        `;
-        messagesBody.appendChild(row);
-    });
+    messagesTable.setRows(messages);
 }
 
-window.showMessageDetails = function(refNumber) {
+window.showMessageDetails = async function(index) {
     // Find the message in the current results
-    const message = window.currentMessages.find(m => m.refNumber === refNumber);
+    const message = window.currentMessages[index];
+
+    // Database rows are listed without bodies - load the full details on demand
+    if (message && !message.fullDetails && message.id) {
+        try {
+            const response = await fetch(`/api/messages/${message.id}`);
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            const data = await response.json();
+            message.fullDetails = data.message.full_details;
+            message.messageLink = data.message.message_link || message.messageLink;
+        } catch (error) {
+            await showAlert('Error loading message details: ' + error.message);
+            return;
+        }
+    }
+
     if (message && message.fullDetails) {
         // Show the message detail modal with styled HTML
         const modal = document.getElementById('message-detail-modal');
@@ -1161,7 +1326,7 @@ fetchMsgBtn.addEventListener('click', async () => {
     const headless = !document.getElementById('message-headless-toggle').checked;
 
     messageProgressLog.innerHTML = '';
-    messagesBody.innerHTML = '';
+    messagesTable.showMessage('');
     messageProgressSection.style.display = 'block';
     messagesListSection.style.display = 'none';
     fetchMsgBtn.disabled = true;
@@ -1194,35 +1359,70 @@ fetchMsgBtn.addEventListener('click', async () => {
     }
 });
 
+// Sync new messages button (fetches everything newer than the stored cursor)
+const syncMsgBtn = document.getElementById('sync-msg-btn');
+
+syncMsgBtn.addEventListener('click', async () => {
+    // Get headless mode preference (inverted: checked = visible, unchecked = headless)
+    const headless = !document.getElementById('message-headless-toggle').checked;
+
+    messageProgressLog.innerHTML = '';
+    messagesTable.showMessage('');
+    messageProgressSection.style.display = 'block';
+    messagesListSection.style.display = 'none';
+    fetchMsgBtn.disabled = true;
+    syncMsgBtn.disabled = true;
+
+    try {
+        const stateResponse = await fetch('/api/sync-messages/state');
+        const state = await stateResponse.json();
+        const since = state.cursor ? state.cursor.receivedDate || state.cursor.receivedAt : 'the last 7 days';
+        addMessageProgressLog(`Starting message sync (new since ${since})...`, 'info');
+
+        const response = await fetch('/api/sync-messages', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({ headless })
+        });
+
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+
+        const data = await response.json();
+
+        if (data.jobId) {
+            addMessageProgressLog(`Job started with ID: ${data.jobId}`, 'info');
+            pollMessageJobStatus(data.jobId);
+        }
+    } catch (error) {
+        addMessageProgressLog(`Error: ${error.message}`, 'error');
+        fetchMsgBtn.disabled = false;
+        syncMsgBtn.disabled = false;
+    }
+});
+
 // Load all messages from database button
 const loadAllMsgBtn = document.getElementById('load-all-msg-btn');
 const messagesTitle = document.getElementById('messages-title');
 
 loadAllMsgBtn.addEventListener('click', async () => {
     try {
-        messagesBody.innerHTML = '';
+        messagesTable.showMessage('');
         messageProgressSection.style.display = 'none';
         messagesListSection.style.display = 'block';
         loadAllMsgBtn.disabled = true;
 
-        const response = await fetch('/api/messages');
-        const data = await response.json();
+        const messages = await fetchMessageList();
 
-        if (data.messages && data.messages.length > 0) {
-            messagesTitle.textContent = `All Messages from Database (${data.messages.length} total)`;
-            displayMessages(data.messages.map(msg => ({
-                id: msg.id,
-                refNumber: msg.ref_number,
-                author: msg.author,
-                receivedDate: msg.received_date,
-                subject: msg.subject,
-                comment: msg.comment,
-                fullDetails: msg.full_details,
-                messageLink: msg.message_link
-            })));
+        if (messages.length > 0) {
+            messagesTitle.textContent = `All Messages from Database (${messages.length} total)`;
+            displayMessages(messages);
         } else {
             messagesTitle.textContent = 'No Messages Found';
-            messagesBody.innerHTML = '<tr><td colspan="7" style="text-align: center;">No messages in database</td></tr>';
+            messagesTable.showMessage('No messages in database');
         }
 
         loadAllMsgBtn.disabled = false;
@@ -1257,7 +1457,7 @@ deleteAllMsgBtn.addEventListener('click', async () => {
         await showAlert(result.message || 'All messages deleted successfully');
 
         // Clear the messages display
-        messagesBody.innerHTML = '<tr><td colspan="7" style="text-align: center;">No messages in database</td></tr>';
+        messagesTable.showMessage('No messages in database');
         messagesTitle.textContent = 'No Messages Found';
         messagesListSection.style.display = 'none';
 
@@ -1271,6 +1471,31 @@ deleteAllMsgBtn.addEventListener('click', async () => {
 // Item functionality
 const itemsBody = document.getElementById('items-body');
 
+const itemsTable = new VirtualTable({
+    tableId: 'items-table',
+    columnCount: 7,
+    emptyMessage: 'No items found',
+    rowValues: (item, index) => [
+        index + 1,
+        item.internal_seq || 'N/A',
+        item.suffix ? `${item.item_1}-${item.suffix}` : item.item_1,
+        item.item_1,
+        item.suffix || '',
+        formatTimestamp(item.created_at)
+    ],
+    renderRow: (item, index, values) => `
+            ${values.map(value => `<td>${value}</td>`).join('')}
+            <td><button class="submit-btn view-item-detail-btn" data-item1="${item.item_1}" data-suffix="${item.suffix || ''}">View Detail</button></td>
+        `
+});
+
+itemsBody.addEventListener('click', async (e) => {
+    const button = e.target.closest('.view-item-detail-btn');
+    if (!button) return;
+
+    await openItemDetailModal(button.getAttribute('data-item1'), button.getAttribute('data-suffix'));
+});
+
 // Auto-load items when Item view is activated
 document.querySelectorAll('.nav-button').forEach(button => {
     button.addEventListener('click', () => {
@@ -1282,68 +1507,20 @@ document.querySelectorAll('.nav-button').forEach(button => {
 
 async function loadAllItems() {
     try {
-        itemsBody.innerHTML = '<tr><td colspan="7" style="text-align: center;">Loading...</td></tr>';
+        itemsTable.showMessage('Loading...');
 
         const response = await fetch('/api/items');
         const data = await response.json();
 
-        if (data.items && data.items.length > 0) {
-            displayItems(data.items);
-        } else {
-            itemsBody.innerHTML = '<tr><td colspan="7" style="text-align: center;">No items found</td></tr>';
-        }
-
-        // Initialize filters for items table
-        initializeTableFilters('items-table');
+        displayItems(data.items || []);
     } catch (error) {
-        itemsBody.innerHTML = '<tr><td colspan="7" style="text-align: center;">Error loading items</td></tr>';
+        itemsTable.showMessage('Error loading items');
         console.error('Error loading items:', error);
     }
 }
 
 function displayItems(items) {
-    itemsBody.innerHTML = '';
-
-    items.forEach((item, index) => {
-        const row = document.createElement('tr');
-
-        // Format created_at date
-        let formattedDate = 'N/A';
-        if (item.created_at) {
-            const date = new Date(item.created_at);
-            const year = date.getFullYear();
-            const month = String(date.getMonth() + 1).padStart(2, '0');
-            const day = String(date.getDate()).padStart(2, '0');
-            const hours = String(date.getHours()).padStart(2, '0');
-            const minutes = String(date.getMinutes()).padStart(2, '0');
-            const seconds = String(date.getSeconds()).padStart(2, '0');
-            formattedDate = `${year}/${month}/${day} ${hours}:${minutes}:${seconds}`;
-        }
-
-        // Construct full item number
-        const fullItemNumber = item.suffix ? `${item.item_1}-${item.suffix}` : item.item_1;
-
-        row.innerHTML = `
-            <td>${index + 1}</td>
-            <td>${item.internal_seq || 'N/A'}</td>
-            <td>${fullItemNumber}</td>
-            <td>${item.item_1}</td>
-            <td>${item.suffix || ''}</td>
-            <td>${formattedDate}</td>
-            <td><button class="submit-btn view-item-detail-btn" data-item1="${item.item_1}" data-suffix="${item.suffix || ''}">View Detail</button></td>
-        `;
-
-        itemsBody.appendChild(row);
-    });
-
-    // Add click handlers to view detail buttons
-    document.querySelectorAll('.view-item-detail-btn').forEach(btn => {
-        btn.addEventListener('click', async (e) => {
-            const item1 = e.target.getAttribute('data-item1');
-            const suffix = e.target.getAttribute('data-suffix');
-            await openItemDetailModal(item1, suffix);
-        });
-    });
+    itemsTable.setRows(items);
 }
 
 // Item Detail Modal functionality
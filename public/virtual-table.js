@@ -0,0 +1,201 @@
+// Windowed table rendering
+// Keeps the full record array in memory and only puts the rows inside the
+// scroll viewport (plus a small overscan) into the DOM. Two spacer rows stand
+// in for everything above and below, so the scrollbar still reflects the whole
+// dataset. Column filters run over the records (or go to the server through
+// onFilter), not over DOM rows.
+class VirtualTable {
+    /**
+     * @param {object} options
+     * @param {string} options.tableId - id of the <table> (its .table-filter inputs are wired up)
+     * @param {number} options.columnCount - Number of columns, used for spacer and message rows
+     * @param {Function} options.rowValues - (record, index) => array of cell display values, used for filtering
+     * @param {Function} options.renderRow - (record, index, values) => inner HTML of the <tr>
+     * @param {string} [options.emptyMessage] - Text shown when there are no records
+     * @param {number} [options.overscan] - Extra rows rendered above and below the viewport
+     * @param {Function} [options.onFilter] - Receives {column: value} (debounced) instead of filtering locally,
+     *                                        for tables whose records are filtered by the server
+     * @param {Function} [options.onReachEnd] - Called when the last record scrolls into view
+     */
+    constructor({ tableId, columnCount, rowValues, renderRow, emptyMessage = 'No records found', overscan = 10, onFilter = null, onReachEnd = null }) {
+        this.table = document.getElementById(tableId);
+        this.body = this.table.querySelector('tbody');
+        this.container = this.table.closest('.virtual-scroll') || this.table.parentElement;
+        this.columnCount = columnCount;
+        this.rowValues = rowValues;
+        this.renderRow = renderRow;
+        this.emptyMessage = emptyMessage;
+        this.overscan = overscan;
+        this.onFilter = onFilter;
+        this.onReachEnd = onReachEnd;
+        this.filterTimer = null;
+
+        this.records = [];
+        this.visible = [];      // indexes into records that pass the filters
+        this.filterCache = null; // lower-cased cell values, built on first filter
+        this.rowHeight = 0;
+        this.renderedRange = null;
+        this.frame = null;
+
+        this.filterInputs = Array.from(this.table.querySelectorAll('.table-filter'));
+        this.filterInputs.forEach(input => {
+            input.addEventListener('input', () => {
+                if (!this.onFilter) {
+                    this.applyFilters();
+                    return;
+                }
+                clearTimeout(this.filterTimer);
+                this.filterTimer = setTimeout(() => this.onFilter(this.getFilterValues()), 300);
+            });
+        });
+
+        this.container.addEventListener('scroll', () => this.scheduleRender());
+        window.addEventListener('resize', () => this.scheduleRender());
+    }
+
+    /**
+     * Replace the records shown by the table (current filter values are kept)
+     * @param {Array} records - Row data in display order
+     * @param {boolean} [scrollToTop] - Pass false when appending a page to keep the scroll position
+     */
+    setRows(records, scrollToTop = true) {
+        this.records = records;
+        this.filterCache = null;
+        this.applyFilters(scrollToTop);
+    }
+
+    /**
+     * Remove all records and show a single message row instead
+     * @param {string} message - Text to show, empty for a blank table
+     */
+    showMessage(message) {
+        this.records = [];
+        this.visible = [];
+        this.filterCache = null;
+        this.renderedRange = null;
+        this.body.innerHTML = message
+            ? `<tr><td colspan="${this.columnCount}" style="text-align: center;">${message}</td></tr>`
+            : '';
+    }
+
+    /**
+     * Record for a row index, as passed to renderRow
+     * @param {number} index - Index into the records array
+     */
+    getRecord(index) {
+        return this.records[index];
+    }
+
+    /**
+     * Current filter input values keyed by data-column (empty inputs omitted)
+     */
+    getFilterValues() {
+        const values = {};
+        this.filterInputs.forEach(input => {
+            const value = input.value.trim();
+            if (value !== '') {
+                values[input.getAttribute('data-column')] = value;
+            }
+        });
+        return values;
+    }
+
+    clearFilters() {
+        clearTimeout(this.filterTimer);
+        this.filterInputs.forEach(input => {
+            input.value = '';
+        });
+    }
+
+    applyFilters(scrollToTop = true) {
+        const filters = this.onFilter ? [] : this.filterInputs
+            .map(input => ({
+                column: parseInt(input.getAttribute('data-column')),
+                value: input.value.toLowerCase().trim()
+            }))
+            .filter(filter => filter.value !== '');
+
+        if (filters.length === 0) {
+            this.visible = this.records.map((record, index) => index);
+        } else {
+            if (!this.filterCache) {
+                this.filterCache = this.records.map((record, index) =>
+                    this.rowValues(record, index).map(value => String(value ?? '').toLowerCase())
+                );
+            }
+            this.visible = [];
+            this.filterCache.forEach((values, index) => {
+                if (filters.every(filter => (values[filter.column] || '').includes(filter.value))) {
+                    this.visible.push(index);
+                }
+            });
+        }
+
+        if (scrollToTop) {
+            this.container.scrollTop = 0;
+        }
+        this.renderedRange = null;
+        this.render();
+    }
+
+    scheduleRender() {
+        if (this.frame) return;
+        this.frame = requestAnimationFrame(() => {
+            this.frame = null;
+            this.render();
+        });
+    }
+
+    render() {
+        if (this.records.length === 0) {
+            this.showMessage(this.emptyMessage);
+            return;
+        }
+
+        const rowHeight = this.rowHeight || 40;
+        const headerHeight = this.table.tHead ? this.table.tHead.offsetHeight : 0;
+        const viewportHeight = this.container.clientHeight || window.innerHeight;
+        const scrollTop = Math.max(0, this.container.scrollTop - headerHeight);
+
+        const start = Math.max(0, Math.floor(scrollTop / rowHeight) - this.overscan);
+        const end = Math.min(this.visible.length, Math.ceil((scrollTop + viewportHeight) / rowHeight) + this.overscan);
+
+        if (this.renderedRange && this.renderedRange.start === start && this.renderedRange.end === end) {
+            return;
+        }
+        this.renderedRange = { start, end };
+
+        const rows = [this.spacerRow(start * rowHeight)];
+        for (let position = start; position < end; position++) {
+            const index = this.visible[position];
+            const record = this.records[index];
+            const stripe = position % 2 === 1 ? ' class="even-row"' : '';
+            rows.push(`<tr data-index="${index}"${stripe}>${this.renderRow(record, index, this.rowValues(record, index))}</tr>`);
+        }
+        rows.push(this.spacerRow((this.visible.length - end) * rowHeight));
+
+        if (this.visible.length === 0) {
+            rows.splice(1, 0, `<tr><td colspan="${this.columnCount}" style="text-align: center;">No matching records</td></tr>`);
+        }
+
+        this.body.innerHTML = rows.join('');
+
+        if (this.onReachEnd && end === this.visible.length) {
+            this.onReachEnd();
+        }
+
+        // Measure the real row height once rows exist, then redo the window with it
+        if (!this.rowHeight && end > start) {
+            const firstRow = this.body.rows[1];
+            if (firstRow && firstRow.offsetHeight > 0) {
+                this.rowHeight = firstRow.offsetHeight;
+                this.renderedRange = null;
+                this.render();
+            }
+        }
+    }
+
+    spacerRow(height) {
+        return `<tr class="virtual-spacer"><td colspan="${this.columnCount}" style="height: ${height}px;"></td></tr>`;
+    }
+}
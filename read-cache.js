@@ -0,0 +1,99 @@
+import { createCounter, createGauge } from './metrics.js';
+
+// Bounded LRU caches for hot database reads
+// Entries expire after a TTL and are evicted least-recently-used once a cache is
+// full. Writers invalidate the keys they touch, so the TTL only bounds staleness
+// for changes made outside this process. Cached values are shared between
+// callers and must be treated as read-only.
+
+const caches = [];
+
+const requestCounter = createCounter(
+  'ebrandid_db_cache_requests_total',
+  'Database read cache lookups by cache and result (hit or miss)',
+  ['cache', 'result']
+);
+
+createGauge('ebrandid_db_cache_entries', 'Entries held by each database read cache', ['cache'], () =>
+  caches.map(cache => ({ labels: { cache: cache.name }, value: cache.size }))
+);
+
+class ReadCache {
+  /**
+   * @param {string} name - Cache name used in metrics and stats
+   * @param {object} options
+   * @param {number} options.maxEntries - Entries kept before the least recently used is evicted
+   * @param {number} options.ttlMs - How long an entry is served before it is reloaded
+   */
+  constructor(name, { maxEntries = 500, ttlMs = 10 * 60 * 1000 } = {}) {
+    this.name = name;
+    this.maxEntries = maxEntries;
+    this.ttlMs = ttlMs;
+    this.entries = new Map();
+    this.hits = 0;
+    this.misses = 0;
+  }
+
+  get size() {
+    return this.entries.size;
+  }
+
+  /**
+   * Return the cached value for key, or run load() and cache its result
+   * @param {string} key - Cache key
+   * @param {Function} load - Synchronous loader for a missing or expired key
+   */
+  get(key, load) {
+    const entry = this.entries.get(key);
+
+    if (entry && entry.expiresAt > Date.now()) {
+      // Re-insert so Map order stays least- to most-recently used
+      this.entries.delete(key);
+      this.entries.set(key, entry);
+      this.hits++;
+      requestCounter.inc({ cache: this.name, result: 'hit' });
+      return entry.value;
+    }
+
+    this.misses++;
+    requestCounter.inc({ cache: this.name, result: 'miss' });
+
+    const value = load();
+    this.entries.delete(key);
+    if (this.entries.size >= this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value);
+    }
+    this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs });
+    return value;
+  }
+
+  delete(key) {
+    this.entries.delete(key);
+  }
+
+  clear() {
+    this.entries.clear();
+  }
+
+  stats() {
+    return { name: this.name, size: this.entries.size, maxEntries: this.maxEntries, hits: this.hits, misses: this.misses };
+  }
+}
+
+/**
+ * Create a read cache and register it for metrics
+ * @param {string} name - Cache name
+ * @param {object} options - { maxEntries, ttlMs }
+ */
+export function createReadCache(name, options) {
+  const cache = new ReadCache(name, options);
+  caches.push(cache);
+  return cache;
+}
+
+/**
+ * Size and hit/miss counts of every read cache
+ */
+export function getReadCacheStats() {
+  return caches.map(cache => cache.stats());
+}
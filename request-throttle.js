@@ -0,0 +1,228 @@
+// Retry, backoff and throttling for requests to e-brandid
+// Every navigation or fetch that goes to the site runs through one shared throttle
+// per browser context. Transient failures (timeouts, network errors, HTTP 429/5xx)
+// are retried with exponential backoff and full jitter, up to config.max_retries.
+// The number of requests allowed in flight adapts to the recent error rate and
+// latency (halved when the site struggles, grown by one while it keeps up), and a
+// circuit breaker pauses all requests for a cooldown after repeated failures.
+// Overridden by "throttle" in config.json.
+const DEFAULT_THROTTLE = {
+  base_delay_ms: 500,
+  max_delay_ms: 15000,
+  max_concurrency: 4,
+  min_concurrency: 1,
+  target_latency_ms: 10000,
+  error_rate_threshold: 0.25,
+  window_size: 20,
+  failure_threshold: 5,
+  cooldown_seconds: 30
+};
+
+const RETRYABLE_STATUSES = new Set([408, 425, 429, 500, 502, 503, 504]);
+
+const RETRYABLE_MESSAGES = [
+  'Timeout',
+  'net::ERR_',
+  'ECONNRESET',
+  'ECONNREFUSED',
+  'ETIMEDOUT',
+  'EAI_AGAIN',
+  'socket hang up'
+];
+
+function sleep(ms) {
+  return new Promise(resolve => setTimeout(resolve, ms));
+}
+
+/**
+ * Error for an HTTP response worth retrying (429 or 5xx)
+ * @param {string} description - What was requested
+ * @param {number} status - HTTP status code
+ */
+export function httpStatusError(description, status) {
+  const error = new Error(`${description} returned HTTP ${status}`);
+  error.status = status;
+  return error;
+}
+
+/**
+ * Whether a failed request is likely to succeed if tried again
+ * @param {Error} error - Error thrown by the request
+ */
+export function isRetryableError(error) {
+  if (error.status !== undefined) {
+    return RETRYABLE_STATUSES.has(error.status);
+  }
+  if (error.name === 'TimeoutError') {
+    return true;
+  }
+  const message = error.message || '';
+  return RETRYABLE_MESSAGES.some(pattern => message.includes(pattern));
+}
+
+/**
+ * Throw for retryable HTTP statuses so the throttle retries them
+ * @param {object} response - Playwright Response / APIResponse (may be null)
+ * @param {string} description - What was requested (used in the error message)
+ */
+export function checkResponse(response, description) {
+  if (response && RETRYABLE_STATUSES.has(response.status())) {
+    throw httpStatusError(description, response.status());
+  }
+  return response;
+}
+
+class RequestThrottle {
+  /**
+   * @param {object} settings - Resolved throttle settings
+   * @param {number} maxRetries - Retries per request after the first attempt
+   */
+  constructor(settings, maxRetries) {
+    this.settings = settings;
+    this.maxRetries = Math.max(0, parseInt(maxRetries) || 0);
+    this.limit = settings.max_concurrency;
+    this.active = 0;
+    this.waiting = [];
+    this.outcomes = [];
+    this.consecutiveFailures = 0;
+    this.openUntil = 0;
+    this.totalRetries = 0;
+    this.circuitOpenings = 0;
+  }
+
+  get circuitState() {
+    if (this.openUntil > Date.now()) return 'open';
+    return this.consecutiveFailures >= this.settings.failure_threshold ? 'half-open' : 'closed';
+  }
+
+  async acquire() {
+    // Wait out an open circuit; afterwards requests are let through one at a time
+    // (half-open) until one succeeds
+    for (;;) {
+      const openFor = this.openUntil - Date.now();
+      if (openFor > 0) {
+        await sleep(openFor);
+        continue;
+      }
+      const limit = this.circuitState === 'half-open' ? 1 : this.limit;
+      if (this.active < limit) {
+        this.active++;
+        return;
+      }
+      await new Promise(resolve => this.waiting.push(resolve));
+    }
+  }
+
+  release() {
+    this.active--;
+    const waiters = this.waiting.splice(0);
+    waiters.forEach(resolve => resolve());
+  }
+
+  /**
+   * Record the outcome of one attempt and adjust the concurrency limit (AIMD)
+   */
+  record(ok, latency) {
+    const { window_size, error_rate_threshold, target_latency_ms, min_concurrency, max_concurrency, failure_threshold } = this.settings;
+
+    this.outcomes.push({ ok, latency });
+    if (this.outcomes.length > window_size) {
+      this.outcomes.shift();
+    }
+
+    if (ok) {
+      this.consecutiveFailures = 0;
+    } else if (++this.consecutiveFailures >= failure_threshold && this.circuitState !== 'open') {
+      this.openUntil = Date.now() + this.settings.cooldown_seconds * 1000;
+      this.circuitOpenings++;
+      console.log(`⚠ ${this.consecutiveFailures} requests failed in a row, pausing requests for ${this.settings.cooldown_seconds}s`);
+    }
+
+    if (this.outcomes.length < Math.min(5, window_size)) {
+      return;
+    }
+
+    const errorRate = this.outcomes.filter(outcome => !outcome.ok).length / this.outcomes.length;
+    const latencies = this.outcomes.filter(outcome => outcome.ok).map(outcome => outcome.latency);
+    const averageLatency = latencies.length > 0 ? latencies.reduce((sum, value) => sum + value, 0) / latencies.length : 0;
+
+    if (errorRate > error_rate_threshold || averageLatency > target_latency_ms) {
+      const reduced = Math.max(min_concurrency, Math.floor(this.limit / 2));
+      if (reduced < this.limit) {
+        console.log(`⚠ e-brandid is struggling (${Math.round(errorRate * 100)}% errors, ${Math.round(averageLatency)} ms), concurrency ${this.limit} → ${reduced}`);
+        this.limit = reduced;
+        // Judge the new limit on fresh outcomes only
+        this.outcomes = [];
+      }
+    } else if (ok && this.limit < max_concurrency && this.outcomes.length >= window_size) {
+      this.limit++;
+      this.outcomes = [];
+    }
+  }
+
+  backoff(attempt) {
+    // Full jitter: a random delay up to the exponential cap
+    const cap = Math.min(this.settings.max_delay_ms, this.settings.base_delay_ms * 2 ** (attempt - 1));
+    return Math.round(Math.random() * cap);
+  }
+
+  /**
+   * Run a request, retrying transient failures
+   * @param {Function} fn - Async function performing the request (called once per attempt)
+   * @param {object} options
+   * @param {Function} options.onRetry - Called with (attempt, error, delayMs) before each retry
+   */
+  async run(fn, options = {}) {
+    for (let attempt = 0; ; attempt++) {
+      await this.acquire();
+      const start = Date.now();
+      let error;
+      try {
+        const value = await fn();
+        this.record(true, Date.now() - start);
+        return value;
+      } catch (caught) {
+        error = caught;
+      } finally {
+        // Backoff sleeps outside the slot so other lanes keep going
+        this.release();
+      }
+
+      const retryable = isRetryableError(error);
+      // Only transient failures say something about the site's health
+      if (retryable) {
+        this.record(false, Date.now() - start);
+      }
+      if (!retryable || attempt >= this.maxRetries) {
+        throw error;
+      }
+
+      const delay = this.backoff(attempt + 1);
+      this.totalRetries++;
+      if (options.onRetry) {
+        options.onRetry(attempt + 1, error, delay);
+      }
+      await sleep(delay);
+    }
+  }
+
+  stats() {
+    return {
+      limit: this.limit,
+      active: this.active,
+      circuit: this.circuitState,
+      retries: this.totalRetries,
+      circuitOpenings: this.circuitOpenings
+    };
+  }
+}
+
+/**
+ * Create the throttle for one browser context
+ * @param {object} config - Loaded config.json (uses max_retries and "throttle")
+ */
+export function createThrottle(config) {
+  const settings = { ...DEFAULT_THROTTLE, ...(config.throttle || {}) };
+  const maxRetries = config.max_retries !== undefined ? config.max_retries : 3;
+  return new RequestThrottle(settings, maxRetries);
+}
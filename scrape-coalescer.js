@@ -0,0 +1,180 @@
+import { createCounter } from './metrics.js';
+
+const coalescedCounter = createCounter(
+  'ebrandid_scrape_coalesced_total',
+  'POs in scrape jobs served without scraping them again, by task and source (in_flight or recent)',
+  ['task', 'source']
+);
+
+/**
+ * Coalesces per-PO scrape work across jobs
+ * Jobs asking for a PO that another job is already scraping with the same task
+ * attach to that work instead of scraping it again, and results finished within
+ * the last recentMinutes can be handed out directly. Only the remaining POs are
+ * sent to the worker pool. Every job still receives one result per requested PO
+ * through its own handlers; shared results are copies marked with `coalesced`.
+ */
+class ScrapeCoalescer {
+  /**
+   * @param {object} options
+   * @param {object} options.pool - ScrapeWorkerPool running the tasks
+   * @param {Array<string>} options.tasks - Tasks whose payload.poNumbers are coalesced
+   * @param {number} options.recentMinutes - How long finished results are reused (0 = only in-flight work)
+   */
+  constructor({ pool, tasks = ['download', 'fetch-po'], recentMinutes = 0 } = {}) {
+    this.pool = pool;
+    this.tasks = new Set(tasks);
+    this.recentMs = Math.max(0, Number(recentMinutes) || 0) * 60 * 1000;
+    this.inFlight = new Map();
+    this.recent = new Map();
+  }
+
+  /**
+   * Run a scrape task like ScrapeWorkerPool.run, sharing per-PO work with other jobs
+   * @param {string} task - Task name understood by scrape-worker.js
+   * @param {object} payload - Task arguments; payload.poNumbers is coalesced
+   * @param {object} handlers - { onUpdate(fields), onResult(result) } for this job
+   * @param {object} options - { reuseRecent: false to ignore finished results }
+   * @returns {Promise} Resolves with the task's final value once every PO has a result
+   */
+  async run(task, payload, handlers = {}, options = {}) {
+    if (!this.tasks.has(task) || !Array.isArray(payload.poNumbers)) {
+      return this.pool.run(task, payload, handlers);
+    }
+
+    const reuseRecent = options.reuseRecent !== false;
+    const onResult = handlers.onResult || (() => {});
+    const onUpdate = handlers.onUpdate || (() => {});
+    const own = [];
+    const shared = [];
+
+    for (const poNumber of new Set(payload.poNumbers)) {
+      const key = `${task}:${poNumber}`;
+      const recent = reuseRecent ? this.getRecent(key) : null;
+
+      if (recent) {
+        coalescedCounter.inc({ task, source: 'recent' });
+        onResult({ ...recent, coalesced: 'recent' });
+      } else if (this.inFlight.has(key)) {
+        coalescedCounter.inc({ task, source: 'in_flight' });
+        shared.push(this.inFlight.get(key));
+      } else {
+        own.push(this.track(key, poNumber));
+      }
+    }
+
+    let pendingShared = shared.length;
+    if (pendingShared > 0 && own.length === 0) {
+      onUpdate({ progress: `Waiting for ${pendingShared} PO(s) already being processed by another job...` });
+    }
+
+    const waits = shared.map(entry => entry.promise.then(result => {
+      pendingShared--;
+      onResult({ ...result, coalesced: 'in_flight' });
+    }));
+
+    const ownTask = own.length === 0 ? Promise.resolve(undefined) : this.runOwn(task, payload, own, handlers)
+      .finally(() => {
+        if (pendingShared > 0) {
+          onUpdate({ currentPO: null, progress: `Waiting for ${pendingShared} PO(s) still being processed by another job...` });
+        }
+      });
+
+    const [ownOutcome, ...sharedOutcomes] = await Promise.allSettled([ownTask, ...waits]);
+    const failure = [ownOutcome, ...sharedOutcomes].find(outcome => outcome.status === 'rejected');
+    if (failure) {
+      throw failure.reason;
+    }
+    return ownOutcome.value;
+  }
+
+  /**
+   * Scrape the POs no other job is working on and settle their entries
+   */
+  async runOwn(task, payload, own, handlers) {
+    const entries = new Map(own.map(entry => [entry.poNumber, entry]));
+
+    try {
+      return await this.pool.run(task, { ...payload, poNumbers: own.map(entry => entry.poNumber) }, {
+        onUpdate: handlers.onUpdate,
+        onResult: (result) => {
+          const entry = entries.get(result.poNumber);
+          if (entry) {
+            entries.delete(result.poNumber);
+            this.settle(entry, result);
+          }
+          if (handlers.onResult) {
+            handlers.onResult(result);
+          }
+        }
+      });
+    } catch (error) {
+      // Jobs attached to POs this task never reached fail the same way
+      entries.forEach(entry => this.fail(entry, error));
+      throw error;
+    } finally {
+      entries.forEach(entry => this.fail(entry, new Error(`Scrape task ended without a result for PO ${entry.poNumber}`)));
+    }
+  }
+
+  track(key, poNumber) {
+    const entry = { key, poNumber, settled: false };
+    entry.promise = new Promise((resolve, reject) => {
+      entry.resolve = resolve;
+      entry.reject = reject;
+    });
+    // Nobody may be attached; the owning job reports the error itself
+    entry.promise.catch(() => {});
+    this.inFlight.set(key, entry);
+    return entry;
+  }
+
+  settle(entry, result) {
+    if (entry.settled) return;
+    entry.settled = true;
+    this.inFlight.delete(entry.key);
+
+    if (this.recentMs > 0 && result.status !== 'failed') {
+      this.pruneRecent();
+      this.recent.set(entry.key, { result, finishedAt: Date.now() });
+    }
+    entry.resolve(result);
+  }
+
+  fail(entry, error) {
+    if (entry.settled) return;
+    entry.settled = true;
+    this.inFlight.delete(entry.key);
+    entry.reject(error);
+  }
+
+  getRecent(key) {
+    const recent = this.recent.get(key);
+    if (!recent) {
+      return null;
+    }
+    if (Date.now() - recent.finishedAt > this.recentMs) {
+      this.recent.delete(key);
+      return null;
+    }
+    return recent.result;
+  }
+
+  pruneRecent() {
+    const cutoff = Date.now() - this.recentMs;
+    for (const [key, recent] of this.recent) {
+      if (recent.finishedAt < cutoff) {
+        this.recent.delete(key);
+      }
+    }
+  }
+
+  /**
+   * Number of POs currently being scraped on behalf of one or more jobs
+   */
+  get inFlightCount() {
+    return this.inFlight.size;
+  }
+}
+
+export default ScrapeCoalescer;
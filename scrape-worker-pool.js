@@ -0,0 +1,188 @@
+import { fork } from 'child_process';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+
+const WORKER_SCRIPT = path.join(__dirname, 'scrape-worker.js');
+
+/**
+ * Pool of child processes that run Playwright scrape tasks
+ * Each worker runs one task (one browser) at a time. Workers never open the
+ * database: they stream persistence calls and results back over IPC and the
+ * main process applies them, so sql.js has a single writer. A crashed worker
+ * only fails its own task; a replacement is started for the next one.
+ */
+class ScrapeWorkerPool {
+  /**
+   * @param {object} options
+   * @param {number} options.size - Maximum number of worker processes
+   * @param {object} options.persistence - Write functions workers may call (e.g. savePOHeader)
+   * @param {object} options.queries - Read functions workers may call and await (e.g. messageExists)
+   * @param {Function} options.onTiming - Receives { step, duration } for every scrape step a worker times
+   */
+  constructor({ size = 2, persistence = {}, queries = {}, onTiming = null } = {}) {
+    this.size = Math.max(1, parseInt(size) || 1);
+    this.persistence = persistence;
+    this.queries = queries;
+    this.onTiming = onTiming;
+    this.workers = [];
+    this.queue = [];
+    this.nextTaskId = 1;
+  }
+
+  /**
+   * Number of tasks waiting for a free worker
+   */
+  get queueDepth() {
+    return this.queue.length;
+  }
+
+  /**
+   * Number of tasks currently running in a worker
+   */
+  get activeCount() {
+    return this.workers.filter(worker => worker.task).length;
+  }
+
+  /**
+   * Run a task in the next free worker
+   * @param {string} task - Task name understood by scrape-worker.js
+   * @param {object} payload - Task arguments (must be serializable)
+   * @param {object} handlers - { onUpdate(fields), onResult(result) } for streamed progress
+   * @returns {Promise} Resolves with the task's final value
+   */
+  run(task, payload, handlers = {}) {
+    return new Promise((resolve, reject) => {
+      this.queue.push({ id: this.nextTaskId++, task, payload, handlers, resolve, reject });
+
+      if (handlers.onUpdate && this.activeCount >= this.size) {
+        handlers.onUpdate({ progress: `Waiting for a free scrape worker (${this.queue.length} queued)...` });
+      }
+
+      this.dispatch();
+    });
+  }
+
+  dispatch() {
+    while (this.queue.length > 0) {
+      let worker = this.workers.find(candidate => !candidate.task);
+
+      if (!worker) {
+        if (this.workers.length >= this.size) {
+          return;
+        }
+        worker = this.spawn();
+      }
+
+      const task = this.queue.shift();
+      worker.task = task;
+      worker.child.send({ type: 'run', taskId: task.id, task: task.task, payload: task.payload });
+    }
+  }
+
+  spawn() {
+    const child = fork(WORKER_SCRIPT, [], { serialization: 'advanced' });
+    const worker = { child, task: null };
+
+    child.on('message', message => this.handleMessage(worker, message));
+    child.on('exit', (code, signal) => this.handleExit(worker, code, signal));
+    child.on('error', error => console.log(`⚠ Scrape worker ${child.pid} error: ${error.message}`));
+
+    this.workers.push(worker);
+    console.log(`✓ Started scrape worker (pid ${child.pid})`);
+    return worker;
+  }
+
+  async handleMessage(worker, message) {
+    const task = worker.task;
+
+    switch (message.type) {
+      case 'persist': {
+        const fn = this.persistence[message.op];
+        try {
+          if (!fn) {
+            throw new Error(`Unknown persistence operation ${message.op}`);
+          }
+          fn(...message.args);
+        } catch (error) {
+          console.log(`⚠ Could not apply ${message.op} from scrape worker: ${error.message}`);
+        }
+        break;
+      }
+
+      case 'query': {
+        const fn = this.queries[message.op];
+        const reply = { type: 'queryResult', queryId: message.queryId };
+        try {
+          if (!fn) {
+            throw new Error(`Unknown query ${message.op}`);
+          }
+          reply.value = await fn(...message.args);
+        } catch (error) {
+          reply.error = error.message;
+        }
+        if (worker.child.connected) {
+          worker.child.send(reply);
+        }
+        break;
+      }
+
+      case 'timing':
+        if (this.onTiming) {
+          this.onTiming(message);
+        }
+        break;
+
+      case 'update':
+        if (task && task.handlers.onUpdate) {
+          task.handlers.onUpdate(message.fields);
+        }
+        break;
+
+      case 'result':
+        if (task && task.handlers.onResult) {
+          task.handlers.onResult(message.result);
+        }
+        break;
+
+      case 'done':
+      case 'error':
+        if (!task) break;
+        worker.task = null;
+        if (message.type === 'done') {
+          task.resolve(message.value);
+        } else {
+          task.reject(new Error(message.error));
+        }
+        this.dispatch();
+        break;
+    }
+  }
+
+  handleExit(worker, code, signal) {
+    this.workers = this.workers.filter(candidate => candidate !== worker);
+
+    if (worker.task) {
+      const reason = signal || `exit code ${code}`;
+      console.log(`⚠ Scrape worker ${worker.child.pid} exited during a task (${reason})`);
+      worker.task.reject(new Error(`Scrape worker exited unexpectedly (${reason})`));
+      worker.task = null;
+    }
+
+    // Replacements are spawned on demand for anything still queued
+    this.dispatch();
+  }
+
+  /**
+   * Stop all worker processes (running tasks are failed by handleExit)
+   */
+  close() {
+    for (const worker of this.workers) {
+      worker.child.kill();
+    }
+  }
+}
+
+export default ScrapeWorkerPool;
@@ -0,0 +1,144 @@
+import EBrandIDDownloader from './index.js';
+
+// Child process entry point for ScrapeWorkerPool (see scrape-worker-pool.js)
+// Runs one scrape task at a time. Database writes and lookups are forwarded
+// to the main process, which owns the sql.js database.
+
+let nextQueryId = 1;
+const pendingQueries = new Map();
+
+function send(message) {
+  if (process.connected) {
+    process.send(message);
+  }
+}
+
+function persist(op, args) {
+  send({ type: 'persist', op, args });
+}
+
+function query(op, args) {
+  return new Promise((resolve, reject) => {
+    const queryId = nextQueryId++;
+    pendingQueries.set(queryId, { resolve, reject });
+    send({ type: 'query', queryId, op, args });
+  });
+}
+
+// Store handed to the downloader in place of database.js
+// (savePOItems is a query because the caller reports which lines changed)
+const ipcStore = {
+  savePOHeader: (...args) => persist('savePOHeader', args),
+  savePOItems: (...args) => query('savePOItems', args),
+  saveDownloadHistory: (...args) => persist('saveDownloadHistory', args)
+};
+
+const tasks = {
+  async download(downloader, { poNumbers }, report) {
+    for (const poNumber of poNumbers) {
+      report.update({ currentPO: poNumber, progress: `Processing PO ${poNumber}...` });
+      report.result(await downloader.downloadPOArtwork(poNumber));
+    }
+
+    report.update({ currentPO: null, progress: 'All downloads completed' });
+  },
+
+  async 'fetch-po'(downloader, { poNumbers }, report) {
+    // Navigate to PO list page ONCE at the beginning
+    report.update({ progress: 'Navigating to PO list page...' });
+    await downloader.navigateToPOListPage();
+
+    // Process each PO (staying on list page between POs)
+    for (let i = 0; i < poNumbers.length; i++) {
+      const poNumber = poNumbers[i];
+      report.update({
+        currentPO: poNumber,
+        progress: `Fetching PO ${poNumber} information (${i + 1}/${poNumbers.length})...`
+      });
+      report.result(await downloader.fetchPOInformationOptimized(poNumber));
+    }
+
+    report.update({ currentPO: null, progress: `All PO information fetched (${poNumbers.length} POs processed)` });
+  },
+
+  async 'po-list'(downloader, { maxPages }, report) {
+    report.update({ progress: 'Navigating to PO list page...' });
+    await downloader.navigateToPOListPage();
+
+    report.update({ progress: 'Reading PO list...' });
+    return await downloader.extractPOListRows({ maxPages });
+  },
+
+  async 'fetch-messages'(downloader, { customDate, options }, report) {
+    report.update({ progress: 'Navigating to Message page...' });
+    await downloader.navigateToMessagePage();
+
+    report.update({ progress: 'Extracting messages...' });
+    return await downloader.extractMessages(customDate, options);
+  },
+
+  async 'sync-messages'(downloader, { cursor, options }, report) {
+    report.update({ progress: 'Navigating to Message page...' });
+    await downloader.navigateToMessagePage();
+
+    report.update({ progress: `Syncing messages since ${cursor.receivedDate || cursor.receivedAt}...` });
+    return await downloader.extractMessagesSince(cursor, {
+      ...options,
+      isStored: (message) => query('messageExists', [message.refNumber, message.commentId])
+    });
+  }
+};
+
+async function runTask({ taskId, task, payload }) {
+  const report = {
+    update: (fields) => send({ type: 'update', taskId, fields }),
+    result: (result) => send({ type: 'result', taskId, result })
+  };
+  const downloader = new EBrandIDDownloader({
+    store: ipcStore,
+    onStepTiming: ({ step, duration }) => send({ type: 'timing', step, duration })
+  });
+  let outcome;
+
+  try {
+    if (!tasks[task]) {
+      throw new Error(`Unknown scrape task ${task}`);
+    }
+
+    // Initialize and login
+    report.update({ progress: 'Initializing browser...' });
+    await downloader.initialize(payload.headless);
+
+    report.update({ progress: 'Logging in...' });
+    await downloader.login();
+
+    const value = await tasks[task](downloader, payload, report);
+    outcome = { type: 'done', taskId, value };
+  } catch (error) {
+    outcome = { type: 'error', taskId, error: error.message };
+  } finally {
+    await downloader.close();
+  }
+
+  // Only report back once the browser is gone, so a free worker never holds one
+  send(outcome);
+}
+
+process.on('message', message => {
+  if (message.type === 'run') {
+    runTask(message);
+  } else if (message.type === 'queryResult') {
+    const pending = pendingQueries.get(message.queryId);
+    if (pending) {
+      pendingQueries.delete(message.queryId);
+      if (message.error) {
+        pending.reject(new Error(message.error));
+      } else {
+        pending.resolve(message.value);
+      }
+    }
+  }
+});
+
+// The pool owns this process; exit when the main process goes away
+process.on('disconnect', () => process.exit(0));
@@ -0,0 +1,118 @@
+import fs from 'fs';
+import { initDatabase, savePOHeader, savePOItems, saveMessage, trackItem, saveItemDetails, closeDatabase } from './database.js';
+
+// Creates a small, known database for the pytest suite (see conftest.py)
+// Usage: EBRANDID_DB_PATH=/tmp/test.db node seed-test-db.js
+// Refuses to run without EBRANDID_DB_PATH so the real ebrandid.db is never touched.
+
+const SEED_POS = [
+  {
+    header: {
+      poNumber: '1303061',
+      status: 'Open',
+      company: 'Test Garments Ltd',
+      currency: 'USD',
+      terms: 'Net 30',
+      vendorName: 'Fu Chang Label Co',
+      vendorAddress1: '1 Test Road',
+      vendorAddress2: '',
+      vendorAddress3: '',
+      shipToName: 'Test Factory',
+      shipToAddress1: '2 Harbour Street',
+      shipToAddress2: '',
+      shipToAddress3: '',
+      cancelDate: '2/28/26',
+      totalAmount: null,
+      poDate: '1/15/26',
+      shipBy: '2/10/26',
+      shipVia: 'Courier',
+      orderType: 'Production',
+      loc: 'HK',
+      prodRep: 'Test Rep'
+    },
+    items: [
+      { itemNumber: 'WL1001-A', description: 'Woven label', color: 'Black', shipTo: 'Test Factory', needBy: '2/10/26', qty: 5000, bundleQty: 500, unitPrice: 0.02, extension: 100 },
+      { itemNumber: 'WL1001-B', description: 'Woven label', color: 'White', shipTo: 'Test Factory', needBy: '2/10/26', qty: 3000, bundleQty: 500, unitPrice: 0.02, extension: 60 }
+    ]
+  },
+  {
+    header: {
+      poNumber: '1307938',
+      status: 'Shipped',
+      company: 'Sample Apparel Inc',
+      currency: 'USD',
+      terms: 'Net 60',
+      vendorName: 'Fu Chang Label Co',
+      vendorAddress1: '1 Test Road',
+      vendorAddress2: '',
+      vendorAddress3: '',
+      shipToName: 'Sample Warehouse',
+      shipToAddress1: '3 Dock Lane',
+      shipToAddress2: '',
+      shipToAddress3: '',
+      cancelDate: '3/15/26',
+      totalAmount: null,
+      poDate: '1/20/26',
+      shipBy: '3/01/26',
+      shipVia: 'Sea',
+      orderType: 'Production',
+      loc: 'CN',
+      prodRep: 'Test Rep'
+    },
+    items: [
+      { itemNumber: 'HT2002', description: 'Hang tag', color: 'Kraft', shipTo: 'Sample Warehouse', needBy: '3/01/26', qty: 12000, bundleQty: 1000, unitPrice: 0.05, extension: 600 }
+    ]
+  }
+];
+
+const SEED_MESSAGES = [
+  {
+    refNumber: '1303061',
+    author: 'Test Buyer',
+    receivedDate: '1/30/26 10:15',
+    subject: 'Artwork approved',
+    comment: 'Please proceed with production.',
+    fullDetails: 'Artwork for PO 1303061 is approved. Please proceed with production.',
+    commentId: 'seed-1'
+  },
+  {
+    refNumber: '1307938',
+    author: 'Test Merchandiser',
+    receivedDate: '1/31/26 16:40',
+    subject: 'Shipping update',
+    comment: 'Goods shipped.',
+    fullDetails: 'PO 1307938 has shipped by sea.',
+    commentId: 'seed-2'
+  }
+];
+
+/**
+ * Write the seed POs, items and messages to a fresh database file
+ */
+async function seed() {
+  if (!process.env.EBRANDID_DB_PATH) {
+    throw new Error('EBRANDID_DB_PATH must point at the test database to create');
+  }
+
+  // Always start from an empty file
+  fs.rmSync(process.env.EBRANDID_DB_PATH, { force: true });
+  await initDatabase();
+
+  for (const po of SEED_POS) {
+    savePOHeader(po.header);
+    savePOItems(po.header.poNumber, po.items);
+    po.items.forEach(item => trackItem(item.itemNumber));
+  }
+
+  SEED_MESSAGES.forEach(message => saveMessage(message));
+
+  saveItemDetails({ item_1: 'WL1001', suffix: 'A', brand_name: 'Test Brand', machine_number: 'M-01' });
+
+  closeDatabase();
+  console.log(`✓ Seeded ${SEED_POS.length} POs and ${SEED_MESSAGES.length} messages into ${process.env.EBRANDID_DB_PATH}`);
+}
+
+seed().catch(error => {
+  console.error(`✗ ${error.message}`);
+  process.exit(1);
+});
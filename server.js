@@ -4,21 +4,94 @@ import { fileURLToPath } from 'url';
 import xlsx from 'xlsx';
 import fs from 'fs';
 import os from 'os';
-import EBrandIDDownloader from './index.js';
-import { initDatabase, getAllPOs, getPOByNumber, getPOItems, searchPOs, deletePO, deleteAllPOs, saveMessage, getAllMessages, deleteMessage, deleteAllMessages, getAllItems, rebuildItemsTable, saveItemDetails, getItemDetails } from './database.js';
+import { execFile } from 'child_process';
+import { promisify } from 'util';
+import { Readable, pipeline } from 'stream';
+import ScrapeWorkerPool from './scrape-worker-pool.js';
+import ScrapeCoalescer from './scrape-coalescer.js';
+import { compressResponses, dataETag, fingerprintedAssets } from './http-cache.js';
+import { buildArchiveLayout, streamArchive } from './zip-stream.js';
+import * as database from './database.js';
+import { createGauge, createHistogram, instrumentFunctions, renderMetrics } from './metrics.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
-const app = express();
-const PORT = 8766;
+// Metrics (exposed at /metrics)
+const httpDurationHistogram = createHistogram(
+  'ebrandid_http_request_duration_seconds',
+  'HTTP request latency by route',
+  ['method', 'route', 'status']
+);
+const dbCallHistogram = createHistogram(
+  'ebrandid_db_call_duration_seconds',
+  'Time spent in database.js functions called by the server',
+  ['function']
+);
+const jobDurationHistogram = createHistogram(
+  'ebrandid_job_duration_seconds',
+  'Scrape job duration including time queued for a worker',
+  ['task', 'outcome'],
+  [1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600]
+);
+const scrapeStepHistogram = createHistogram(
+  'ebrandid_scrape_step_duration_seconds',
+  'Scrape step duration reported by workers, grouped by phase',
+  ['phase', 'step'],
+  [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+);
+
+// Every database.js function used here is timed per call
+const { initDatabase, savePOHeader, savePOItems, saveDownloadHistory, getAllPOs, queryPOs, getPOByNumber, getPOItems, getPODisplay, searchPOs, deletePO, deleteAllPOs, saveMessage, getAllMessages, countMessages, getMessageById, deleteMessage, deleteAllMessages, messageExists, getSyncState, setSyncState, getAllItems, rebuildItemsTable, saveItemDetails, saveItemDetailsBatch, getItemDetails, getItemDetailsBatch, getDataVersion, getPOListSnapshot, startPOSyncRun, finishPOSyncRun, getPOSyncRuns, getPOTraces, getTraceById, getSchemaVersion, getReadCacheStats } = instrumentFunctions(database, dbCallHistogram);
 
-// Initialize database
-await initDatabase();
-console.log('Database initialized');
+const app = express();
+// PORT=0 picks a free port (the one in use is printed on startup)
+const PORT = process.env.PORT !== undefined ? parseInt(process.env.PORT, 10) : 8766;
+
+// Initialize database in the background so the server can listen right away;
+// API requests that arrive while it loads wait for it (see below)
+const databaseState = { status: 'loading', startedAt: Date.now(), readyAt: null, error: null };
+const databaseReady = initDatabase().then(() => {
+  databaseState.status = 'ready';
+  databaseState.readyAt = Date.now();
+  console.log(`Database initialized (${databaseState.readyAt - databaseState.startedAt} ms)`);
+}, (error) => {
+  databaseState.status = 'failed';
+  databaseState.error = error.message;
+  console.error('Database initialization failed:', error);
+});
 
 // Middleware
+// Record latency per route template (e.g. /api/orders/:poNumber)
+app.use((req, res, next) => {
+  const start = process.hrtime.bigint();
+  res.on('finish', () => {
+    const route = req.route
+      ? `${req.baseUrl}${req.route.path}`
+      : (req.path.startsWith('/api/') ? 'unmatched' : 'static');
+    httpDurationHistogram.observe(
+      { method: req.method, route, status: res.statusCode },
+      Number(process.hrtime.bigint() - start) / 1e9
+    );
+  });
+  next();
+});
+
 app.use(express.json());
+
+// Hold API requests until the database is loaded (the readiness check is exempt)
+app.use('/api', async (req, res, next) => {
+  if (databaseState.status === 'loading' && req.path !== '/health') {
+    await databaseReady;
+  }
+  if (databaseState.status === 'failed' && req.path !== '/health') {
+    return res.status(503).json({ error: `Database unavailable: ${databaseState.error}` });
+  }
+  next();
+});
+
+app.use(compressResponses());
+app.use(fingerprintedAssets(path.join(__dirname, 'public')));
 app.use(express.static('public'));
 app.use('/downloads', express.static('downloads')); // Serve downloaded files
 
@@ -26,6 +99,98 @@ app.use('/downloads', express.static('downloads')); // Serve downloaded files
 const jobs = new Map();
 let jobIdCounter = 1;
 
+// Scrape jobs run in child processes; their database writes are applied here
+const serverConfig = JSON.parse(fs.readFileSync(path.join(__dirname, 'config.json'), 'utf-8'));
+const scrapePool = new ScrapeWorkerPool({
+  size: serverConfig.scrape_workers || 2,
+  persistence: { savePOHeader, saveDownloadHistory },
+  queries: { messageExists, savePOItems },
+  onTiming: ({ step, duration }) => scrapeStepHistogram.observe({ phase: scrapePhase(step), step }, duration / 1000)
+});
+
+// Overlapping download / fetch-po jobs share the scraping of POs they have in common
+const scrapeCoalescer = new ScrapeCoalescer({
+  pool: scrapePool,
+  recentMinutes: (serverConfig.scrape_coalescing || {}).recent_minutes || 0
+});
+
+createGauge('ebrandid_scrape_queue_depth', 'Scrape tasks waiting for a free worker', [], () => scrapePool.queueDepth);
+createGauge('ebrandid_scrape_tasks_active', 'Scrape tasks currently running in a worker', [], () => scrapePool.activeCount);
+createGauge('ebrandid_scrape_workers', 'Scrape worker processes alive', [], () => scrapePool.workers.length);
+createGauge('ebrandid_jobs', 'Jobs known to the server by status', ['status'], () => {
+  const counts = {};
+  for (const job of jobs.values()) {
+    counts[job.status] = (counts[job.status] || 0) + 1;
+  }
+  return Object.entries(counts).map(([status, value]) => ({ labels: { status }, value }));
+});
+createGauge('ebrandid_chromium_processes', 'Chromium processes running on this host', [], () => countChromiumProcesses());
+
+// Group timeStep names into the phases reported on /metrics
+function scrapePhase(step) {
+  if (step.startsWith('login')) return 'login';
+  if (step.includes('po-list')) return 'list_extraction';
+  if (step.startsWith('extract:')) return 'detail_extraction';
+  if (step.startsWith('transfer:') || step.startsWith('resolve:')) return 'artwork_transfer';
+  if (step.startsWith('navigate:')) return 'navigation';
+  return 'other';
+}
+
+const execFileAsync = promisify(execFile);
+
+// Count chrome/chromium/headless_shell processes (NaN if the platform tool is unavailable)
+async function countChromiumProcesses() {
+  const pattern = /chrom|headless_shell/i;
+
+  try {
+    if (process.platform === 'linux' && fs.existsSync('/proc')) {
+      let count = 0;
+      for (const entry of fs.readdirSync('/proc')) {
+        if (!/^\d+$/.test(entry)) continue;
+        try {
+          if (pattern.test(fs.readFileSync(`/proc/${entry}/comm`, 'utf-8'))) count++;
+        } catch (error) {
+          // Process exited while scanning
+        }
+      }
+      return count;
+    }
+
+    const { stdout } = process.platform === 'win32'
+      ? await execFileAsync('tasklist', ['/FO', 'CSV', '/NH'], { timeout: 5000 })
+      : await execFileAsync('ps', ['-A', '-o', 'comm='], { timeout: 5000 });
+    return stdout.split('\n').filter(line => pattern.test(line)).length;
+  } catch (error) {
+    return NaN;
+  }
+}
+
+// Scheduled delta sync of the PO list ("po_sync" in config.json)
+const PO_SYNC_DEFAULTS = {
+  enabled: false,
+  interval_minutes: 60,
+  max_fetch_per_run: 200,
+  fetch_batch_size: 25,
+  max_list_pages: 200,
+  headless: true
+};
+const poSyncConfig = { ...PO_SYNC_DEFAULTS, ...serverConfig.po_sync };
+const poSyncState = { running: null, nextRunAt: null, timer: null };
+
+// PO list columns compared against po_headers to decide whether a PO changed
+const PO_LIST_FIELDS = {
+  poDate: 'po_date',
+  shipBy: 'ship_by',
+  shipVia: 'ship_via',
+  orderType: 'order_type',
+  status: 'status',
+  loc: 'loc',
+  prodRep: 'prod_rep'
+};
+
+// Sync state key for the message high-water mark
+const MESSAGE_CURSOR_KEY = 'messages_cursor';
+
 // Sample quantity calculation based on order quantity
 function getSampleQuantity(orderQty) {
   if (orderQty <= 15) return 2;
@@ -128,12 +293,128 @@ app.get('/api/downloads', (req, res) => {
     poNumbers: job.poNumbers,
     startTime: job.startTime,
     completedTime: job.completedTime,
-    totalFiles: job.results.reduce((sum, r) => sum + (r.filesDownloaded || 0), 0)
+    totalFiles: job.results.reduce((sum, r) => sum + (r.filesDownloaded || 0), 0),
+    totalRetries: job.results.reduce((sum, r) => sum + (r.retries || 0), 0)
   }));
 
   res.json(allJobs);
 });
 
+const DOWNLOADS_DIR = path.join(__dirname, serverConfig.download_directory || 'downloads');
+
+/**
+ * Files of a PO's artwork folder to put in an archive, as <po>/<file>
+ * Bookkeeping files (.manifest.json, temp files) are left out
+ * @param {string} poNumber - PO number (must be a plain folder name)
+ */
+function getArchiveFiles(poNumber) {
+  if (!/^[\w.-]+$/.test(poNumber) || poNumber.startsWith('.')) {
+    return null;
+  }
+
+  const folder = path.join(DOWNLOADS_DIR, poNumber);
+  if (!fs.existsSync(folder)) {
+    return null;
+  }
+
+  return fs.readdirSync(folder, { withFileTypes: true })
+    .filter(dirent => dirent.isFile() && !dirent.name.startsWith('.') && !dirent.name.endsWith('.tmp'))
+    .map(dirent => ({ path: path.join(folder, dirent.name), name: `${poNumber}/${dirent.name}` }))
+    .sort((a, b) => a.name.localeCompare(b.name));
+}
+
+/**
+ * Send a zip of the given files, honouring Range / If-Range
+ * The layout is computed up front, so memory use doesn't depend on archive size
+ */
+async function sendArchive(req, res, files, filename) {
+  const layout = await buildArchiveLayout(files);
+
+  res.set('Content-Type', 'application/zip');
+  res.set('Accept-Ranges', 'bytes');
+  res.set('ETag', layout.etag);
+  res.set('Last-Modified', layout.lastModified.toUTCString());
+  res.attachment(filename);
+
+  let start = 0;
+  let end = layout.size - 1;
+  const ifRange = req.get('If-Range');
+  const rangeApplies = req.get('Range') && (!ifRange || ifRange === layout.etag);
+
+  if (rangeApplies) {
+    const ranges = req.range(layout.size, { combine: true });
+    if (ranges === -1) {
+      res.set('Content-Range', `bytes */${layout.size}`);
+      return res.status(416).end();
+    }
+    // Multiple ranges are answered with the whole archive
+    if (Array.isArray(ranges) && ranges.length === 1) {
+      ({ start, end } = ranges[0]);
+      res.status(206);
+      res.set('Content-Range', `bytes ${start}-${end}/${layout.size}`);
+    }
+  }
+
+  res.set('Content-Length', String(end - start + 1));
+
+  if (req.method === 'HEAD' || layout.size === 0) {
+    return res.end();
+  }
+
+  pipeline(Readable.from(streamArchive(layout, start, end)), res, (error) => {
+    if (error && error.code !== 'ERR_STREAM_PREMATURE_CLOSE') {
+      console.error(`Error streaming ${filename}:`, error.message);
+    }
+  });
+}
+
+// Zip of several POs' artwork: /api/downloads/archive?po=1303061,1307938
+// (must come before /:poNumber to avoid matching "archive" as a PO number)
+app.get('/api/downloads/archive', async (req, res) => {
+  try {
+    const poNumbers = [...new Set(String(req.query.po || '').split(',').map(po => po.trim()).filter(Boolean))];
+    if (poNumbers.length === 0) {
+      return res.status(400).json({ error: 'po is required (e.g. ?po=1303061,1307938)' });
+    }
+
+    const files = [];
+    const missing = [];
+    poNumbers.forEach(poNumber => {
+      const poFiles = getArchiveFiles(poNumber);
+      if (poFiles) {
+        files.push(...poFiles);
+      } else {
+        missing.push(poNumber);
+      }
+    });
+
+    if (missing.length > 0) {
+      return res.status(404).json({ error: `No downloaded artwork for PO(s): ${missing.join(', ')}` });
+    }
+
+    const name = poNumbers.length === 1 ? poNumbers[0] : `artwork-${poNumbers.length}-POs`;
+    await sendArchive(req, res, files, `${name}.zip`);
+  } catch (error) {
+    res.status(500).json({ error: error.message });
+  }
+});
+
+// Zip of one PO's artwork folder
+app.get('/api/downloads/:poNumber/archive', async (req, res) => {
+  try {
+    const { poNumber } = req.params;
+    const files = getArchiveFiles(poNumber);
+
+    if (!files) {
+      return res.status(404).json({ error: `No downloaded artwork for PO ${poNumber}` });
+    }
+
+    await sendArchive(req, res, files, `${poNumber}.zip`);
+  } catch (error) {
+    res.status(500).json({ error: error.message });
+  }
+});
+
 // Get files for specific PO
 app.get('/api/downloads/:poNumber', (req, res) => {
   const { poNumber } = req.params;
@@ -154,7 +435,7 @@ app.get('/api/downloads/:poNumber', (req, res) => {
 });
 
 // Get all POs from database with optional pagination
-app.get('/api/orders', (req, res) => {
+app.get('/api/orders', dataETag(getDataVersion), (req, res) => {
   try {
     const limit = req.query.limit ? parseInt(req.query.limit) : null;
     const offset = req.query.offset ? parseInt(req.query.offset) : 0;
@@ -181,6 +462,24 @@ app.get('/api/orders', (req, res) => {
   }
 });
 
+// Query POs with per-column filters, sorting and a page cursor
+// e.g. /api/orders/query?filters[status]=open&sort=po_date&direction=asc&limit=100&cursor=...
+// (must come before /:poNumber to avoid matching "query" as a PO number)
+app.get('/api/orders/query', dataETag(getDataVersion), (req, res) => {
+  try {
+    const result = queryPOs({
+      filters: req.query.filters,
+      sort: req.query.sort,
+      direction: req.query.direction,
+      cursor: req.query.cursor,
+      limit: req.query.limit
+    });
+    res.json(result);
+  } catch (error) {
+    res.status(500).json({ error: error.message });
+  }
+});
+
 // Search POs (must come before /:poNumber to avoid matching "search" as a PO number)
 app.get('/api/orders/search/:term', (req, res) => {
   try {
@@ -229,33 +528,84 @@ app.get('/api/orders/:poNumber', (req, res) => {
 app.get('/api/orders/:poNumber/display', (req, res) => {
   try {
     const { poNumber } = req.params;
-    const po = getPOByNumber(poNumber);
+    const display = getPODisplay(poNumber);
 
-    if (!po) {
+    if (!display) {
       return res.status(404).json({ error: 'PO not found' });
     }
 
-    const items = getPOItems(poNumber);
-    const allItems = getAllItems();
+    res.json(display);
+  } catch (error) {
+    res.status(500).json({ error: error.message });
+  }
+});
 
-    // Create a map of item_1+suffix to internal_seq for quick lookup
-    const itemSeqMap = new Map();
-    allItems.forEach(item => {
-      const key = item.suffix ? `${item.item_1}-${item.suffix}` : item.item_1;
-      itemSeqMap.set(key, item.internal_seq);
-    });
+// Get recorded scrape runs (span traces) for a PO, newest first
+app.get('/api/orders/:poNumber/traces', (req, res) => {
+  try {
+    const { poNumber } = req.params;
+    const limit = Math.min(Math.max(parseInt(req.query.limit) || 20, 1), 200);
+    res.json({ poNumber, runs: getPOTraces(poNumber, limit) });
+  } catch (error) {
+    res.status(500).json({ error: error.message });
+  }
+});
 
-    // Add internal_seq to each PO item
-    const itemsWithSeq = items.map(item => {
-      const internal_seq = itemSeqMap.get(item.item_number) || 'N/A';
-      return { ...item, internal_seq };
-    });
+/**
+ * Convert a recorded run into Chrome trace-event JSON (chrome://tracing, Perfetto)
+ * Each span becomes a complete ("X") event; times are microseconds from the first span
+ * @param {object} run - download_history row with a parsed trace
+ */
+function toChromeTrace(run) {
+  const origin = run.trace.length > 0
+    ? Math.min(...run.trace.map(span => Date.parse(span.start)))
+    : 0;
+
+  const traceEvents = run.trace.map(span => {
+    const { step, start, duration, ...args } = span;
+    return {
+      name: step,
+      cat: scrapePhase(step),
+      ph: 'X',
+      ts: (Date.parse(start) - origin) * 1000,
+      dur: duration * 1000,
+      pid: 1,
+      tid: 1,
+      args
+    };
+  });
 
-    res.json({
-      po_number: po.po_number,
-      po_date: po.po_date,
-      items: itemsWithSeq
-    });
+  traceEvents.unshift({
+    name: 'process_name',
+    ph: 'M',
+    pid: 1,
+    args: { name: `PO ${run.po_number} ${run.operation || 'download'} (${run.status})` }
+  });
+
+  return {
+    traceEvents,
+    displayTimeUnit: 'ms',
+    otherData: {
+      poNumber: run.po_number,
+      operation: run.operation,
+      status: run.status,
+      recordedAt: run.download_date,
+      durationMs: run.duration_ms
+    }
+  };
+}
+
+// Export one recorded run as a Chrome trace-event file
+app.get('/api/traces/:id/chrome', (req, res) => {
+  try {
+    const run = getTraceById(parseInt(req.params.id));
+
+    if (!run) {
+      return res.status(404).json({ error: 'Trace not found' });
+    }
+
+    res.attachment(`trace-${run.po_number}-${run.id}.json`);
+    res.json(toChromeTrace(run));
   } catch (error) {
     res.status(500).json({ error: error.message });
   }
@@ -331,7 +681,7 @@ app.post('/api/profile', (req, res) => {
 
 // Fetch messages
 app.post('/api/fetch-messages', async (req, res) => {
-  const { date, headless } = req.body;
+  const { date, headless, screenshots } = req.body;
   const jobId = `job_${jobIdCounter++}`;
 
   // Create job entry
@@ -345,23 +695,106 @@ app.post('/api/fetch-messages', async (req, res) => {
     startTime: new Date()
   });
 
-  // Start fetch messages process in background
-  processFetchMessages(jobId, date, headless);
+  // Start fetch messages process in background (config.message_screenshots applies unless the request sets screenshots)
+  processFetchMessages(jobId, date, headless, screenshots === undefined ? {} : { screenshots: Boolean(screenshots) });
+
+  res.json({ jobId, status: 'started' });
+});
+
+// Sync messages newer than the stored cursor
+app.post('/api/sync-messages', async (req, res) => {
+  const { since, headless, screenshots } = req.body;
+  const jobId = `job_${jobIdCounter++}`;
+
+  // Create job entry
+  jobs.set(jobId, {
+    id: jobId,
+    status: 'processing',
+    results: [],
+    progress: null,
+    since: since || null,
+    headless: headless !== undefined ? headless : false,
+    startTime: new Date()
+  });
+
+  // Start sync process in background
+  processSyncMessages(jobId, since, headless, screenshots === undefined ? {} : { screenshots: Boolean(screenshots) });
 
   res.json({ jobId, status: 'started' });
 });
 
-// Get all messages from database
-app.get('/api/messages', (req, res) => {
+// PO list delta sync: schedule, current run and recent run history
+app.get('/api/po-sync', (req, res) => {
+  try {
+    const limit = req.query.limit ? parseInt(req.query.limit) : 20;
+    res.json({
+      schedule: {
+        enabled: poSyncConfig.enabled,
+        intervalMinutes: poSyncConfig.interval_minutes,
+        nextRunAt: poSyncState.nextRunAt
+      },
+      running: poSyncState.running,
+      runs: getPOSyncRuns(limit)
+    });
+  } catch (error) {
+    res.status(500).json({ error: error.message });
+  }
+});
+
+// Start a PO list delta sync now
+app.post('/api/po-sync/run', (req, res) => {
+  if (poSyncState.running) {
+    return res.status(409).json({ error: 'A PO sync is already running', runId: poSyncState.running.runId });
+  }
+
+  runPOSync('manual').catch(error => console.error('PO delta sync error:', error));
+  res.json({ status: 'started', runId: poSyncState.running ? poSyncState.running.runId : null });
+});
+
+// Get the message sync cursor
+app.get('/api/sync-messages/state', (req, res) => {
   try {
-    const messages = getAllMessages();
-    res.json({ messages });
+    res.json({ cursor: getSyncState(MESSAGE_CURSOR_KEY) });
+  } catch (error) {
+    console.error('Error loading message sync state:', error);
+    res.status(500).json({ error: error.message });
+  }
+});
+
+// Get messages from database (list columns only, bodies via /api/messages/:id)
+app.get('/api/messages', dataETag(getDataVersion), (req, res) => {
+  try {
+    const limit = req.query.limit !== undefined ? Number(req.query.limit) : null;
+    const offset = req.query.offset !== undefined ? Number(req.query.offset) : 0;
+
+    if ((limit !== null && !(Number.isInteger(limit) && limit >= 0)) || !(Number.isInteger(offset) && offset >= 0)) {
+      return res.status(400).json({ error: 'limit and offset must be non-negative integers' });
+    }
+
+    const messages = getAllMessages(limit, offset);
+    res.json({ messages, total: countMessages(), limit, offset });
   } catch (error) {
     console.error('Error fetching messages:', error);
     res.status(500).json({ error: error.message });
   }
 });
 
+// Get a single message with its full details
+app.get('/api/messages/:id', (req, res) => {
+  try {
+    const message = getMessageById(req.params.id);
+
+    if (!message) {
+      return res.status(404).json({ error: 'Message not found' });
+    }
+
+    res.json({ message });
+  } catch (error) {
+    console.error('Error fetching message:', error);
+    res.status(500).json({ error: error.message });
+  }
+});
+
 // Delete all messages (must come BEFORE the :id route)
 app.delete('/api/messages', (req, res) => {
   try {
@@ -386,7 +819,7 @@ app.delete('/api/messages/:id', (req, res) => {
 });
 
 // Get all items
-app.get('/api/items', (req, res) => {
+app.get('/api/items', dataETag(getDataVersion), (req, res) => {
   try {
     const items = getAllItems();
     res.json({ items });
@@ -407,6 +840,35 @@ app.post('/api/items/rebuild', (req, res) => {
   }
 });
 
+// Get details for many items in one query
+// ?keys=ITEM1:SUFFIX,ITEM2 (suffix optional); results follow the order of keys
+app.get('/api/items/details', dataETag(getDataVersion), (req, res) => {
+  try {
+    const keys = String(req.query.keys || '')
+      .split(',')
+      .map(key => key.trim())
+      .filter(key => key !== '')
+      .map(key => {
+        const separator = key.indexOf(':');
+        const item_1 = separator === -1 ? key : key.slice(0, separator);
+        const suffix = separator === -1 ? null : key.slice(separator + 1);
+        return { item_1, suffix: (!suffix || suffix === 'null') ? null : suffix };
+      });
+
+    if (keys.length === 0) {
+      return res.status(400).json({ error: 'keys is required (e.g. ?keys=ITEM1:A,ITEM2)' });
+    }
+
+    const details = getItemDetailsBatch(keys);
+    res.json({
+      items: keys.map((key, index) => ({ ...key, details: details[index] }))
+    });
+  } catch (error) {
+    console.error('Error fetching item details:', error);
+    res.status(500).json({ error: error.message });
+  }
+});
+
 // Get item details
 app.get('/api/items/:item_1/:suffix/details', (req, res) => {
   try {
@@ -434,6 +896,26 @@ app.post('/api/items/details', (req, res) => {
   }
 });
 
+// Save details for many items in one transaction
+app.post('/api/items/details/batch', (req, res) => {
+  try {
+    const items = Array.isArray(req.body) ? req.body : req.body.items;
+
+    if (!Array.isArray(items) || items.length === 0) {
+      return res.status(400).json({ error: 'items must be a non-empty array' });
+    }
+    if (items.some(item => !item || !item.item_1)) {
+      return res.status(400).json({ error: 'Every item needs an item_1' });
+    }
+
+    const result = saveItemDetailsBatch(items);
+    res.json(result);
+  } catch (error) {
+    console.error('Error saving item details batch:', error);
+    res.status(500).json({ error: error.message });
+  }
+});
+
 // Export all POs with items to Excel
 app.get('/api/export-excel', (req, res) => {
   try {
@@ -649,144 +1131,296 @@ app.get('/api/qc-report/:poNumber', (req, res) => {
   }
 });
 
-// Background download processor
-async function processDownload(jobId, poNumbers, headless = false) {
+// Run a scrape task in the worker pool, streaming its progress and results into the job
+async function runScrapeJob(jobId, task, payload) {
   const job = jobs.get(jobId);
-  const downloader = new EBrandIDDownloader();
+  const start = Date.now();
+  let outcome = 'failed';
 
   try {
-    // Initialize and login
-    job.progress = 'Initializing browser...';
-    await downloader.initialize(headless);
+    const value = await scrapeCoalescer.run(task, payload, {
+      onUpdate: (fields) => Object.assign(job, fields),
+      onResult: (result) => job.results.push(result)
+    });
+    outcome = 'completed';
+    return value;
+  } finally {
+    jobDurationHistogram.observe({ task, outcome }, (Date.now() - start) / 1000);
+  }
+}
 
-    job.progress = 'Logging in...';
-    await downloader.login();
+function markJobFailed(job, label, error) {
+  console.error(`${label}:`, error);
+  job.status = 'failed';
+  job.error = error.message;
+  job.completedTime = new Date();
+}
+
+function saveFetchedMessages(messages) {
+  for (const message of messages) {
+    saveMessage({
+      refNumber: message.refNumber,
+      author: message.author,
+      receivedDate: message.receivedDate,
+      subject: message.subject,
+      comment: message.comment,
+      fullDetails: message.fullDetails,
+      messageLink: message.messageLink,
+      commentId: message.commentId
+    });
+  }
+}
 
-    // Process each PO
-    for (const poNumber of poNumbers) {
-      job.currentPO = poNumber;
-      job.progress = `Processing PO ${poNumber}...`;
+// Background download processor
+async function processDownload(jobId, poNumbers, headless = false) {
+  const job = jobs.get(jobId);
 
-      const result = await downloader.downloadPOArtwork(poNumber);
-      job.results.push(result);
-    }
+  try {
+    await runScrapeJob(jobId, 'download', { poNumbers, headless });
 
     // Mark as completed
     job.status = 'completed';
     job.completedTime = new Date();
-    job.currentPO = null;
-    job.progress = 'All downloads completed';
-
   } catch (error) {
-    console.error('Download error:', error);
-    job.status = 'failed';
-    job.error = error.message;
-    job.completedTime = new Date();
-  } finally {
-    await downloader.close();
+    markJobFailed(job, 'Download error', error);
   }
 }
 
 // Background fetch PO information processor (optimized)
 async function processFetchPO(jobId, poNumbers, headless = false) {
   const job = jobs.get(jobId);
-  const downloader = new EBrandIDDownloader();
 
   try {
-    // Initialize and login
-    job.progress = 'Initializing browser...';
-    await downloader.initialize(headless);
-
-    job.progress = 'Logging in...';
-    await downloader.login();
-
-    // Navigate to PO list page ONCE at the beginning
-    job.progress = 'Navigating to PO list page...';
-    await downloader.navigateToPOListPage();
-
-    // Process each PO (staying on list page between POs)
-    for (let i = 0; i < poNumbers.length; i++) {
-      const poNumber = poNumbers[i];
-      job.currentPO = poNumber;
-      job.progress = `Fetching PO ${poNumber} information (${i + 1}/${poNumbers.length})...`;
-
-      const result = await downloader.fetchPOInformationOptimized(poNumber);
-      job.results.push(result);
-    }
+    await runScrapeJob(jobId, 'fetch-po', { poNumbers, headless });
 
     // Mark as completed
     job.status = 'completed';
     job.completedTime = new Date();
-    job.currentPO = null;
-    job.progress = `All PO information fetched (${poNumbers.length} POs processed)`;
-
   } catch (error) {
-    console.error('Fetch PO error:', error);
-    job.status = 'failed';
-    job.error = error.message;
-    job.completedTime = new Date();
-  } finally {
-    await downloader.close();
+    markJobFailed(job, 'Fetch PO error', error);
   }
 }
 
 // Background fetch messages processor
-async function processFetchMessages(jobId, customDate = null, headless = false) {
+async function processFetchMessages(jobId, customDate = null, headless = false, options = {}) {
   const job = jobs.get(jobId);
-  const downloader = new EBrandIDDownloader();
 
   try {
-    // Initialize and login
-    job.progress = 'Initializing browser...';
-    await downloader.initialize(headless);
+    const messagesData = await runScrapeJob(jobId, 'fetch-messages', { customDate, headless, options });
 
-    job.progress = 'Logging in...';
-    await downloader.login();
+    // Save messages to database
+    job.progress = `Saving ${messagesData.messages.length} messages to database...`;
+    saveFetchedMessages(messagesData.messages);
 
-    // Navigate to Message page
-    job.progress = 'Navigating to Message page...';
-    await downloader.navigateToMessagePage();
+    // Mark as completed
+    job.status = 'completed';
+    job.completedTime = new Date();
+    job.progress = `Successfully extracted and saved ${messagesData.messages.length} messages`;
+    job.results = messagesData.messages;
 
-    // Extract messages from the page
-    job.progress = 'Extracting messages...';
-    const messagesData = await downloader.extractMessages(customDate);
+  } catch (error) {
+    markJobFailed(job, 'Fetch messages error', error);
+  }
+}
+
+// Background incremental message sync processor
+async function processSyncMessages(jobId, since = null, headless = false, options = {}) {
+  const job = jobs.get(jobId);
 
-    // Add debug info to progress
-    if (messagesData.debug && messagesData.debug.length > 0) {
-      job.progress = `Debug: Found ${messagesData.debug.length} rows. First row cells: ${JSON.stringify(messagesData.debug[0])}`;
+  try {
+    // Work out where to start: stored cursor, explicit "since" date, or the last N days
+    let cursor = getSyncState(MESSAGE_CURSOR_KEY);
+    if (since) {
+      cursor = { receivedAt: new Date(`${since}T00:00:00`).toISOString() };
+    } else if (!cursor) {
+      const config = JSON.parse(fs.readFileSync(path.join(__dirname, 'config.json'), 'utf-8'));
+      const initialDays = config.message_sync_initial_days || 7;
+      const start = new Date();
+      start.setHours(0, 0, 0, 0);
+      start.setDate(start.getDate() - initialDays);
+      cursor = { receivedAt: start.toISOString() };
     }
 
-    // Save messages to database
-    job.progress = `Saving ${messagesData.messages.length} messages to database...`;
-    for (const message of messagesData.messages) {
-      saveMessage({
-        refNumber: message.refNumber,
-        author: message.author,
-        receivedDate: message.receivedDate,
-        subject: message.subject,
-        comment: message.comment,
-        fullDetails: message.fullDetails,
-        messageLink: message.messageLink,
-        commentId: message.commentId
+    // Extract only messages newer than the cursor (stored rows are checked against the database over IPC)
+    const syncData = await runScrapeJob(jobId, 'sync-messages', { cursor, headless, options });
+
+    // Save new messages to database
+    job.progress = `Saving ${syncData.messages.length} new messages to database...`;
+    saveFetchedMessages(syncData.messages);
+
+    // Advance the high-water mark to the newest message seen
+    const newest = syncData.newest;
+    if (newest && (!cursor.receivedAt || new Date(newest.receivedAt) >= new Date(cursor.receivedAt))) {
+      setSyncState(MESSAGE_CURSOR_KEY, {
+        receivedAt: newest.receivedAt,
+        receivedDate: newest.receivedDate,
+        refNumber: newest.refNumber,
+        commentId: newest.commentId || null
       });
     }
 
     // Mark as completed
     job.status = 'completed';
     job.completedTime = new Date();
-    job.progress = `Successfully extracted and saved ${messagesData.messages.length} messages`;
-    job.results = messagesData.messages;
+    job.progress = `Synced ${syncData.messages.length} new messages (${syncData.skipped} already stored, ${syncData.pagesScanned} page(s) scanned)`;
+    job.results = syncData.messages;
 
   } catch (error) {
-    console.error('Fetch messages error:', error);
-    job.status = 'failed';
-    job.error = error.message;
-    job.completedTime = new Date();
+    markJobFailed(job, 'Sync messages error', error);
+  }
+}
+
+/**
+ * Compare PO list rows with stored headers
+ * Only the fields the list page shows are compared. Status is normalised because
+ * the stored value comes from the detail page; an empty list cell never counts
+ * as a change.
+ * @param {Array} rows - Rows from extractPOListRows
+ * @param {Map} snapshot - Stored headers from getPOListSnapshot
+ */
+function diffPOList(rows, snapshot) {
+  const normalize = (field, value) => {
+    const text = String(value ?? '').trim();
+    return field === 'status' ? text.toLowerCase().replace(/[^a-z0-9]/g, '') : text;
+  };
+
+  const added = [];
+  const changed = [];
+
+  for (const row of rows) {
+    const stored = snapshot.get(row.poNumber);
+
+    if (!stored) {
+      added.push(row.poNumber);
+      continue;
+    }
+
+    const differs = Object.entries(PO_LIST_FIELDS).some(([field, column]) => {
+      const listValue = normalize(column, row[field]);
+      return listValue !== '' && listValue !== normalize(column, stored[column]);
+    });
+
+    if (differs) {
+      changed.push(row.poNumber);
+    }
+  }
+
+  return { added, changed };
+}
+
+// Read the PO list, then fetch details only for new or changed POs
+async function runPOSync(trigger) {
+  if (poSyncState.running) {
+    return null;
+  }
+
+  const runId = startPOSyncRun(trigger);
+  const startTime = Date.now();
+  const run = { status: 'running', newCount: 0, changedCount: 0, fetchedCount: 0, failedCount: 0 };
+  poSyncState.running = { runId, trigger, startTime: new Date(startTime), phase: 'list', progress: null };
+
+  console.log(`\nPO delta sync #${runId} started (${trigger})`);
+
+  try {
+    const rows = await scrapePool.run('po-list', {
+      headless: poSyncConfig.headless,
+      maxPages: poSyncConfig.max_list_pages
+    }, {
+      onUpdate: (fields) => { poSyncState.running.progress = fields.progress || poSyncState.running.progress; }
+    });
+    run.listRows = rows.length;
+    run.listDurationMs = Date.now() - startTime;
+
+    const { added, changed } = diffPOList(rows, getPOListSnapshot());
+    run.newCount = added.length;
+    run.changedCount = changed.length;
+
+    const toFetch = [...added, ...changed].slice(0, poSyncConfig.max_fetch_per_run);
+    console.log(`PO delta sync #${runId}: ${rows.length} listed, ${added.length} new, ${changed.length} changed, fetching ${toFetch.length}`);
+
+    // Fetch in batches so queued user jobs can get a worker between them
+    poSyncState.running.phase = 'fetch';
+    const fetchStart = Date.now();
+    for (let i = 0; i < toFetch.length; i += poSyncConfig.fetch_batch_size) {
+      const batch = toFetch.slice(i, i + poSyncConfig.fetch_batch_size);
+      let batchResults = 0;
+      try {
+        // Attaches to user fetches already running, but never reuses finished results:
+        // the list just showed these POs changed
+        await scrapeCoalescer.run('fetch-po', { poNumbers: batch, headless: poSyncConfig.headless }, {
+          onUpdate: (fields) => { poSyncState.running.progress = fields.progress || poSyncState.running.progress; },
+          onResult: (result) => {
+            batchResults++;
+            if (result.status === 'failed') {
+              run.failedCount++;
+            } else {
+              run.fetchedCount++;
+            }
+          }
+        }, { reuseRecent: false });
+      } catch (error) {
+        // POs the failed batch never got to count as failed; they are picked up again next run
+        console.log(`⚠ PO delta sync batch failed: ${error.message}`);
+        run.failedCount += batch.length - batchResults;
+      }
+    }
+    run.fetchDurationMs = Date.now() - fetchStart;
+    run.status = run.failedCount > 0 ? 'completed_with_errors' : 'completed';
+  } catch (error) {
+    console.error('PO delta sync error:', error);
+    run.status = 'failed';
+    run.error = error.message;
   } finally {
-    await downloader.close();
+    run.durationMs = Date.now() - startTime;
+    finishPOSyncRun(runId, run);
+    poSyncState.running = null;
+    console.log(`PO delta sync #${runId} ${run.status} in ${(run.durationMs / 1000).toFixed(1)}s`);
+  }
+
+  return runId;
+}
+
+function schedulePOSync() {
+  if (!poSyncConfig.enabled) {
+    return;
   }
+
+  const intervalMs = poSyncConfig.interval_minutes * 60 * 1000;
+  poSyncState.nextRunAt = new Date(Date.now() + intervalMs);
+  poSyncState.timer = setTimeout(async () => {
+    try {
+      await runPOSync('schedule');
+    } catch (error) {
+      console.error('PO delta sync error:', error);
+    }
+    schedulePOSync();
+  }, intervalMs);
+  poSyncState.timer.unref();
 }
 
+// Readiness: 200 once the database is loaded and migrated, 503 before that
+app.get('/api/health', (req, res) => {
+  const ready = databaseState.status === 'ready';
+  res.status(ready ? 200 : 503).json({
+    status: databaseState.status,
+    schemaVersion: ready ? getSchemaVersion() : null,
+    databaseLoadMs: databaseState.readyAt ? databaseState.readyAt - databaseState.startedAt : null,
+    error: databaseState.error,
+    readCache: getReadCacheStats(),
+    uptimeSeconds: Math.round(process.uptime())
+  });
+});
+
+// Prometheus metrics
+app.get('/metrics', async (req, res) => {
+  try {
+    res.set('Content-Type', 'text/plain; version=0.0.4; charset=utf-8');
+    res.send(await renderMetrics());
+  } catch (error) {
+    res.status(500).json({ error: error.message });
+  }
+});
+
 // Get local IP address for network access
 function getLocalIPAddress() {
   const nets = os.networkInterfaces();
@@ -805,6 +1439,7 @@ function getLocalIPAddress() {
 // Start server with automatic port fallback
 function startServer(port, maxAttempts = 10) {
   const server = app.listen(port, '0.0.0.0', async () => {
+    port = server.address().port;
     const localIP = await getLocalIPAddress();
     console.log(`\n${'='.repeat(60)}`);
     console.log('E-BrandID Web Server is running!');
@@ -832,3 +1467,8 @@ function startServer(port, maxAttempts = 10) {
 }
 
 startServer(PORT);
+databaseReady.then(() => {
+  if (databaseState.status === 'ready') {
+    schedulePOSync();
+  }
+});
@@ -0,0 +1,110 @@
+import fs from 'fs';
+import path from 'path';
+import crypto from 'crypto';
+import { fileURLToPath } from 'url';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+
+// Logged-in Playwright storage state (cookies, local storage), shared by server
+// jobs, scrape workers and CLI runs so each one doesn't have to log in again.
+// The file is encrypted with AES-256-GCM; the key comes from EBRANDID_SESSION_KEY
+// or, when that is not set, from the configured credentials, so changing the
+// account also invalidates the cache. Overridden by "session_cache" in config.json.
+const DEFAULT_SESSION_CACHE = {
+  enabled: true,
+  ttl_minutes: 240,
+  file: '.session-state'
+};
+
+const FILE_VERSION = 1;
+
+function resolveSessionCache(config) {
+  return { ...DEFAULT_SESSION_CACHE, ...(config.session_cache || {}) };
+}
+
+function getSessionPath(settings) {
+  return path.resolve(__dirname, settings.file);
+}
+
+function deriveKey(config, salt) {
+  const secret = process.env.EBRANDID_SESSION_KEY || `${config.login_url}\u0000${config.username}\u0000${config.password}`;
+  return crypto.scryptSync(secret, salt, 32);
+}
+
+/**
+ * Load the cached login session if it exists, decrypts and has not expired
+ * @param {object} config - Loaded config.json
+ * @returns {object|null} Playwright storage state, or null when a full login is needed
+ */
+export function loadSession(config) {
+  const settings = resolveSessionCache(config);
+  const sessionPath = getSessionPath(settings);
+
+  if (!settings.enabled || !fs.existsSync(sessionPath)) {
+    return null;
+  }
+
+  try {
+    const file = JSON.parse(fs.readFileSync(sessionPath, 'utf-8'));
+    if (file.version !== FILE_VERSION || Date.parse(file.expiresAt) <= Date.now()) {
+      return null;
+    }
+
+    const key = deriveKey(config, Buffer.from(file.salt, 'base64'));
+    const decipher = crypto.createDecipheriv('aes-256-gcm', key, Buffer.from(file.iv, 'base64'));
+    decipher.setAuthTag(Buffer.from(file.tag, 'base64'));
+    const plaintext = Buffer.concat([
+      decipher.update(Buffer.from(file.data, 'base64')),
+      decipher.final()
+    ]);
+
+    return JSON.parse(plaintext.toString('utf-8'));
+  } catch (error) {
+    // Wrong key (credentials changed) or a damaged file - log in again
+    console.log(`⚠ Ignoring saved login session: ${error.message}`);
+    return null;
+  }
+}
+
+/**
+ * Encrypt and store the storage state of a freshly logged-in context
+ * @param {object} config - Loaded config.json
+ * @param {object} storageState - Result of browserContext.storageState()
+ */
+export function saveSession(config, storageState) {
+  const settings = resolveSessionCache(config);
+  if (!settings.enabled) {
+    return;
+  }
+
+  const salt = crypto.randomBytes(16);
+  const iv = crypto.randomBytes(12);
+  const cipher = crypto.createCipheriv('aes-256-gcm', deriveKey(config, salt), iv);
+  const data = Buffer.concat([cipher.update(JSON.stringify(storageState), 'utf-8'), cipher.final()]);
+
+  const file = {
+    version: FILE_VERSION,
+    savedAt: new Date().toISOString(),
+    expiresAt: new Date(Date.now() + settings.ttl_minutes * 60 * 1000).toISOString(),
+    salt: salt.toString('base64'),
+    iv: iv.toString('base64'),
+    tag: cipher.getAuthTag().toString('base64'),
+    data: data.toString('base64')
+  };
+
+  // Several workers may log in at once; each writes its own temp file and renames it
+  const sessionPath = getSessionPath(settings);
+  const tempPath = `${sessionPath}.${process.pid}.tmp`;
+  fs.writeFileSync(tempPath, JSON.stringify(file), { mode: 0o600 });
+  fs.renameSync(tempPath, sessionPath);
+}
+
+/**
+ * Remove the cached session (after it was rejected by the site)
+ * @param {object} config - Loaded config.json
+ */
+export function clearSession(config) {
+  const sessionPath = getSessionPath(resolveSessionCache(config));
+  fs.rmSync(sessionPath, { force: true });
+}
@@ -1,109 +1,90 @@
-from playwright.sync_api import sync_playwright
-import time
-from pathlib import Path
-
-# Create screenshots directory
-screenshots_dir = Path("screenshots_full")
-screenshots_dir.mkdir(exist_ok=True)
-
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=True)
-    page = browser.new_page()
-
-    print("Navigating to http://localhost:8766...")
-    page.goto('http://localhost:8766')
-    page.wait_for_load_state('networkidle')
-    page.wait_for_timeout(2000)
-
-    # Take initial screenshot
-    print("Taking initial screenshot...")
-    page.screenshot(path=str(screenshots_dir / '00_initial.png'), full_page=True)
-
-    # Navigation buttons to click to reveal different sections
-    nav_buttons = ['Download', 'Order Status', 'Message', 'Profile']
-
-    all_clicked_buttons = []
-    section_num = 1
-
-    for nav_button_text in nav_buttons:
-        print(f"\n{'='*60}")
-        print(f"SECTION {section_num}: Navigating to '{nav_button_text}' section")
-        print('='*60)
-
-        try:
-            # Click the navigation button
-            nav_button = page.get_by_role('button', name=nav_button_text)
-            if nav_button.is_visible():
-                print(f"Clicking navigation button: {nav_button_text}")
-                nav_button.click()
-                page.wait_for_timeout(2000)
-                page.wait_for_load_state('networkidle')
-
-                # Take screenshot after navigation
-                page.screenshot(path=str(screenshots_dir / f'{section_num:02d}_{nav_button_text.replace(" ", "_")}_section.png'), full_page=True)
-
-                # Now find all buttons in this section
-                print(f"\nDiscovering buttons in '{nav_button_text}' section...")
-                buttons = page.locator('button').all()
-
-                visible_buttons = []
-                for i, btn in enumerate(buttons):
-                    try:
-                        if btn.is_visible() and btn.is_enabled():
-                            text = btn.inner_text(timeout=1000).strip()
-                            if not text:
-                                text = btn.get_attribute('value') or btn.get_attribute('aria-label') or f"Button_{i}"
-
-                            # Skip navigation buttons we already clicked
-                            if text not in nav_buttons:
-                                visible_buttons.append({'text': text, 'element': btn, 'index': i})
-                                print(f"  [OK] Found button: '{text}'")
-                    except:
-                        pass
-
-                print(f"\nFound {len(visible_buttons)} clickable buttons in this section")
-
-                # Click each button in this section
-                for btn_info in visible_buttons:
-                    text = btn_info['text']
-                    btn = btn_info['element']
-
-                    if text in all_clicked_buttons:
-                        print(f"\nSkipping '{text}' (already clicked)")
-                        continue
-
-                    try:
-                        print(f"\nClicking button: '{text}'")
-                        btn.scroll_into_view_if_needed(timeout=5000)
-                        page.wait_for_timeout(500)
-                        btn.click(timeout=5000)
-                        all_clicked_buttons.append(text)
-
-                        page.wait_for_timeout(2000)
-
-                        # Take screenshot
-                        safe_text = text[:30].replace(' ', '_').replace('/', '_').replace('\\', '_').replace(':', '_')
-                        screenshot_name = f'{section_num:02d}_{nav_button_text.replace(" ", "_")}_after_{safe_text}.png'
-                        page.screenshot(path=str(screenshots_dir / screenshot_name), full_page=True)
-                        print(f"  [OK] Screenshot saved: {screenshot_name}")
-
-                    except Exception as e:
-                        print(f"  [ERROR] Failed to click '{text}': {e}")
-
-                section_num += 1
-
-        except Exception as e:
-            print(f"[ERROR] Failed to navigate to '{nav_button_text}': {e}")
-
-    # Final summary
-    print("\n" + "="*60)
-    print("=== Automation Complete ===")
-    print(f"Total sections explored: {section_num - 1}")
-    print(f"Total buttons clicked: {len(all_clicked_buttons)}")
-    print(f"\nButtons clicked:")
-    for btn_text in all_clicked_buttons:
-        print(f"  - {btn_text}")
-    print(f"\nScreenshots saved to: {screenshots_dir.absolute()}")
-    print("="*60)
-
-    browser.close()
+"""
+Tests for each sidebar section of the web application against the seeded database
+"""
+
+import pytest
+from playwright.sync_api import expect
+
+from tests_data import NAV_SECTIONS, SEED_ITEM_NUMBERS, SEED_MESSAGE_SUBJECTS, SEED_PO_NUMBERS
+
+SECTION_VIEWS = {
+    'Download': 'download-artwork',
+    'Order Status': 'order-status',
+    'Item': 'item',
+    'Message': 'message',
+    'Profile': 'profile'
+}
+
+
+@pytest.mark.parametrize('section', NAV_SECTIONS)
+def test_section_opens(page, open_section, screenshot, section):
+    view = open_section(section)
+    assert view.get_attribute('id') == SECTION_VIEWS[section]
+    expect(page.locator('.sidebar .nav-button.active')).to_have_text(section)
+    screenshot(f'{section}_section')
+
+
+def test_order_status_lists_seeded_pos(page, open_section):
+    open_section('Order Status')
+    orders = page.locator('#orders-body')
+    for po_number in SEED_PO_NUMBERS:
+        expect(orders).to_contain_text(po_number)
+
+
+def test_order_detail_and_back(page, open_section, screenshot):
+    open_section('Order Status')
+    page.locator(f'#orders-body .view-detail-btn[data-po="{SEED_PO_NUMBERS[0]}"]').click()
+
+    expect(page.locator('#po-detail-section')).to_be_visible()
+    expect(page.locator('#po-header-info')).to_contain_text(SEED_PO_NUMBERS[0])
+    expect(page.locator('#po-items-body')).to_contain_text('WL1001-A')
+    screenshot('po_detail')
+
+    page.locator('#back-to-list-btn').click()
+    expect(page.locator('#orders-list-section')).to_be_visible()
+
+
+def test_order_search(page, open_section):
+    open_section('Order Status')
+    page.locator('#status-search').fill(SEED_PO_NUMBERS[1])
+    page.locator('#search-btn').click()
+
+    orders = page.locator('#orders-body')
+    expect(orders).to_contain_text(SEED_PO_NUMBERS[1])
+    expect(orders).not_to_contain_text(SEED_PO_NUMBERS[0])
+
+
+def test_item_section_lists_seeded_items(page, open_section):
+    open_section('Item')
+    items = page.locator('#items-body')
+    for item_number in SEED_ITEM_NUMBERS:
+        expect(items).to_contain_text(item_number)
+
+
+def test_item_detail_shows_saved_details(page, open_section, screenshot):
+    open_section('Item')
+    page.locator('#items-body .view-item-detail-btn[data-item1="WL1001"][data-suffix="A"]').click()
+
+    expect(page.locator('#item-detail-modal')).to_be_visible()
+    expect(page.locator('#detail-brand-name')).to_have_value('Test Brand')
+    screenshot('item_detail')
+
+    page.locator('#item-detail-close-btn').click()
+    expect(page.locator('#item-detail-modal')).to_be_hidden()
+
+
+def test_load_messages_from_database(page, open_section, screenshot):
+    open_section('Message')
+    page.locator('#load-all-msg-btn').click()
+
+    messages = page.locator('#messages-body')
+    for subject in SEED_MESSAGE_SUBJECTS:
+        expect(messages).to_contain_text(subject)
+    expect(page.locator('#messages-title')).to_contain_text(f'{len(SEED_MESSAGE_SUBJECTS)} total')
+    screenshot('messages')
+
+
+def test_profile_shows_configured_username(page, context, open_section):
+    open_section('Profile')
+    username = context.request.get('/api/profile').json()['username']
+    expect(page.locator('#profile-username')).to_have_value(username)
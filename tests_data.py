@@ -0,0 +1,9 @@
+"""
+Data written by seed-test-db.js, shared by the pytest modules and conftest.py
+"""
+
+SEED_PO_NUMBERS = ['1303061', '1307938']
+SEED_ITEM_NUMBERS = ['WL1001-A', 'WL1001-B', 'HT2002']
+SEED_MESSAGE_SUBJECTS = ['Artwork approved', 'Shipping update']
+
+NAV_SECTIONS = ['Download', 'Order Status', 'Item', 'Message', 'Profile']
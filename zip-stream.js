@@ -0,0 +1,297 @@
+import fs from 'fs';
+import path from 'path';
+import zlib from 'zlib';
+import crypto from 'crypto';
+
+// Streaming ZIP archives built from files on disk
+// The complete byte layout (headers, sizes, CRCs) is worked out before anything
+// is sent, so responses carry a Content-Length and any byte range can be produced
+// without buffering: file data is streamed straight from disk (stored entries) or
+// re-deflated on the fly (deflated entries, deterministic for a given zlib).
+// Formats that are already compressed are stored as-is.
+
+const STORED_EXTENSIONS = new Set([
+  '.jpg', '.jpeg', '.png', '.gif', '.webp', '.heic', '.avif', '.pdf', '.ai',
+  '.zip', '.gz', '.7z', '.rar', '.mp4', '.mov', '.docx', '.xlsx', '.pptx'
+]);
+
+const METHOD_STORE = 0;
+const METHOD_DEFLATE = 8;
+const DEFLATE_OPTIONS = { level: 6 };
+const UINT32_MAX = 0xFFFFFFFF;
+
+// CRC and deflated size per file version (path + size + mtime), so repeat
+// downloads and range requests skip the measuring pass
+const ENTRY_CACHE_SIZE = 5000;
+const entryCache = new Map();
+
+const CRC_TABLE = new Uint32Array(256).map((value, n) => {
+  let c = n;
+  for (let k = 0; k < 8; k++) {
+    c = c & 1 ? 0xEDB88320 ^ (c >>> 1) : c >>> 1;
+  }
+  return c >>> 0;
+});
+
+/**
+ * CRC-32 (ZIP polynomial) of a buffer, continuing from a previous value
+ * @param {Buffer} buffer - Data
+ * @param {number} previous - CRC of the preceding data (0 to start)
+ */
+export function crc32(buffer, previous = 0) {
+  let crc = (previous ^ UINT32_MAX) >>> 0;
+  for (let i = 0; i < buffer.length; i++) {
+    crc = CRC_TABLE[(crc ^ buffer[i]) & 0xFF] ^ (crc >>> 8);
+  }
+  return (crc ^ UINT32_MAX) >>> 0;
+}
+
+function dosDateTime(date) {
+  const year = Math.max(date.getFullYear(), 1980);
+  return {
+    time: (date.getHours() << 11) | (date.getMinutes() << 5) | Math.floor(date.getSeconds() / 2),
+    date: ((year - 1980) << 9) | ((date.getMonth() + 1) << 5) | date.getDate()
+  };
+}
+
+/**
+ * Read a file once to get its CRC and, for compressible files, its deflated size
+ * Falls back to storing when deflate doesn't make the file smaller
+ */
+async function measureFile(filePath, size, deflate) {
+  let crc = 0;
+  let compressedSize = 0;
+  const deflater = deflate ? zlib.createDeflateRaw(DEFLATE_OPTIONS) : null;
+  const deflated = deflater
+    ? new Promise((resolve, reject) => {
+      deflater.on('data', chunk => { compressedSize += chunk.length; });
+      deflater.on('end', resolve);
+      deflater.on('error', reject);
+    })
+    : null;
+
+  for await (const chunk of fs.createReadStream(filePath)) {
+    crc = crc32(chunk, crc);
+    if (deflater && !deflater.write(chunk)) {
+      await new Promise(resolve => deflater.once('drain', resolve));
+    }
+  }
+
+  if (deflater) {
+    deflater.end();
+    await deflated;
+    if (compressedSize < size) {
+      return { crc, method: METHOD_DEFLATE, compressedSize };
+    }
+  }
+  return { crc, method: METHOD_STORE, compressedSize: size };
+}
+
+async function describeFile(filePath, stats) {
+  const key = `${filePath}\u0000${stats.size}\u0000${stats.mtimeMs}`;
+  if (entryCache.has(key)) {
+    return entryCache.get(key);
+  }
+
+  const deflate = !STORED_EXTENSIONS.has(path.extname(filePath).toLowerCase()) && stats.size > 0;
+  const description = await measureFile(filePath, stats.size, deflate);
+
+  if (entryCache.size >= ENTRY_CACHE_SIZE) {
+    entryCache.delete(entryCache.keys().next().value);
+  }
+  entryCache.set(key, description);
+  return description;
+}
+
+function zip64Extra(fields) {
+  const extra = Buffer.alloc(4 + fields.length * 8);
+  extra.writeUInt16LE(0x0001, 0);
+  extra.writeUInt16LE(fields.length * 8, 2);
+  fields.forEach((value, i) => extra.writeBigUInt64LE(BigInt(value), 4 + i * 8));
+  return extra;
+}
+
+function localHeader(entry) {
+  const large = entry.size >= UINT32_MAX || entry.compressedSize >= UINT32_MAX;
+  const extra = large ? zip64Extra([entry.size, entry.compressedSize]) : Buffer.alloc(0);
+  const header = Buffer.alloc(30);
+  header.writeUInt32LE(0x04034B50, 0);
+  header.writeUInt16LE(large ? 45 : 20, 4);
+  header.writeUInt16LE(0x0800, 6); // UTF-8 names
+  header.writeUInt16LE(entry.method, 8);
+  header.writeUInt16LE(entry.dosTime, 10);
+  header.writeUInt16LE(entry.dosDate, 12);
+  header.writeUInt32LE(entry.crc, 14);
+  header.writeUInt32LE(large ? UINT32_MAX : entry.compressedSize, 18);
+  header.writeUInt32LE(large ? UINT32_MAX : entry.size, 22);
+  header.writeUInt16LE(entry.nameBuffer.length, 26);
+  header.writeUInt16LE(extra.length, 28);
+  return Buffer.concat([header, entry.nameBuffer, extra]);
+}
+
+function centralDirectoryHeader(entry) {
+  const large = entry.size >= UINT32_MAX || entry.compressedSize >= UINT32_MAX || entry.offset >= UINT32_MAX;
+  const extra = large ? zip64Extra([entry.size, entry.compressedSize, entry.offset]) : Buffer.alloc(0);
+  const header = Buffer.alloc(46);
+  header.writeUInt32LE(0x02014B50, 0);
+  header.writeUInt16LE(large ? 45 : 20, 4);
+  header.writeUInt16LE(large ? 45 : 20, 6);
+  header.writeUInt16LE(0x0800, 8);
+  header.writeUInt16LE(entry.method, 10);
+  header.writeUInt16LE(entry.dosTime, 12);
+  header.writeUInt16LE(entry.dosDate, 14);
+  header.writeUInt32LE(entry.crc, 16);
+  header.writeUInt32LE(large ? UINT32_MAX : entry.compressedSize, 20);
+  header.writeUInt32LE(large ? UINT32_MAX : entry.size, 24);
+  header.writeUInt16LE(entry.nameBuffer.length, 28);
+  header.writeUInt16LE(extra.length, 30);
+  header.writeUInt32LE(large ? UINT32_MAX : entry.offset, 42);
+  return Buffer.concat([header, entry.nameBuffer, extra]);
+}
+
+function endOfCentralDirectory(count, directorySize, directoryOffset) {
+  const records = [];
+  const large = count >= 0xFFFF || directorySize >= UINT32_MAX || directoryOffset >= UINT32_MAX;
+
+  if (large) {
+    const zip64End = Buffer.alloc(56);
+    zip64End.writeUInt32LE(0x06064B50, 0);
+    zip64End.writeBigUInt64LE(44n, 4);
+    zip64End.writeUInt16LE(45, 12);
+    zip64End.writeUInt16LE(45, 14);
+    zip64End.writeBigUInt64LE(BigInt(count), 24);
+    zip64End.writeBigUInt64LE(BigInt(count), 32);
+    zip64End.writeBigUInt64LE(BigInt(directorySize), 40);
+    zip64End.writeBigUInt64LE(BigInt(directoryOffset), 48);
+
+    const locator = Buffer.alloc(20);
+    locator.writeUInt32LE(0x07064B50, 0);
+    locator.writeBigUInt64LE(BigInt(directoryOffset + directorySize), 8);
+    locator.writeUInt32LE(1, 16);
+    records.push(zip64End, locator);
+  }
+
+  const end = Buffer.alloc(22);
+  end.writeUInt32LE(0x06054B50, 0);
+  end.writeUInt16LE(Math.min(count, 0xFFFF), 8);
+  end.writeUInt16LE(Math.min(count, 0xFFFF), 10);
+  end.writeUInt32LE(Math.min(directorySize, UINT32_MAX), 12);
+  end.writeUInt32LE(Math.min(directoryOffset, UINT32_MAX), 16);
+  records.push(end);
+
+  return Buffer.concat(records);
+}
+
+/**
+ * Work out the full byte layout of an archive
+ * @param {Array<object>} files - [{ path: file on disk, name: path inside the archive }]
+ * @returns {object} { size, etag, lastModified, segments }
+ */
+export async function buildArchiveLayout(files) {
+  const segments = [];
+  const entries = [];
+  let offset = 0;
+  let lastModified = 0;
+
+  const pushSegment = (segment) => {
+    segment.start = offset;
+    offset += segment.length;
+    segments.push(segment);
+  };
+
+  for (const file of files) {
+    const stats = await fs.promises.stat(file.path);
+    const description = await describeFile(file.path, stats);
+    const { time, date } = dosDateTime(stats.mtime);
+    const entry = {
+      ...description,
+      path: file.path,
+      mtimeMs: stats.mtimeMs,
+      size: stats.size,
+      nameBuffer: Buffer.from(file.name, 'utf-8'),
+      dosTime: time,
+      dosDate: date,
+      offset
+    };
+    entries.push(entry);
+    lastModified = Math.max(lastModified, stats.mtimeMs);
+
+    const header = localHeader(entry);
+    pushSegment({ type: 'buffer', buffer: header, length: header.length });
+    pushSegment({ type: 'file', entry, length: entry.compressedSize });
+  }
+
+  const directoryOffset = offset;
+  const directory = Buffer.concat(entries.map(centralDirectoryHeader));
+  pushSegment({ type: 'buffer', buffer: directory, length: directory.length });
+
+  const end = endOfCentralDirectory(entries.length, directory.length, directoryOffset);
+  pushSegment({ type: 'buffer', buffer: end, length: end.length });
+
+  const etag = crypto.createHash('sha1')
+    .update(entries.map(entry => `${entry.nameBuffer}:${entry.size}:${entry.mtimeMs}:${entry.method}`).join('\n'))
+    .digest('base64url');
+
+  return { size: offset, etag: `"${etag}"`, lastModified: new Date(lastModified || Date.now()), segments };
+}
+
+/**
+ * Deflated bytes of a file from a given offset of the compressed stream
+ */
+async function* deflatedRange(filePath, skip, length) {
+  const deflater = zlib.createDeflateRaw(DEFLATE_OPTIONS);
+  const source = fs.createReadStream(filePath);
+  source.on('error', error => deflater.destroy(error)).pipe(deflater);
+
+  let position = 0;
+  let remaining = length;
+  try {
+    for await (const chunk of deflater) {
+      const from = Math.max(0, skip - position);
+      position += chunk.length;
+      if (from >= chunk.length) continue;
+
+      const piece = chunk.subarray(from, from + remaining);
+      remaining -= piece.length;
+      yield piece;
+      if (remaining <= 0) break;
+    }
+  } finally {
+    source.destroy();
+    deflater.destroy();
+  }
+}
+
+/**
+ * Produce the archive bytes in [start, end] (inclusive), chunk by chunk
+ * Throws if a file changed since the layout was built
+ * @param {object} layout - Result of buildArchiveLayout
+ * @param {number} start - First byte
+ * @param {number} end - Last byte
+ */
+export async function* streamArchive(layout, start = 0, end = layout.size - 1) {
+  for (const segment of layout.segments) {
+    const segmentEnd = segment.start + segment.length - 1;
+    if (segment.length === 0 || segmentEnd < start || segment.start > end) continue;
+
+    const from = Math.max(start, segment.start) - segment.start;
+    const to = Math.min(end, segmentEnd) - segment.start;
+
+    if (segment.type === 'buffer') {
+      yield segment.buffer.subarray(from, to + 1);
+      continue;
+    }
+
+    const { entry } = segment;
+    const stats = await fs.promises.stat(entry.path);
+    if (stats.size !== entry.size || stats.mtimeMs !== entry.mtimeMs) {
+      throw new Error(`${entry.path} changed while the archive was being sent`);
+    }
+
+    if (entry.method === METHOD_STORE) {
+      yield* fs.createReadStream(entry.path, { start: from, end: to });
+    } else {
+      yield* deflatedRange(entry.path, from, to - from + 1);
+    }
+  }
+}